@@ -0,0 +1,78 @@
+import pytest
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from objectsapiclient.client import Client
+from objectsapiclient.models import ObjectsClientConfiguration
+
+from .fake_api import FakeAPI
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("fake API")
+    group.addoption(
+        "--api-latency",
+        type=float,
+        default=0.0,
+        help="Latency of the fake API in seconds (default: 0)",
+    )
+    group.addoption(
+        "--api-objects",
+        type=int,
+        default=1000,
+        help="Number of objects served by the fake API (default: 1000)",
+    )
+    group.addoption(
+        "--api-page-size",
+        type=int,
+        default=100,
+        help="Page size of the fake Objects API (default: 100)",
+    )
+    group.addoption(
+        "--api-data-fields",
+        type=int,
+        default=10,
+        help="Number of additional fields in each object record (default: 10)",
+    )
+
+
+@pytest.fixture(scope="session")
+def fake_api(request):
+    api = FakeAPI(
+        object_count=request.config.getoption("--api-objects"),
+        page_size=request.config.getoption("--api-page-size"),
+        data_fields=request.config.getoption("--api-data-fields"),
+        latency=request.config.getoption("--api-latency"),
+    )
+    api.start()
+    yield api
+    api.stop()
+
+
+@pytest.fixture
+def config(db, fake_api):
+    """The saved client configuration, pointing to the fake API."""
+    config = ObjectsClientConfiguration.get_solo()
+    config.objects_api_service_config = Service.objects.create(
+        label="Objects API",
+        slug="objects-api",
+        api_type=APITypes.orc,
+        api_root=fake_api.objects_url,
+        auth_type=AuthTypes.no_auth,
+    )
+    config.object_type_api_service_config = Service.objects.create(
+        label="Objecttypes API",
+        slug="objecttypes-api",
+        api_type=APITypes.orc,
+        api_root=fake_api.object_types_url,
+        auth_type=AuthTypes.no_auth,
+    )
+    config.save()
+    return config
+
+
+@pytest.fixture
+def client(config):
+    client = Client(config)
+    yield client
+    client.close()
@@ -0,0 +1,183 @@
+"""
+A local stand-in for the Objects API and Objecttypes API.
+
+The server generates its responses, with a configurable number of objects, page
+size, payload size and latency, so benchmark results only depend on the client.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+OBJECT_TYPE_UUID = "3f5b1c2e-6f36-4c1b-a0a5-6c3c2f0e9b11"
+
+
+def make_object(
+    base_url: str, object_types_url: str, index: int, data_fields: int = 10
+) -> dict:
+    return {
+        "url": f"{base_url}objects/uuid-{index}",
+        "uuid": f"uuid-{index}",
+        "type": f"{object_types_url}objecttypes/{OBJECT_TYPE_UUID}",
+        "record": {
+            "index": 1,
+            "typeVersion": 1,
+            "data": {
+                "title": f"Object {index}",
+                "streetName": "Keizersgracht",
+                "houseNumber": index,
+                "openingHours": [{"dayOfWeek": day} for day in range(7)],
+                **{f"field{field}": f"value {field}" for field in range(data_fields)},
+            },
+            "geometry": {"type": "Point", "coordinates": [4.9, 52.3]},
+            "startAt": "2025-01-01",
+            "endAt": None,
+            "registrationAt": "2025-01-01",
+            "correctionFor": None,
+            "correctedBy": None,
+        },
+    }
+
+
+def make_object_type(base_url: str, index: int) -> dict:
+    uuid = f"00000000-0000-0000-0000-{index:012d}"
+    return {
+        "url": f"{base_url}objecttypes/{uuid}",
+        "uuid": uuid,
+        "name": f"Object type {index}",
+        "namePlural": f"Object types {index}",
+        "description": "",
+        "dataClassification": "open",
+        "maintainerOrganization": "",
+        "maintainerDepartment": "",
+        "contactPerson": "",
+        "contactEmail": "",
+        "source": "",
+        "updateFrequency": "unknown",
+        "providerOrganization": "",
+        "documentationUrl": "",
+        "labels": {},
+        "createdAt": "2025-01-01",
+        "modifiedAt": "2025-01-01",
+        "allowGeometry": True,
+        "versions": [f"{base_url}objecttypes/{uuid}/versions/1"],
+    }
+
+
+@dataclass
+class FakeAPI:
+    object_count: int = 1000
+    page_size: int = 100
+    data_fields: int = 10
+    object_type_count: int = 50
+    latency: float = 0.0
+    """Seconds to wait before every response."""
+
+    def start(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    @property
+    def root_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def objects_url(self) -> str:
+        return f"{self.root_url}objects/api/v2/"
+
+    @property
+    def object_types_url(self) -> str:
+        return f"{self.root_url}objecttypes/api/v2/"
+
+    @cached_property
+    def objects(self) -> list[dict]:
+        return [
+            make_object(
+                self.objects_url, self.object_types_url, index, self.data_fields
+            )
+            for index in range(self.object_count)
+        ]
+
+    @cached_property
+    def object_types(self) -> bytes:
+        results = [
+            make_object_type(self.object_types_url, index)
+            for index in range(self.object_type_count)
+        ]
+        return json.dumps(
+            {"count": len(results), "next": None, "results": results}
+        ).encode()
+
+    def objects_page(self, query: dict[str, list[str]]) -> bytes:
+        page = int(query.get("page", ["1"])[0])
+        page_size = int(query.get("pageSize", [self.page_size])[0])
+        start = (page - 1) * page_size
+
+        next_url = None
+        if start + page_size < self.object_count:
+            params = {key: values[0] for key, values in query.items()}
+            query_string = urlencode({**params, "page": page + 1})
+            next_url = f"{self.objects_url}objects?{query_string}"
+
+        return json.dumps(
+            {
+                "count": self.object_count,
+                "next": next_url,
+                "results": self.objects[start : start + page_size],
+            }
+        ).encode()
+
+    def respond(self, path: str, query: dict[str, list[str]]) -> bytes | None:
+        path = path.rstrip("/")
+        if path == "/objecttypes/api/v2/objecttypes":
+            return self.object_types
+
+        path = path.removeprefix("/objects/api/v2/")
+        if path == "objects":
+            return self.objects_page(query)
+        if path.startswith("objects/uuid-"):
+            index = int(path.removeprefix("objects/uuid-"))
+            if index < self.object_count:
+                return json.dumps(self.objects[index]).encode()
+        return None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                body = api.respond(url.path, parse_qs(url.query))
+                self._send(body)
+
+            def do_HEAD(self):
+                self._send(b"")
+
+            def _send(self, body: bytes | None):
+                if api.latency:
+                    time.sleep(api.latency)
+
+                self.send_response(200 if body is not None else 404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body or b"")))
+                self.end_headers()
+                if body and self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,64 @@
+from django.core.cache import cache
+
+import pytest
+
+from objectsapiclient.cache import tiered_cache
+from objectsapiclient.client import Client
+from objectsapiclient.models import ObjectTypeField
+
+
+def test_get_objects(benchmark, client, fake_api):
+    objects = benchmark(client.get_objects)
+
+    assert len(objects) == fake_api.object_count
+
+
+@pytest.mark.parametrize("max_workers", [4])
+def test_get_objects_concurrently(benchmark, client, fake_api, max_workers):
+    objects = benchmark(client.get_objects, max_workers=max_workers)
+
+    assert len(objects) == fake_api.object_count
+
+
+def test_get_objects_lazy(benchmark, client, fake_api):
+    objects = benchmark(client.get_objects, lazy=True)
+
+    assert len(objects) == fake_api.object_count
+
+
+def test_get_objects_by_uuid(benchmark, client, fake_api):
+    uuids = [f"uuid-{index}" for index in range(min(fake_api.object_count, 100))]
+
+    objects = benchmark(client.get_objects_by_uuid, uuids)
+
+    assert len(objects) == len(uuids)
+
+
+def test_get_object_types(benchmark, client, fake_api):
+    object_types = benchmark(client.get_object_types)
+
+    assert len(object_types) == fake_api.object_type_count
+
+
+def test_get_choices(benchmark, config, fake_api):
+    field = ObjectTypeField()
+    field.get_choices()
+
+    choices = benchmark(field.get_choices, include_blank=False)
+
+    assert len(choices) == fake_api.object_type_count
+
+
+def test_get_choices_uncached(benchmark, config, fake_api):
+    field = ObjectTypeField()
+
+    def clear():
+        cache.clear()
+        tiered_cache.invalidate()
+        Client.invalidate_shared()
+
+    choices = benchmark.pedantic(
+        field.get_choices, kwargs={"include_blank": False}, setup=clear, rounds=20
+    )
+
+    assert len(choices) == fake_api.object_type_count
@@ -0,0 +1,58 @@
+"""
+Deserialization throughput, compared with zgw_consumers' generic ``factory``.
+"""
+
+import json
+
+import pytest
+from zgw_consumers.api_models.base import factory
+
+from objectsapiclient.dataclasses import LazyObject, Object
+from objectsapiclient.decoder import decode_list, loads
+
+from .fake_api import make_object
+
+OBJECT_COUNT = 10_000
+
+
+@pytest.fixture(scope="module")
+def payload() -> bytes:
+    results = [
+        make_object(
+            "https://objects.example.com/api/v2/",
+            "https://objecttypes.example.com/api/v2/",
+            index,
+        )
+        for index in range(OBJECT_COUNT)
+    ]
+    return json.dumps(
+        {"count": OBJECT_COUNT, "next": None, "results": results}
+    ).encode()
+
+
+@pytest.mark.benchmark(group="deserialization")
+def test_factory(benchmark, payload):
+    objects = benchmark(lambda: factory(Object, json.loads(payload)["results"]))
+
+    assert len(objects) == OBJECT_COUNT
+
+
+@pytest.mark.benchmark(group="deserialization")
+def test_decoder(benchmark, payload):
+    objects = benchmark(lambda: decode_list(Object, loads(payload)["results"]))
+
+    assert objects == factory(Object, json.loads(payload)["results"])
+
+
+@pytest.mark.benchmark(group="deserialization")
+def test_decoder_lazy(benchmark, payload):
+    objects = benchmark(lambda: decode_list(LazyObject, loads(payload)["results"]))
+
+    assert len(objects) == OBJECT_COUNT
+
+
+@pytest.mark.benchmark(group="deserialization")
+def test_loads(benchmark, payload):
+    data = benchmark(loads, payload)
+
+    assert len(data["results"]) == OBJECT_COUNT
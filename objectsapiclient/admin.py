@@ -1,10 +1,12 @@
 from django.contrib import admin
-from django.utils.html import format_html
+from django.utils.html import format_html_join
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext_lazy as _
 
 from solo.admin import SingletonModelAdmin
 
-from .client import Client
-from .models import ObjectsClientConfiguration
+from .health import get_cached_health
+from .models import NamedObjectsClientConfiguration, ObjectsClientConfiguration
 
 
 @admin.register(ObjectsClientConfiguration)
@@ -20,6 +22,16 @@ class ObjectsServiceConfigurationAdmin(SingletonModelAdmin):
                 )
             },
         ),
+        (
+            _("Timeouts"),
+            {
+                "fields": (
+                    "objects_timeout",
+                    "object_types_timeout",
+                    "write_timeout",
+                )
+            },
+        ),
     )
     readonly_fields = ("status",)
 
@@ -27,7 +39,61 @@ class ObjectsServiceConfigurationAdmin(SingletonModelAdmin):
     def status(self, obj):
         from django.contrib.admin.templatetags.admin_list import _boolean_icon
 
-        client = Client()
+        if not obj.objects_api_service_config or not obj.object_type_api_service_config:
+            return _("Not configured")
 
-        healthy, message = client.is_healthy()
-        return format_html("{} {}", _boolean_icon(healthy), message)
+        statuses = get_cached_health()
+        if statuses is None:
+            return _("Checking the status, reload the page to see the result.")
+
+        return format_html_join(
+            mark_safe("<br>"),
+            "{} {}: {}",
+            (
+                (
+                    _boolean_icon(status.healthy),
+                    status.api,
+                    (
+                        _("{latency:.0f} ms").format(latency=status.latency * 1000)
+                        if status.healthy
+                        else status.message
+                    ),
+                )
+                for status in statuses
+            ),
+        )
+
+
+@admin.register(NamedObjectsClientConfiguration)
+class NamedObjectsClientConfigurationAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "objects_api_service_config",
+        "object_type_api_service_config",
+    )
+    list_select_related = (
+        "objects_api_service_config",
+        "object_type_api_service_config",
+    )
+    fieldsets = (
+        (
+            None,
+            {
+                "fields": (
+                    "name",
+                    "objects_api_service_config",
+                    "object_type_api_service_config",
+                )
+            },
+        ),
+        (
+            _("Timeouts"),
+            {
+                "fields": (
+                    "objects_timeout",
+                    "object_types_timeout",
+                    "write_timeout",
+                )
+            },
+        ),
+    )
@@ -1,5 +1,27 @@
+import os
+
 from django.apps import AppConfig
 
 
 class ObjectsAPIClientConfig(AppConfig):
     name = "objectsapiclient"
+
+    def ready(self):
+        from . import receivers  # noqa: F401
+        from .client import Client
+        from .settings import get_setting
+
+        # Forked worker processes must not share the connections of the shared
+        # clients of a (preloading) parent process
+        os.register_at_fork(after_in_child=Client._reset_shared)
+
+        if get_setting("OBJECTSAPICLIENT_WARMUP_ON_STARTUP"):
+            from django.core.signals import request_started
+
+            from .warmup import WARMUP_DISPATCH_UID, warm_up_on_first_request
+
+            # Warm up in the worker processes handling requests, after they are
+            # forked, and not in management commands
+            request_started.connect(
+                warm_up_on_first_request, dispatch_uid=WARMUP_DISPATCH_UID
+            )
@@ -0,0 +1,173 @@
+import logging
+import ssl
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+from asgiref.sync import sync_to_async
+from zgw_consumers.client import ServiceConfigAdapter
+from zgw_consumers.models import Service
+
+from .client import get_configuration
+from .dataclasses import LazyObject, Object, ObjectType
+from .decoder import decode_list, loads
+from .instrumentation import instrument
+from .models import ClientConfiguration
+from .query import build_objects_params
+
+logger = logging.getLogger(__name__)
+
+
+def build_async_client(service: Service, **kwargs) -> httpx.AsyncClient:
+    """
+    Build an :class:`httpx.AsyncClient` for a given
+    :class:`zgw_consumers.models.Service`, with the same credentials, certificates
+    and timeout as the synchronous zgw_consumers client.
+    """
+    session_kwargs = ServiceConfigAdapter(service).get_client_session_kwargs()
+
+    verify: ssl.SSLContext | bool = True
+    cert = session_kwargs.get("cert")
+    if "verify" in session_kwargs or cert:
+        verify = ssl.create_default_context(cafile=session_kwargs.get("verify"))
+        if cert:
+            certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+            verify.load_cert_chain(certfile, keyfile)
+
+    # The zgw_consumers auth classes only set request headers, which works for
+    # httpx requests as well.
+    kwargs.setdefault("auth", session_kwargs.get("auth"))
+    kwargs.setdefault("timeout", session_kwargs.get("timeout"))
+    kwargs.setdefault("verify", verify)
+
+    return httpx.AsyncClient(base_url=service.api_root, **kwargs)
+
+
+class AsyncClient:
+    """
+    An asyncio variant of :class:`objectsapiclient.client.Client`.
+
+    Each API uses a single pooled connection, so lookups can be run concurrently
+    with :func:`asyncio.gather`. Building the client requires database access; use
+    :meth:`create` from within a running event loop. Use the client as an async
+    context manager, or call :meth:`aclose` when done.
+
+    Any additional keyword arguments are passed to :class:`httpx.AsyncClient`.
+    """
+
+    def __init__(self, config: ClientConfiguration | str | None = None, **kwargs):
+        self.config = get_configuration(config)
+
+        self.objects = build_async_client(
+            self.config.objects_api_service_config, **kwargs
+        )
+        self.object_types = build_async_client(
+            self.config.object_type_api_service_config, **kwargs
+        )
+
+    @classmethod
+    async def create(
+        cls, config: ClientConfiguration | str | None = None, **kwargs
+    ) -> "AsyncClient":
+        return await sync_to_async(cls)(config, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.objects.aclose()
+        await self.object_types.aclose()
+
+    async def is_healthy(self) -> tuple[bool, str]:
+        try:
+            with instrument("objects", "head") as event:
+                response = await self.objects.head("objects")
+                event.set_response(response)
+                response.raise_for_status()
+            return True, ""
+        except httpx.HTTPStatusError as exc:
+            logger.exception("Server did not return a valid response (%s)", exc)
+            return False, str(exc)
+        except Exception as exc:
+            logger.exception("Error making head request to objects api (%s)", exc)
+            return False, str(exc)
+
+    def object_type_uuid_to_url(self, uuid):
+        return "{}objecttypes/{}/".format(self.object_types.base_url, uuid)
+
+    async def get_objects(self, object_type_uuid=None, lazy=False, **filters) -> list:
+        """
+        Retrieve all available Objects from the Objects API.
+
+        :returns: Returns a list of Object dataclasses
+        """
+        return [
+            obj
+            async for obj in self.iter_objects(
+                object_type_uuid=object_type_uuid, lazy=lazy, **filters
+            )
+        ]
+
+    async def iter_objects(
+        self,
+        object_type_uuid=None,
+        page_size: int | None = None,
+        lazy=False,
+        **filters,
+    ) -> AsyncIterator[Object]:
+        """
+        Lazily iterate over all Objects from the Objects API, following the
+        ``next`` links of the paginated response.
+
+        :param lazy: Yield :class:`LazyObject` instances, see
+            :meth:`objectsapiclient.client.Client.iter_objects`.
+        :param filters: Filters applied by the Objects API, see
+            :func:`objectsapiclient.query.build_objects_params`.
+        :returns: Yields Object dataclasses
+        """
+        model = LazyObject if lazy else Object
+        params: dict[str, Any] | None = build_objects_params(
+            type_url=(
+                self.object_type_uuid_to_url(object_type_uuid)
+                if object_type_uuid
+                else None
+            ),
+            page_size=page_size,
+            **filters,
+        )
+
+        url = "objects"
+        page = 0
+        while url:
+            page += 1
+            with instrument("objects", "get", page=page) as event:
+                response = await self.objects.get(url, params=params)
+                event.set_response(response)
+                response.raise_for_status()
+                with event.deserializing():
+                    data = loads(response.content)
+
+            for obj in decode_list(model, data.get("results") or []):
+                yield obj
+
+            # The next link already contains all query parameters
+            url = data.get("next")
+            params = None
+
+    async def get_object_types(self) -> list:
+        """
+        Retrieve all available Object Types
+
+        :returns: Returns a list of ObjectType dataclasses
+        """
+        with instrument("objecttypes", "get") as event:
+            response = await self.object_types.get("objecttypes")
+            event.set_response(response)
+            response.raise_for_status()
+            with event.deserializing():
+                results = loads(response.content).get("results")
+
+        return decode_list(ObjectType, results) if results else []
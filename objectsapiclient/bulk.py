@@ -0,0 +1,132 @@
+import logging
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+    HTTPError,
+    Timeout,
+)
+from zgw_consumers.concurrent import parallel
+
+from .circuit_breaker import CircuitOpenError
+from .dataclasses import Object
+from .memoize import in_context
+from .retry import (
+    RETRY_NOT_PROCESSED_STATUS_CODES,
+    RETRY_STATUS_CODES,
+    get_backoff,
+    get_retry_after,
+)
+from .settings import get_setting
+
+if TYPE_CHECKING:
+    from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SubmitResult:
+    index: int
+    """The position of the item in the submitted items."""
+    object: Object | None = None
+    error: Exception | None = None
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def submit_objects(
+    client: "Client",
+    object_type_uuid,
+    items: Iterable[dict | tuple[str, dict]],
+    max_workers: int = 8,
+    max_retries: int = 5,
+) -> Iterator[SubmitResult]:
+    """
+    Create or update Objects concurrently, see :meth:`Client.submit_objects`.
+    """
+    numbered_items = enumerate(items)
+    pending: deque = deque()
+    submit = in_context(_submit)
+
+    with parallel(max_workers=max_workers) as executor:
+
+        def submit_next() -> bool:
+            if (numbered_item := next(numbered_items, None)) is None:
+                return False
+            index, item = numbered_item
+            pending.append(
+                executor.submit(
+                    submit, client, object_type_uuid, index, item, max_retries
+                )
+            )
+            return True
+
+        # Keep the number of items in memory bounded, while the workers stay busy
+        while len(pending) < max_workers * 2 and submit_next():
+            pass
+
+        while pending:
+            result = pending.popleft().result()
+            submit_next()
+            yield result
+
+
+def _submit(
+    client: "Client",
+    object_type_uuid,
+    index: int,
+    item: dict | tuple[str, dict],
+    max_retries: int,
+) -> SubmitResult:
+    result = SubmitResult(index=index)
+    # Updates are idempotent, but a create is only retried if the API did not
+    # receive or process it, so an Object is not created twice
+    update = isinstance(item, tuple)
+    if update:
+        retry_status_codes = RETRY_STATUS_CODES
+        retry_errors = (RequestsConnectionError, Timeout)
+    else:
+        retry_status_codes = RETRY_NOT_PROCESSED_STATUS_CODES
+        retry_errors = (ConnectTimeout, CircuitOpenError)
+    max_delay = get_setting("OBJECTSAPICLIENT_MAX_RETRY_DELAY")
+
+    while True:
+        result.attempts += 1
+        try:
+            if update:
+                uuid, record = item
+                result.object = client.update_object(uuid, object_type_uuid, record)
+            else:
+                result.object = client.create_object(object_type_uuid, item)
+            return result
+        except HTTPError as exc:
+            result.error = exc
+            response = exc.response
+            if response is None or response.status_code not in retry_status_codes:
+                return result
+            delay = get_retry_after(response)
+            if delay is not None and delay > max_delay:
+                return result
+        except retry_errors as exc:
+            result.error = exc
+            delay = None
+        except Exception as exc:
+            result.error = exc
+            return result
+
+        if result.attempts > max_retries:
+            return result
+        if delay is None:
+            delay = get_backoff(result.attempts - 1, cap=max_delay)
+        logger.info("Retrying item %d in %.1f seconds (%s)", index, delay, result.error)
+        time.sleep(delay)
+        result.error = None
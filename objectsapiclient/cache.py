@@ -0,0 +1,185 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.core.cache import cache
+
+from zgw_consumers.concurrent import wrap_fn
+
+from .settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TieredCache:
+    """
+    The Django cache with a bounded, in-process LRU cache in front of it.
+
+    Values are kept in the memory of the process for
+    ``OBJECTSAPICLIENT_LOCAL_CACHE_TIMEOUT`` seconds, so repeated lookups within
+    a request (or a few requests) do not go to a shared cache like Redis. The keys
+    in the Django cache are stamped with a version stored in the Django cache:
+    :meth:`invalidate` bumps it, which discards the values of every process once
+    their local copies have expired.
+    """
+
+    def __init__(self, name: str):
+        self.version_key = f"{name}_version"
+        self._local: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_version(self) -> int:
+        version = self._get_local(self.version_key)
+        if version is _MISSING:
+            version = cache.get(self.version_key, 1)
+            self._set_local(self.version_key, version)
+        return version
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._get_local(key)
+        if value is _MISSING:
+            value = cache.get(key, _MISSING, version=self.get_version())
+            if value is _MISSING:
+                return default
+            self._set_local(key, value)
+        return value
+
+    def set(self, key: str, value: Any, timeout: float | None) -> None:
+        cache.set(key, value, timeout=timeout, version=self.get_version())
+        self._set_local(key, value, timeout)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        cache.delete_many(keys, version=self.get_version())
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+    def invalidate(self) -> None:
+        """
+        Discard all values, in this process and (once their local copies expire)
+        in all other processes.
+        """
+        self.clear_local()
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, 2, timeout=None)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, key: str) -> Any:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._local[key]
+                return _MISSING
+            self._local.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: Any, timeout: float | None = None) -> None:
+        local_timeout = get_setting("OBJECTSAPICLIENT_LOCAL_CACHE_TIMEOUT")
+        if timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        if local_timeout <= 0:
+            return
+
+        max_size = get_setting("OBJECTSAPICLIENT_LOCAL_CACHE_MAX_SIZE")
+        with self._lock:
+            self._local[key] = (time.monotonic() + local_timeout, value)
+            self._local.move_to_end(key)
+            while len(self._local) > max_size:
+                self._local.popitem(last=False)
+
+
+tiered_cache = TieredCache("objectsapiclient_cache")
+
+
+def _run_in_background(fn: Callable[[], None]) -> None:
+    # wrap_fn closes the database connections opened by the thread
+    threading.Thread(target=wrap_fn(fn), daemon=True).start()
+
+
+def get_stale_while_revalidate(
+    key: str,
+    fetch: Callable[[], Any],
+    fresh_timeout: int,
+    stale_timeout: int,
+    lock_timeout: int,
+    default: Any = None,
+    blocking=True,
+) -> Any:
+    """
+    Return the cached value for ``key``, refreshing it in the background once it
+    is older than ``fresh_timeout`` seconds.
+
+    Only one refresh runs at a time across all processes sharing the cache; a
+    failed refresh keeps the stale value, and is retried after ``lock_timeout``
+    seconds. Without any cached value, ``fetch`` is called directly and
+    ``default`` is returned if it fails. If not ``blocking``, ``default`` is
+    returned immediately instead while the value is fetched in the background.
+    """
+    value = tiered_cache.get(key)
+
+    if value is None and blocking:
+        try:
+            value = fetch()
+        except Exception as e:
+            logger.exception(e)
+            return default
+        set_stale_while_revalidate(key, value, fresh_timeout, stale_timeout)
+        return value
+
+    lock_key = f"{key}_lock"
+    if tiered_cache.get(f"{key}_fresh") is None and cache.add(
+        lock_key, True, timeout=lock_timeout
+    ):
+
+        def refresh():
+            try:
+                new_value = fetch()
+            except Exception:
+                logger.exception("Failed to refresh %s, keeping stale value", key)
+                return
+            set_stale_while_revalidate(key, new_value, fresh_timeout, stale_timeout)
+            cache.delete(lock_key)
+
+        _run_in_background(refresh)
+
+    return default if value is None else value
+
+
+def delete_stale_while_revalidate(key: str) -> None:
+    """
+    Remove a value cached by :func:`get_stale_while_revalidate`.
+    """
+    tiered_cache.delete_many([key, f"{key}_fresh"])
+    cache.delete(f"{key}_lock")
+
+
+def expire_stale_while_revalidate(key: str) -> None:
+    """
+    Mark a value cached by :func:`get_stale_while_revalidate` as stale, so it is
+    refreshed in the background on the next call.
+    """
+    tiered_cache.delete_many([f"{key}_fresh"])
+
+
+def set_stale_while_revalidate(
+    key: str, value: Any, fresh_timeout: int, stale_timeout: int
+) -> None:
+    """
+    Store a (fresh) value for :func:`get_stale_while_revalidate`.
+    """
+    tiered_cache.set(key, value, timeout=max(fresh_timeout, stale_timeout))
+    tiered_cache.set(f"{key}_fresh", True, timeout=fresh_timeout)
@@ -0,0 +1,84 @@
+import hashlib
+import logging
+
+from django.core.cache import cache
+
+from requests.exceptions import ConnectionError
+
+from .settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(ConnectionError):
+    """
+    The API failed repeatedly, so requests fail fast without being sent.
+    """
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker for an API, with its state shared across processes through
+    the Django cache.
+
+    After ``OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD`` failures (connection
+    errors, timeouts and server errors) within
+    ``OBJECTSAPICLIENT_CIRCUIT_BREAKER_WINDOW`` seconds, the circuit opens and
+    requests fail fast for ``OBJECTSAPICLIENT_CIRCUIT_BREAKER_RESET_TIMEOUT``
+    seconds. Afterwards, requests are sent again, and a single failure opens the
+    circuit again until a request succeeds.
+    """
+
+    def __init__(self, api_root: str):
+        self.api_root = api_root
+        key = hashlib.sha256(api_root.encode()).hexdigest()
+        self.open_key = f"objectsapiclient_circuit_open_{key}"
+        self.failures_key = f"objectsapiclient_circuit_failures_{key}"
+
+    @property
+    def threshold(self) -> int:
+        return get_setting("OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD")
+
+    def check(self) -> bool:
+        """
+        Raise :class:`CircuitOpenError` if the circuit is open, otherwise return
+        whether failures were recorded recently.
+        """
+        if not self.threshold:
+            return False
+
+        state = cache.get_many([self.open_key, self.failures_key])
+        if state.get(self.open_key):
+            raise CircuitOpenError(
+                f"{self.api_root} is unavailable, not sending requests for now"
+            )
+        return bool(state.get(self.failures_key))
+
+    def record_success(self) -> None:
+        cache.delete(self.failures_key)
+
+    def record_failure(self) -> None:
+        if not (threshold := self.threshold):
+            return
+
+        window = get_setting("OBJECTSAPICLIENT_CIRCUIT_BREAKER_WINDOW")
+        cache.add(self.failures_key, 0, timeout=window)
+        try:
+            failures = cache.incr(self.failures_key)
+        except ValueError:
+            # expired in the meantime
+            cache.set(self.failures_key, failures := 1, timeout=window)
+
+        if failures >= threshold:
+            reset_timeout = get_setting(
+                "OBJECTSAPICLIENT_CIRCUIT_BREAKER_RESET_TIMEOUT"
+            )
+            logger.warning(
+                "%s failed %d times, failing fast for %d seconds",
+                self.api_root,
+                failures,
+                reset_timeout,
+            )
+            cache.set(self.open_key, True, timeout=reset_timeout)
+            # a single failure after the reset timeout opens the circuit again
+            cache.set(self.failures_key, threshold - 1, timeout=reset_timeout + window)
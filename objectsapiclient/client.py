@@ -1,45 +1,239 @@
+import datetime
+import hashlib
 import logging
-from typing import cast
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar, cast
 from urllib.parse import urljoin
 
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
 
-from requests.exceptions import HTTPError
-from zgw_consumers.api_models.base import factory
+from ape_pie import APIClient
+from requests import Request, Response
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    HTTPError,
+    Timeout,
+)
 from zgw_consumers.client import build_client as build_zgw_client
+from zgw_consumers.concurrent import parallel
+from zgw_consumers.models import Service
 
-from .dataclasses import Object, ObjectType
-from .models import ObjectsClientConfiguration
+from .circuit_breaker import CircuitBreaker
+from .dataclasses import LazyObject, Object, ObjectType
+from .decoder import decode, decode_list, loads
+from .instrumentation import instrument
+from .memoize import get_memo, in_context
+from .models import (
+    ClientConfiguration,
+    NamedObjectsClientConfiguration,
+    ObjectsClientConfiguration,
+)
+from .query import build_objects_params
+from .retry import RETRY_STATUS_CODES, get_backoff, get_retry_after
+from .settings import get_setting
+from .utils import Coalescer
+
+if TYPE_CHECKING:
+    from .bulk import SubmitResult
+    from .schemas import SchemaRegistry
 
 logger = logging.getLogger(__name__)
 
+SHARED_CLIENT_VERSION_CACHE_KEY = "objectsapiclient_shared_client_version"
 
-class Client:
-    def __init__(self, config: ObjectsClientConfiguration | None = None):
-        self.config = cast(
-            ObjectsClientConfiguration, config or ObjectsClientConfiguration.get_solo()
-        )
+# Requests retried automatically; writes are retried by submit_objects only
+RETRY_METHODS = ("get", "head")
 
-        if (
-            not self.config.objects_api_service_config
-            or not self.config.object_type_api_service_config
-        ):
+
+@contextmanager
+def keep_alive(client: APIClient):
+    """
+    Keep the connection pool of ``client`` open for the duration of the block.
+
+    Outside of a context block, the API client closes its session after every
+    request. Nested blocks are a no-op so that an already open session is not
+    closed prematurely.
+    """
+    if client._in_context_manager:
+        yield client
+        return
+
+    with client:
+        yield client
+
+
+# The fields of a service which determine what the API returns to it
+SERVICE_IDENTITY_FIELDS = (
+    "uuid",
+    "auth_type",
+    "client_id",
+    "secret",
+    "header_key",
+    "header_value",
+    "user_id",
+    "client_certificate_id",
+)
+
+
+def get_response_cache_key(absolute_url: str, service: Service) -> str:
+    """
+    Return the key of the cached (conditional) response of a URL, retrieved with
+    the credentials of ``service``: with other credentials, the API can return
+    other objects or fields.
+    """
+    identity = [str(getattr(service, field)) for field in SERVICE_IDENTITY_FIELDS]
+    return "objectsapiclient_response_{}".format(
+        hashlib.sha256("\n".join([*identity, absolute_url]).encode()).hexdigest()
+    )
+
+
+def get_configuration(
+    config: ClientConfiguration | str | None = None,
+) -> ClientConfiguration:
+    """
+    Return the given configuration, the named configuration if a name is given,
+    or else the singleton configuration, ensuring both the Objects API and the
+    Objecttypes API services are configured.
+    """
+    if isinstance(config, str):
+        try:
+            config = NamedObjectsClientConfiguration.objects.select_related(
+                "objects_api_service_config", "object_type_api_service_config"
+            ).get(name=config)
+        except NamedObjectsClientConfiguration.DoesNotExist as exc:
             raise ImproperlyConfigured(
-                "ObjectsService cannot be instantiated without configurations for "
-                "Objects API and Objecttypes API"
-            )
+                f"There is no Objects API client configuration named {config!r}"
+            ) from exc
+
+    config = cast(ClientConfiguration, config or ObjectsClientConfiguration.get_solo())
+
+    if (
+        not config.objects_api_service_config
+        or not config.object_type_api_service_config
+    ):
+        raise ImproperlyConfigured(
+            "ObjectsService cannot be instantiated without configurations for "
+            "Objects API and Objecttypes API"
+        )
+
+    return config
+
+
+class Client:
+    _shared: ClassVar[dict[str | None, "Client"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    _shared_version: int | None = None
+
+    def __init__(self, config: ClientConfiguration | str | None = None):
+        """
+        :param config: The configuration, or the name of a
+            :class:`objectsapiclient.models.NamedObjectsClientConfiguration`.
+            Defaults to the singleton configuration.
+        """
+        self.config = get_configuration(config)
 
         self.objects = build_zgw_client(service=self.config.objects_api_service_config)
         self.object_types = build_zgw_client(
             service=self.config.object_type_api_service_config
         )
+        self._in_flight = Coalescer()
+        self._circuit_breakers = {
+            client.base_url: CircuitBreaker(client.base_url)
+            for client in (self.objects, self.object_types)
+        }
+
+    @classmethod
+    def shared(cls, configuration: str | None = None) -> "Client":
+        """
+        Return the process-wide client for the singleton configuration, or for the
+        named configuration.
+
+        The sessions of a shared client are kept open, so connections (and TLS
+        sessions) are pooled across calls and threads, per configuration. The
+        clients are rebuilt when a configuration or its services change, in any
+        process, see :meth:`invalidate_shared`.
+        """
+        version = cache.get(SHARED_CLIENT_VERSION_CACHE_KEY)
+
+        client = cls._shared.get(configuration)
+        if client is not None and client._shared_version == version:
+            return client
+
+        # Retrieving the singleton configuration can create it, which invalidates
+        # the shared clients, so it is done before taking the lock
+        config = get_configuration(configuration)
+        version = cache.get(SHARED_CLIENT_VERSION_CACHE_KEY)
+
+        with cls._shared_lock:
+            client = cls._shared.get(configuration)
+            if client is None or client._shared_version != version:
+                stale, client = client, cls(config)
+                client._shared_version = version
+                client.objects.__enter__()
+                client.object_types.__enter__()
+                cls._shared[configuration] = client
+
+                if stale is not None:
+                    stale.close()
+
+        return client
+
+    @classmethod
+    def invalidate_shared(cls) -> None:
+        """
+        Discard the shared clients in this process and signal other processes to
+        rebuild theirs.
+        """
+        with cls._shared_lock:
+            clients, cls._shared = cls._shared, {}
+
+        for client in clients.values():
+            client.close()
+
+        try:
+            cache.incr(SHARED_CLIENT_VERSION_CACHE_KEY)
+        except ValueError:
+            cache.set(SHARED_CLIENT_VERSION_CACHE_KEY, 1, timeout=None)
+
+    @classmethod
+    def _reset_shared(cls) -> None:
+        # In a forked process, the shared clients are discarded without closing
+        # them, as their connections belong to the parent process
+        cls._shared = {}
+        cls._shared_lock = threading.Lock()
+
+    def open_connections(self) -> None:
+        """
+        Open the pooled connections to both APIs, with a ``HEAD`` request.
+        """
+        for client, path in (
+            (self.objects, "objects"),
+            (self.object_types, "objecttypes"),
+        ):
+            self._request(client, "head", urljoin(client.base_url, path))
+
+    def close(self) -> None:
+        """
+        Close the connection pools of both API clients.
+        """
+        self.objects.__exit__(None, None, None)
+        self.object_types.__exit__(None, None, None)
 
     def is_healthy(self) -> tuple[bool, str]:
         try:
-            self.objects_api_client.request(
-                "head",
-                urljoin(base=self.objects_api_service_config.api_root, url="objects"),
-            )
+            with instrument("objects", "head") as event:
+                response = self.objects.request(
+                    "head", urljoin(base=self.objects.base_url, url="objects")
+                )
+                event.set_response(response)
+                response.raise_for_status()
             return True, ""
         except HTTPError as exc:
             logger.exception("Server did not return a valid response (%s)", exc)
@@ -51,29 +245,614 @@ class Client:
     def object_type_uuid_to_url(self, uuid):
         return "{}objecttypes/{}/".format(self.object_types.base_url, uuid)
 
-    def get_objects(self, object_type_uuid=None) -> list:
+    def get_objects(
+        self,
+        object_type_uuid=None,
+        max_workers: int | None = None,
+        lazy=False,
+        **filters,
+    ) -> list:
         """
         Retrieve all available Objects from the Objects API.
         Generally you'd want to filter the results to a single ObjectType UUID.
 
+        All result pages are fetched; use :meth:`iter_objects` to stream large
+        result sets instead of loading them into memory at once. Within
+        :func:`objectsapiclient.memoize.memoize_requests`, the results of the same
+        filters are only retrieved once.
+
         :returns: Returns a list of Object dataclasses
         """
-        if object_type_uuid:
-            ot_url = self.object_type_uuid_to_url(object_type_uuid)
-            response = self.objects_api_client.request(
-                "get",
-                urljoin(base=self.objects_api_client.base_url, url="objects"),
-                params={"type": ot_url},
+        if (memo := get_memo()) is None:
+            return list(
+                self.iter_objects(
+                    object_type_uuid=object_type_uuid,
+                    max_workers=max_workers,
+                    lazy=lazy,
+                    **filters,
+                )
+            )
+
+        def fetch() -> list[dict]:
+            pages = self.iter_object_pages(
+                object_type_uuid=object_type_uuid, max_workers=max_workers, **filters
+            )
+            return [result for results in pages for result in results]
+
+        # The results of all pages are memoized, as the pages themselves are not
+        absolute_url = self._get_absolute_url(
+            self.objects,
+            urljoin(base=self.objects.base_url, url="objects"),
+            self._get_objects_params(object_type_uuid, **filters),
+        )
+        key = get_response_cache_key(
+            absolute_url, self.config.objects_api_service_config
+        )
+        results = memo.get(f"{key}_results", fetch)
+        return decode_list(LazyObject if lazy else Object, results)
+
+    def iter_objects(
+        self,
+        object_type_uuid=None,
+        page_size: int | None = None,
+        max_workers: int | None = None,
+        lazy=False,
+        **filters,
+    ) -> Iterator[Object]:
+        """
+        Lazily iterate over all Objects from the Objects API, following the
+        ``next`` links of the paginated response.
+
+        Only a single page of results is held in memory at any time, unless
+        ``max_workers`` is provided: upcoming pages are then fetched concurrently
+        (at most ``max_workers`` pages ahead) while the current page is consumed.
+        Objects are always yielded in the order of the API.
+
+        :param object_type_uuid: Only yield Objects of this ObjectType UUID.
+        :param page_size: The number of Objects to request per page. The server
+            default is used if not provided.
+        :param max_workers: The number of pages to prefetch concurrently.
+        :param lazy: Yield :class:`LazyObject` instances, which only convert their
+            ``record`` when it is accessed.
+        :param filters: Filters applied by the Objects API, see
+            :func:`objectsapiclient.query.build_objects_params`.
+        :returns: Yields Object dataclasses
+        """
+        model = LazyObject if lazy else Object
+        for results in self.iter_object_pages(
+            object_type_uuid=object_type_uuid,
+            page_size=page_size,
+            max_workers=max_workers,
+            **filters,
+        ):
+            yield from decode_list(model, results)
+
+    def iter_object_pages(
+        self,
+        object_type_uuid=None,
+        page_size: int | None = None,
+        max_workers: int | None = None,
+        start_page: int = 1,
+        **filters,
+    ) -> Iterator[list[dict]]:
+        """
+        Lazily iterate over the raw JSON results of each page of Objects, for
+        example to store them without converting them to dataclasses.
+
+        Takes the arguments of :meth:`iter_objects`.
+
+        :param start_page: The number of the first page to retrieve, to continue
+            an interrupted iteration. The following pages are not prefetched.
+        :returns: Yields the list of results of each page, which can be empty
+        """
+        params = self._get_objects_params(object_type_uuid, page_size, **filters)
+        if start_page > 1:
+            params["page"] = start_page
+            max_workers = None
+
+        url = urljoin(base=self.objects.base_url, url="objects")
+        with keep_alive(self.objects):
+            for data in self._iter_pages(
+                url, params, max_workers=max_workers, start_page=start_page
+            ):
+                yield data.get("results") or []
+
+    def _get_objects_params(
+        self, object_type_uuid=None, page_size: int | None = None, **filters
+    ) -> dict:
+        return build_objects_params(
+            type_url=(
+                self.object_type_uuid_to_url(object_type_uuid)
+                if object_type_uuid
+                else None
+            ),
+            page_size=page_size,
+            **filters,
+        )
+
+    def _get_json(
+        self,
+        client: APIClient,
+        url: str,
+        params: dict | None = None,
+        endpoint: str = "",
+        page: int | None = None,
+        memoize: bool = True,
+    ) -> dict:
+        """
+        Perform a GET request and return the JSON response body.
+
+        Responses of the Objecttypes API with an ``ETag`` (and of the Objects API,
+        if ``OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS``) are cached, and revalidated
+        on subsequent requests with ``If-None-Match``: a ``304 Not Modified``
+        response is then served from the cache. Within
+        :func:`objectsapiclient.memoize.memoize_requests`, a URL is only requested
+        once per service, unless ``memoize`` is false.
+
+        :param memoize: Whether to memoize the response, which is not done for
+            pages of Objects, so iterating over them holds a single page in memory.
+        """
+        if memoize and (memo := get_memo()) is not None:
+            return memo.get(
+                get_response_cache_key(
+                    self._get_absolute_url(client, url, params),
+                    self._get_service(client),
+                ),
+                lambda: self._fetch_json(client, url, params, endpoint, page),
+            )
+        return self._fetch_json(client, url, params, endpoint, page)
+
+    @staticmethod
+    def _get_absolute_url(client: APIClient, url: str, params: dict | None) -> str:
+        return Request("get", client.to_absolute_url(url), params=params).prepare().url
+
+    def _get_service(self, client: APIClient) -> Service:
+        if client is self.object_types:
+            return self.config.object_type_api_service_config
+        return self.config.objects_api_service_config
+
+    def _fetch_json(
+        self,
+        client: APIClient,
+        url: str,
+        params: dict | None,
+        endpoint: str,
+        page: int | None,
+    ) -> dict:
+        with instrument(endpoint, "get", page=page) as event:
+            timeout = get_setting("OBJECTSAPICLIENT_RESPONSE_CACHE_TIMEOUT")
+            cache_key = cached = None
+            if timeout and (
+                client is self.object_types
+                or get_setting("OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS")
+            ):
+                cache_key = get_response_cache_key(
+                    self._get_absolute_url(client, url, params),
+                    self._get_service(client),
+                )
+                cached = cache.get(cache_key)
+
+            headers = {"If-None-Match": cached[0]} if cached else None
+            response = self._request(client, "get", url, params=params, headers=headers)
+            event.set_response(response)
+
+            if cached:
+                event.cache_hit = response.status_code == 304
+                if event.cache_hit:
+                    return cached[1]
+
+            response.raise_for_status()
+            with event.deserializing():
+                data = loads(response.content)
+
+            if cache_key and (etag := response.headers.get("ETag")):
+                cache.set(cache_key, (etag, data), timeout=timeout)
+
+            return data
+
+    def get_object(self, uuid, lazy=False) -> Object | None:
+        """
+        Retrieve a single Object by its UUID.
+
+        :returns: Returns an Object dataclass, or ``None`` if it does not exist
+        """
+        data = self.get_object_data(uuid)
+        if data is None:
+            return None
+        return decode(LazyObject if lazy else Object, data)
+
+    def get_objects_by_uuid(
+        self, uuids: Iterable, max_workers: int = 8, lazy=False
+    ) -> dict[str, Object]:
+        """
+        Retrieve multiple Objects by their UUIDs, fetching them concurrently.
+
+        Duplicate UUIDs are only fetched once, and requests for the same Object
+        which are already in flight in other threads are shared.
+
+        :returns: Returns a dict of Object dataclasses by UUID, leaving out UUIDs
+            of Objects that do not exist
+        """
+        model = LazyObject if lazy else Object
+        return {
+            uuid: decode(model, data)
+            for uuid, data in self.get_object_data_by_uuid(
+                uuids, max_workers=max_workers
+            ).items()
+        }
+
+    def get_object_data_by_uuid(
+        self, uuids: Iterable, max_workers: int = 8
+    ) -> dict[str, dict]:
+        """
+        Retrieve the raw JSON of multiple Objects, like :meth:`get_objects_by_uuid`.
+        """
+        unique_uuids = list(dict.fromkeys(str(uuid) for uuid in uuids))
+        if not unique_uuids:
+            return {}
+
+        with keep_alive(self.objects), parallel(max_workers=max_workers) as executor:
+            results = list(executor.map(in_context(self.get_object_data), unique_uuids))
+
+        return {
+            uuid: data
+            for uuid, data in zip(unique_uuids, results, strict=True)
+            if data is not None
+        }
+
+    def get_object_data(self, uuid) -> dict | None:
+        """
+        Retrieve the raw JSON of a single Object, or ``None`` if it does not exist.
+        """
+        url = urljoin(self.objects.base_url, f"objects/{uuid}")
+
+        def fetch():
+            try:
+                return self._get_json(self.objects, url, endpoint="objects/{uuid}")
+            except HTTPError as exc:
+                if exc.response is not None and exc.response.status_code == 404:
+                    return None
+                raise
+
+        return self._in_flight.call(url, fetch)
+
+    def _get_page(
+        self, url: str, params: dict | None = None, page: int | None = None
+    ) -> dict:
+        return self._get_json(
+            self.objects,
+            url,
+            params=params,
+            endpoint="objects",
+            page=page,
+            memoize=False,
+        )
+
+    def _iter_pages(
+        self,
+        url: str,
+        params: dict,
+        max_workers: int | None = None,
+        start_page: int = 1,
+    ) -> Iterator[dict]:
+        data = self._get_page(url, params, page=start_page)
+
+        # Pages can only be planned from the count and the size of a non-empty
+        # first page, otherwise the next links are followed one by one
+        if (
+            not max_workers
+            or max_workers < 2
+            or not data.get("next")
+            or not data.get("results")
+            or data.get("count") is None
+        ):
+            yield data
+            # The next link already contains all query parameters
+            page = start_page
+            while next_url := data.get("next"):
+                page += 1
+                data = self._get_page(next_url, page=page)
+                yield data
+            return
+
+        # Plan the remaining page numbers from the total count, based on the size
+        # of the first page.
+        page_count = math.ceil(data["count"] / len(data["results"]))
+        next_page = 2
+        pending = deque()
+
+        get_page = in_context(self._get_page)
+        with parallel(max_workers=max_workers) as executor:
+
+            def submit():
+                nonlocal next_page
+                pending.append(
+                    executor.submit(
+                        get_page, url, {**params, "page": next_page}, next_page
+                    )
+                )
+                next_page += 1
+
+            while next_page <= page_count and len(pending) < max_workers:
+                submit()
+
+            yield data
+
+            while pending:
+                data = pending.popleft().result()
+                if next_page <= page_count:
+                    submit()
+                yield data
+
+    def search_objects(
+        self,
+        geometry: dict | None = None,
+        object_type_uuid=None,
+        page_size: int | None = None,
+        lazy=False,
+        **filters,
+    ) -> Iterator[Object]:
+        """
+        Lazily iterate over the Objects found by the search endpoint of the Objects
+        API, following the ``next`` links of the paginated response.
+
+        The Objects are filtered by the Objects API, so only the matching Objects
+        are transferred, one page at a time.
+
+        :param geometry: Only yield Objects with a geometry within this GeoJSON
+            geometry (in WGS 84), for example the polygon of a map viewport, see
+            :func:`objectsapiclient.geometry.bbox_to_polygon`.
+        :param object_type_uuid: Only yield Objects of this ObjectType UUID.
+        :param page_size: The number of Objects to request per page. The server
+            default is used if not provided.
+        :param lazy: Yield :class:`LazyObject` instances, which only convert their
+            ``record`` when it is accessed.
+        :param filters: Filters applied by the Objects API, see
+            :func:`objectsapiclient.query.build_objects_params`.
+        :returns: Yields Object dataclasses
+        """
+        model = LazyObject if lazy else Object
+        body = self._get_objects_params(object_type_uuid, page_size, **filters)
+        # The page size and field selection are query parameters, the filters are
+        # sent in the body
+        params = {key: body.pop(key) for key in ("pageSize", "fields") if key in body}
+        if geometry is not None:
+            body["geometry"] = {"within": geometry}
+
+        url = urljoin(self.objects.base_url, "objects/search")
+        with keep_alive(self.objects):
+            page = 1
+            data = self._search_page(url, params, body, page)
+            while True:
+                yield from decode_list(model, data.get("results") or [])
+                if not (next_url := data.get("next")):
+                    return
+                # The next link already contains all query parameters
+                page += 1
+                data = self._search_page(next_url, None, body, page)
+
+    def _search_page(
+        self, url: str, params: dict | None, body: dict, page: int
+    ) -> dict:
+        with instrument("objects/search", "post", page=page) as event:
+            response = self._request(
+                self.objects,
+                "post",
+                url,
+                read=True,
+                params=params,
+                json=body,
+                # Coordinates of geometries are in WGS 84
+                headers={"Content-Crs": "EPSG:4326"},
+            )
+            event.set_response(response)
+            response.raise_for_status()
+            with event.deserializing():
+                return loads(response.content)
+
+    def create_object(self, object_type_uuid, record: dict) -> Object:
+        """
+        Create an Object of an object type.
+
+        :param record: The record as in the Objects API, for example
+            ``{"typeVersion": 1, "data": {...}}``. ``startAt`` defaults to today.
+        :returns: Returns the created Object dataclass
+        """
+        data = self._write(
+            "post",
+            urljoin(self.objects.base_url, "objects"),
+            {
+                "type": self.object_type_uuid_to_url(object_type_uuid),
+                "record": self._with_start_at(record),
+            },
+            endpoint="objects",
+        )
+        return decode(Object, data)
+
+    def update_object(self, uuid, object_type_uuid, record: dict) -> Object:
+        """
+        Replace the record of an Object, which creates a new record.
+
+        :param record: The record as in the Objects API, see
+            :meth:`create_object`.
+        :returns: Returns the updated Object dataclass
+        """
+        data = self._write(
+            "put",
+            urljoin(self.objects.base_url, f"objects/{uuid}"),
+            {
+                "type": self.object_type_uuid_to_url(object_type_uuid),
+                "record": self._with_start_at(record),
+            },
+            endpoint="objects/{uuid}",
+        )
+        return decode(Object, data)
+
+    def patch_object(self, uuid, record: dict) -> Object:
+        """
+        Partially update the record of an Object, which creates a new record.
+
+        :param record: The fields of the record to change, as in the Objects API.
+        :returns: Returns the updated Object dataclass
+        """
+        data = self._write(
+            "patch",
+            urljoin(self.objects.base_url, f"objects/{uuid}"),
+            {"record": record},
+            endpoint="objects/{uuid}",
+        )
+        return decode(Object, data)
+
+    def submit_objects(
+        self,
+        object_type_uuid,
+        items: Iterable[dict | tuple[str, dict]],
+        max_workers: int = 8,
+        max_retries: int = 5,
+    ) -> Iterator["SubmitResult"]:
+        """
+        Create or update many Objects of an object type concurrently.
+
+        Each item is either a record, to create an Object, or a ``(uuid, record)``
+        tuple, to update an Object. At most ``max_workers`` items are submitted
+        at a time, and items are only consumed as results are yielded, so large
+        imports can be streamed.
+
+        Failed items are retried up to ``max_retries`` times, after the
+        ``Retry-After`` delay (up to ``OBJECTSAPICLIENT_MAX_RETRY_DELAY``) or an
+        exponential backoff. Updates are retried after connection errors,
+        timeouts and ``429``, ``502``, ``503`` and ``504`` responses. Creates are
+        only retried if the request was not processed by the API: after ``429``
+        and ``503`` responses, connection timeouts and an open circuit breaker.
+        Other errors may follow a created Object, so retrying them could create
+        it twice.
+
+        :returns: Yields a :class:`objectsapiclient.bulk.SubmitResult` for each
+            item, in order
+        """
+        from .bulk import submit_objects
+
+        with keep_alive(self.objects):
+            yield from submit_objects(
+                self,
+                object_type_uuid,
+                items,
+                max_workers=max_workers,
+                max_retries=max_retries,
             )
-        else:
-            response = self.objects_api_client.request(
-                "get", urljoin(base=self.objects_api_client.base_url, url="objects")
+
+    def _write(self, method: str, url: str, payload: dict, endpoint: str) -> dict:
+        with instrument(endpoint, method) as event:
+            response = self._request(
+                self.objects,
+                method,
+                url,
+                json=payload,
+                # Coordinates of geometries are in WGS 84
+                headers={"Content-Crs": "EPSG:4326"},
             )
+            event.set_response(response)
+            if (memo := get_memo()) is not None:
+                memo.clear()
+            response.raise_for_status()
+            with event.deserializing():
+                return loads(response.content)
 
-        response.raise_for_status()
-        results = response.json().get("results")
+    def _request(
+        self,
+        client: APIClient,
+        method: str,
+        url: str,
+        read: bool | None = None,
+        **kwargs,
+    ) -> Response:
+        """
+        Send a request through the circuit breaker of the API, with the
+        configured timeout.
+
+        Reads are retried after connection errors, timeouts and responses
+        indicating the request was not processed, with the ``Retry-After`` delay
+        or an exponential backoff with jitter.
+
+        :param read: Whether the request only reads, defaults to whether the
+            method is one of :data:`RETRY_METHODS`.
+        """
+        if read is None:
+            read = method.lower() in RETRY_METHODS
+
+        breaker = self._circuit_breakers[client.base_url]
+        had_failures = breaker.check()
+
+        if (timeout := self._get_timeout(client, read)) is not None:
+            kwargs.setdefault("timeout", timeout)
+        max_retries = get_setting("OBJECTSAPICLIENT_MAX_RETRIES") if read else 0
+        max_delay = get_setting("OBJECTSAPICLIENT_MAX_RETRY_DELAY")
+
+        attempt = 0
+        while True:
+            try:
+                response = client.request(method, url, **kwargs)
+            except (RequestsConnectionError, Timeout):
+                breaker.record_failure()
+                if attempt >= max_retries:
+                    raise
+                delay = get_backoff(attempt, cap=max_delay)
+            else:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                elif had_failures:
+                    breaker.record_success()
+
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in RETRY_STATUS_CODES
+                ):
+                    return response
+
+                delay = get_retry_after(response)
+                if delay is None:
+                    delay = get_backoff(attempt, cap=max_delay)
+                elif delay > max_delay:
+                    return response
+
+            logger.info("Retrying %s %s in %.1f seconds", method, url, delay)
+            time.sleep(delay)
+            attempt += 1
+            had_failures = breaker.check()
+
+    def _get_timeout(self, client: APIClient, read: bool) -> float | None:
+        if not read:
+            return self.config.write_timeout
+        if client is self.object_types:
+            return self.config.object_types_timeout
+        return self.config.objects_timeout
 
-        return factory(Object, results) if results else []
+    @staticmethod
+    def _with_start_at(record: dict) -> dict:
+        if record.get("startAt"):
+            return record
+        return {**record, "startAt": datetime.date.today().isoformat()}
+
+    @cached_property
+    def schemas(self) -> "SchemaRegistry":
+        """
+        The registry of (compiled) JSON schemas of object type versions.
+        """
+        from .schemas import SchemaRegistry
+
+        return SchemaRegistry(self)
+
+    def validate(self, object_type_uuid, version: int, data: dict) -> None:
+        """
+        Validate the ``data`` of an Object against the JSON schema of its object
+        type version. Requires ``jsonschema``.
+
+        The schemas of published versions are only fetched and compiled once, so
+        large batches can be validated without a request per item.
+
+        :raises jsonschema.ValidationError: if the data is invalid
+        """
+        self.schemas.get_validator(object_type_uuid, version).validate(data)
 
     def get_object_types(self) -> list:
         """
@@ -81,12 +860,11 @@ class Client:
 
         :returns: Returns a list of ObjectType dataclasses
         """
-        response = self.object_types.request(
-            method="get",
-            url=urljoin(self.object_types.base_url, "objecttypes"),
+        data = self._get_json(
+            self.object_types,
+            urljoin(self.object_types.base_url, "objecttypes"),
+            endpoint="objecttypes",
         )
+        results = data.get("results")
 
-        response.raise_for_status()
-        results = response.json().get("results")
-
-        return factory(ObjectType, results) if results else []
+        return decode_list(ObjectType, results) if results else []
@@ -0,0 +1,24 @@
+from django.contrib import admin
+
+from .models import MirroredObject, MirroredObjectType
+
+
+@admin.register(MirroredObjectType)
+class MirroredObjectTypeAdmin(admin.ModelAdmin):
+    list_display = ("uuid", "name", "last_synced_at")
+    readonly_fields = ("last_synced_at",)
+    search_fields = ("uuid", "name")
+
+
+@admin.register(MirroredObject)
+class MirroredObjectAdmin(admin.ModelAdmin):
+    list_display = ("uuid", "object_type", "record_index", "registration_at")
+    list_filter = ("object_type",)
+    search_fields = ("uuid",)
+    list_select_related = ("object_type",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
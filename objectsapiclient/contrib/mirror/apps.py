@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class MirrorConfig(AppConfig):
+    name = "objectsapiclient.contrib.mirror"
+    label = "objectsapiclient_mirror"
+    verbose_name = _("Objects API mirror")
+    default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        from . import receivers  # noqa: F401
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+
+from ...models import MirroredObjectType
+from ...sync import sync_object_type
+
+
+class Command(BaseCommand):
+    help = "Synchronize the mirrored objects of object types with the Objects API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "object_types",
+            nargs="*",
+            metavar="UUID",
+            help=(
+                "UUIDs of the object types to synchronize, which are added to the "
+                "mirrored object types. Defaults to all mirrored object types."
+            ),
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Retrieve all objects instead of only the changed objects.",
+        )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=None,
+            help="Number of result pages to retrieve concurrently.",
+        )
+
+    def handle(self, *args, **options):
+        if options["object_types"]:
+            object_types = [
+                MirroredObjectType.objects.get_or_create(uuid=uuid)[0]
+                for uuid in options["object_types"]
+            ]
+        else:
+            object_types = MirroredObjectType.objects.all()
+
+        for object_type in object_types:
+            result = sync_object_type(
+                object_type, full=options["full"], max_workers=options["max_workers"]
+            )
+            self.stdout.write(
+                f"{object_type}: {result.created} created, {result.updated} "
+                f"updated, {result.deleted} deleted"
+            )
@@ -0,0 +1,103 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="MirroredObjectType",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.UUIDField(unique=True, verbose_name="objecttype UUID")),
+                (
+                    "name",
+                    models.CharField(blank=True, max_length=100, verbose_name="name"),
+                ),
+                (
+                    "last_synced_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text=(
+                            "Start of the last successful sync. Objects are "
+                            "synchronized incrementally once this is set."
+                        ),
+                        null=True,
+                        verbose_name="last synced at",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "mirrored object type",
+                "verbose_name_plural": "mirrored object types",
+            },
+        ),
+        migrations.CreateModel(
+            name="MirroredObject",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("uuid", models.UUIDField(unique=True, verbose_name="UUID")),
+                ("url", models.URLField(max_length=1000, verbose_name="URL")),
+                (
+                    "record_index",
+                    models.PositiveIntegerField(verbose_name="record index"),
+                ),
+                (
+                    "type_version",
+                    models.PositiveIntegerField(null=True, verbose_name="type version"),
+                ),
+                ("data", models.JSONField(default=dict, verbose_name="data")),
+                (
+                    "geometry",
+                    models.JSONField(blank=True, null=True, verbose_name="geometry"),
+                ),
+                (
+                    "start_at",
+                    models.DateField(blank=True, null=True, verbose_name="start at"),
+                ),
+                (
+                    "end_at",
+                    models.DateField(blank=True, null=True, verbose_name="end at"),
+                ),
+                (
+                    "registration_at",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="registration at"
+                    ),
+                ),
+                (
+                    "object_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="mirrored_objects",
+                        to="objectsapiclient_mirror.mirroredobjecttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "mirrored object",
+                "verbose_name_plural": "mirrored objects",
+            },
+        ),
+    ]
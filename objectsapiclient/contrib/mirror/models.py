@@ -0,0 +1,55 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class MirroredObjectType(models.Model):
+    """
+    An object type of which the objects are mirrored into the local database.
+    """
+
+    uuid = models.UUIDField(_("objecttype UUID"), unique=True)
+    name = models.CharField(_("name"), max_length=100, blank=True)
+    last_synced_at = models.DateTimeField(
+        _("last synced at"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Start of the last successful sync. Objects are synchronized "
+            "incrementally once this is set."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("mirrored object type")
+        verbose_name_plural = _("mirrored object types")
+
+    def __str__(self):
+        return self.name or str(self.uuid)
+
+
+class MirroredObject(models.Model):
+    """
+    The latest record of an object from the Objects API.
+    """
+
+    object_type = models.ForeignKey(
+        MirroredObjectType,
+        on_delete=models.CASCADE,
+        related_name="mirrored_objects",
+    )
+    uuid = models.UUIDField(_("UUID"), unique=True)
+    url = models.URLField(_("URL"), max_length=1000)
+    record_index = models.PositiveIntegerField(_("record index"))
+    type_version = models.PositiveIntegerField(_("type version"), null=True)
+    data = models.JSONField(_("data"), default=dict)
+    geometry = models.JSONField(_("geometry"), null=True, blank=True)
+    start_at = models.DateField(_("start at"), null=True, blank=True)
+    end_at = models.DateField(_("end at"), null=True, blank=True)
+    registration_at = models.DateField(_("registration at"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("mirrored object")
+        verbose_name_plural = _("mirrored objects")
+
+    def __str__(self):
+        return str(self.uuid)
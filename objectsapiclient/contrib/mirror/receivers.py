@@ -0,0 +1,25 @@
+from uuid import UUID
+
+from django.dispatch import receiver
+
+from ...signals import object_changed
+from .models import MirroredObject, MirroredObjectType
+from .sync import sync_object
+
+
+@receiver(object_changed)
+def update_mirrored_object(sender, uuid, object_type_url, action, **kwargs):
+    try:
+        object_type_uuid = UUID(object_type_url.rstrip("/").rsplit("/", 1)[-1])
+    except ValueError:
+        return
+
+    object_type = MirroredObjectType.objects.filter(uuid=object_type_uuid).first()
+    if object_type is None or object_type.last_synced_at is None:
+        # not mirrored, or the first sync is still to come
+        return
+
+    if action == "destroy":
+        MirroredObject.objects.filter(uuid=uuid).delete()
+    else:
+        sync_object(object_type, uuid)
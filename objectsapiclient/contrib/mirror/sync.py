@@ -0,0 +1,172 @@
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from ...client import Client
+from .models import MirroredObject, MirroredObjectType
+
+logger = logging.getLogger(__name__)
+
+FETCH_BATCH_SIZE = 100
+
+UPDATE_FIELDS = [
+    "object_type",
+    "url",
+    "record_index",
+    "type_version",
+    "data",
+    "geometry",
+    "start_at",
+    "end_at",
+    "registration_at",
+]
+
+
+@dataclass
+class SyncResult:
+    created: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+
+def sync_object_type(
+    object_type: MirroredObjectType,
+    client: Client | None = None,
+    full=False,
+    max_workers: int | None = None,
+) -> SyncResult:
+    """
+    Synchronize the mirrored objects of an object type with the Objects API.
+
+    The first (or a ``full``) sync retrieves all objects. After that, only the
+    UUID and record index of the objects are listed, and only the objects with a
+    new record are retrieved. The Objects API has no filter for changes since a
+    given moment, but the record index is incremented for every change. Objects
+    that no longer exist are removed from the mirror.
+    """
+    client = client or Client.shared()
+    started_at = timezone.now()
+    known = dict(
+        MirroredObject.objects.filter(object_type=object_type).values_list(
+            "uuid", "record_index"
+        )
+    )
+    known = {str(uuid): index for uuid, index in known.items()}
+    result = SyncResult()
+    seen = set()
+
+    if full or object_type.last_synced_at is None:
+        for results in client.iter_object_pages(
+            object_type_uuid=object_type.uuid, max_workers=max_workers
+        ):
+            seen.update(data["uuid"] for data in results)
+            _save_objects(object_type, results, known, result)
+    else:
+        changed = []
+        for results in client.iter_object_pages(
+            object_type_uuid=object_type.uuid,
+            max_workers=max_workers,
+            fields=["uuid", "record__index"],
+        ):
+            for data in results:
+                seen.add(data["uuid"])
+                if known.get(data["uuid"]) != (data.get("record") or {}).get("index"):
+                    changed.append(data["uuid"])
+
+        for start in range(0, len(changed), FETCH_BATCH_SIZE):
+            uuids = changed[start : start + FETCH_BATCH_SIZE]
+            objects = client.get_object_data_by_uuid(uuids)
+            _save_objects(object_type, objects.values(), known, result)
+
+    if removed := set(known) - seen:
+        result.deleted, _ = MirroredObject.objects.filter(
+            object_type=object_type, uuid__in=removed
+        ).delete()
+
+    object_type.last_synced_at = started_at
+    object_type.save(update_fields=["last_synced_at"])
+
+    logger.info(
+        "Synchronized objects of object type %s: %s created, %s updated, %s deleted",
+        object_type.uuid,
+        result.created,
+        result.updated,
+        result.deleted,
+    )
+    return result
+
+
+def sync_object(
+    object_type: MirroredObjectType, uuid: str, client: Client | None = None
+) -> None:
+    """
+    Synchronize a single mirrored object, for example after a notification.
+    """
+    client = client or Client.shared()
+    data = client.get_object_data(uuid)
+
+    if data is None:
+        MirroredObject.objects.filter(uuid=uuid).delete()
+    else:
+        _save_objects(object_type, [data], {}, SyncResult())
+
+
+def _save_objects(
+    object_type: MirroredObjectType,
+    results: Iterable[dict],
+    known: dict[str, int],
+    result: SyncResult,
+) -> None:
+    objects = []
+    for data in results:
+        record = data.get("record") or {}
+        record_index = record.get("index") or 0
+        objects.append(
+            MirroredObject(
+                object_type=object_type,
+                uuid=data["uuid"],
+                url=data["url"],
+                record_index=record_index,
+                type_version=record.get("typeVersion"),
+                data=record.get("data") or {},
+                geometry=record.get("geometry"),
+                start_at=record.get("startAt"),
+                end_at=record.get("endAt"),
+                registration_at=record.get("registrationAt"),
+            )
+        )
+        if data["uuid"] not in known:
+            result.created += 1
+        elif known[data["uuid"]] != record_index:
+            result.updated += 1
+
+    using = router.db_for_write(MirroredObject)
+    with transaction.atomic(using=using):
+        if connections[using].features.supports_update_conflicts_with_target:
+            MirroredObject.objects.using(using).bulk_create(
+                objects,
+                update_conflicts=True,
+                unique_fields=["uuid"],
+                update_fields=UPDATE_FIELDS,
+            )
+            return
+
+        # For example MySQL and MariaDB, which cannot upsert on the UUID
+        pks = dict(
+            MirroredObject.objects.using(using)
+            .filter(uuid__in=[obj.uuid for obj in objects])
+            .values_list("uuid", "pk")
+        )
+        pks = {str(uuid): pk for uuid, pk in pks.items()}
+        existing = []
+        for obj in objects:
+            if (pk := pks.get(str(obj.uuid))) is not None:
+                obj.pk = pk
+                existing.append(obj)
+        MirroredObject.objects.using(using).bulk_update(existing, UPDATE_FIELDS)
+        MirroredObject.objects.using(using).bulk_create(
+            [obj for obj in objects if obj.pk is None]
+        )
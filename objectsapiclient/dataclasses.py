@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
+from .decoder import underscoreize
 
-@dataclass
+
+@dataclass(slots=True)
 class ObjectRecord:
     index: int
     typeVersion: int
@@ -14,15 +17,68 @@ class ObjectRecord:
     correctedBy: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Object:
-    url: str
-    uuid: str
-    type: str
-    record: list[ObjectRecord]
+    # All fields are optional, as the Objects API only returns the selected
+    # fields when filtering with ``fields``.
+    url: str | None = None
+    uuid: str | None = None
+    type: str | None = None
+    record: list[ObjectRecord] | None = None
+
+
+class LazyObject(Object):
+    """
+    An :class:`Object` which keeps the raw JSON of its ``record`` until the record
+    is accessed for the first time.
+
+    A lazy object is equal to an eager :class:`Object` with the same fields, and
+    can be pickled (for example to cache it) and copied.
+    """
+
+    __slots__ = ("_raw_record", "_record")
+
+    lazy_fields: ClassVar[tuple[str, ...]] = ("record",)
+
+    def __init__(
+        self,
+        url: str | None = None,
+        uuid: str | None = None,
+        type: str | None = None,
+        record: dict | None = None,
+    ):
+        self.url = url
+        self.uuid = uuid
+        self.type = type
+        self._raw_record = record
+        self._record = None
+
+    @property
+    def record(self):
+        if self._raw_record is not None:
+            self._record = underscoreize(self._raw_record)
+            self._raw_record = None
+        return self._record
+
+    def __eq__(self, other):
+        if not isinstance(other, Object):
+            return NotImplemented
+        return (self.url, self.uuid, self.type, self.record) == (
+            other.url,
+            other.uuid,
+            other.type,
+            other.record,
+        )
+
+    # The state of the slots dataclass would assign the read-only record
+    def __getstate__(self):
+        return (self.url, self.uuid, self.type, self._raw_record, self._record)
+
+    def __setstate__(self, state):
+        self.url, self.uuid, self.type, self._raw_record, self._record = state
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectTypeVersion:
     url: str
     version: int
@@ -34,7 +90,7 @@ class ObjectTypeVersion:
     publishedAt: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectType:
     url: str
     uuid: str
@@ -0,0 +1,79 @@
+"""
+Decode Objects API and Objecttypes API responses into dataclasses.
+
+This is a faster equivalent of :func:`zgw_consumers.api_models.base.factory` for
+the plain dataclasses in :mod:`objectsapiclient.dataclasses`: the camelCase to
+snake_case conversion of keys is memoized and the fields of each dataclass are
+only looked up once.
+"""
+
+import functools
+import json
+from dataclasses import fields
+from typing import Any, TypeVar
+
+from zgw_consumers.api_models._camel_case import camel_to_underscore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+T = TypeVar("T")
+
+
+def loads(content: bytes) -> Any:
+    """
+    Parse a JSON document, using ``orjson`` when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+_to_underscore = functools.lru_cache(maxsize=4096)(camel_to_underscore)
+
+
+@functools.cache
+def _field_names(model: type) -> frozenset[str]:
+    return frozenset(field.name for field in fields(model))
+
+
+@functools.cache
+def _lazy_field_names(model: type) -> frozenset[str]:
+    return frozenset(getattr(model, "lazy_fields", ()))
+
+
+def underscoreize(data: Any) -> Any:
+    """
+    Recursively convert the (string) keys of JSON data to snake_case.
+    """
+    if isinstance(data, dict):
+        return {
+            _to_underscore(key) if isinstance(key, str) else key: underscoreize(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [underscoreize(item) for item in data]
+    return data
+
+
+def decode(model: type[T], data: dict) -> T:
+    """
+    Build a ``model`` instance from a JSON object, ignoring unknown keys.
+
+    Values of the fields listed in ``model.lazy_fields`` are passed as-is, leaving
+    their conversion to the model.
+    """
+    names = _field_names(model)
+    lazy = _lazy_field_names(model)
+    kwargs = {}
+    for key, value in data.items():
+        name = _to_underscore(key)
+        if name in names:
+            kwargs[name] = value if name in lazy else underscoreize(value)
+    return model(**kwargs)
+
+
+def decode_list(model: type[T], data: list[dict]) -> list[T]:
+    return [decode(model, item) for item in data]
@@ -0,0 +1,285 @@
+"""
+Export (dump) Objects to a file, streaming the result pages of the Objects API so
+only a single page is held in memory.
+"""
+
+import bz2
+import csv
+import gzip
+import io
+import json
+import logging
+import lzma
+import os
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from .client import Client
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+# Every page is compressed into a separate stream: concatenated streams are
+# still a valid file, and a dump can be resumed after the last complete page.
+COMPRESSIONS = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+RECORD_FIELDS = (
+    "index",
+    "typeVersion",
+    "startAt",
+    "endAt",
+    "registrationAt",
+    "correctionFor",
+    "correctedBy",
+    "geometry",
+)
+
+# The column of the record data without a column of its own, as a JSON object
+EXTRA_DATA_COLUMN = "record__extra_data"
+
+
+def flatten_object(data: dict) -> dict[str, Any]:
+    """
+    Flatten the JSON of an Object into a row, with a column per (nested) key of
+    the record data, for example ``record__data__address__city``. Lists and
+    geometries are encoded as JSON.
+    """
+    record = data.get("record") or {}
+    row = {
+        "url": data.get("url"),
+        "uuid": data.get("uuid"),
+        "type": data.get("type"),
+    }
+    for field in RECORD_FIELDS:
+        value = record.get(field)
+        row[f"record__{field}"] = (
+            json.dumps(value) if isinstance(value, dict | list) else value
+        )
+    _flatten(record.get("data") or {}, "record__data", row)
+    return row
+
+
+def _flatten(data: dict, prefix: str, row: dict[str, Any]) -> None:
+    for key, value in data.items():
+        column = f"{prefix}__{key}"
+        if isinstance(value, dict):
+            _flatten(value, column, row)
+        elif isinstance(value, list):
+            row[column] = json.dumps(value)
+        else:
+            row[column] = value
+
+
+def dump_objects(
+    path: str | os.PathLike,
+    format: str = "ndjson",
+    compression: str | None = None,
+    resume: bool = False,
+    client: Client | None = None,
+    **filters,
+) -> int:
+    """
+    Write all Objects to ``path``, as newline-delimited JSON, CSV or Parquet
+    (requires ``pyarrow``).
+
+    The result pages are written one by one, keeping the progress in a
+    ``<path>.progress`` file, which is removed once all pages are written. With
+    ``resume``, an interrupted dump continues after the last written page.
+
+    The CSV and Parquet columns are taken from the JSON schemas of the object
+    type (if ``object_type_uuid`` is given) and the Objects on the first page.
+    Data of later Objects without a column is written to the
+    :data:`EXTRA_DATA_COLUMN` as a JSON object. The Parquet columns are strings,
+    with numbers and booleans encoded as JSON.
+
+    :param format: One of :data:`FORMATS`.
+    :param compression: For NDJSON and CSV, one of :data:`COMPRESSIONS`. For
+        Parquet, the codec of ``pyarrow``, for example ``"zstd"``.
+    :param resume: Continue the interrupted dump of the same Objects, if any.
+        Not supported for Parquet.
+    :param client: The client to use, defaults to the shared client.
+    :param filters: The ``object_type_uuid``, ``page_size`` and other filters of
+        :meth:`Client.iter_objects`.
+    :returns: The number of Objects in the file.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format!r}, choose from {FORMATS}")
+
+    client = client or Client.shared()
+    if format == "parquet":
+        if resume:
+            raise ValueError("Resuming a Parquet dump is not supported")
+        return _dump_parquet(client, path, filters, compression)
+
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression!r}, choose from {tuple(COMPRESSIONS)}"
+        )
+    compress = COMPRESSIONS.get(compression, lambda content: content)
+
+    progress_path = Path(f"{path}.progress")
+    progress = {
+        "filters": json.dumps(filters, default=str, sort_keys=True),
+        "page": 0,
+        "offset": 0,
+        "count": 0,
+        "columns": None,
+    }
+    if resume and progress_path.exists():
+        saved = json.loads(progress_path.read_text())
+        if saved.get("filters") != progress["filters"]:
+            raise ValueError(f"{progress_path} is the progress of other Objects")
+        progress = saved
+
+    with open(path, "r+b" if progress["page"] else "wb") as file:
+        file.truncate(progress["offset"])
+        file.seek(progress["offset"])
+
+        start_page = progress["page"] + 1
+        pages = client.iter_object_pages(start_page=start_page, **filters)
+        for page, results in enumerate(pages, start=start_page):
+            if format == "csv":
+                rows = [flatten_object(result) for result in results]
+                header = progress["columns"] is None
+                if header:
+                    progress["columns"] = _get_columns(client, rows, **filters)
+                content = _to_csv(rows, progress["columns"], header)
+            else:
+                content = b"".join(
+                    json.dumps(result, ensure_ascii=False).encode() + b"\n"
+                    for result in results
+                )
+            file.write(compress(content))
+            file.flush()
+
+            progress.update(
+                page=page, offset=file.tell(), count=progress["count"] + len(results)
+            )
+            _save_progress(progress_path, progress)
+
+    progress_path.unlink(missing_ok=True)
+    return progress["count"]
+
+
+def _get_columns(
+    client: Client, rows: list[dict[str, Any]], object_type_uuid=None, **filters
+) -> list[str]:
+    # The columns of the JSON schemas of all versions of the object type, and of
+    # the objects on the first page, for optional properties missing on it
+    columns = ["url", "uuid", "type", *(f"record__{field}" for field in RECORD_FIELDS)]
+    if object_type_uuid:
+        columns += _get_schema_columns(client, object_type_uuid)
+    columns += [key for row in rows for key in row]
+    columns.append(EXTRA_DATA_COLUMN)
+    return list(dict.fromkeys(columns))
+
+
+def _get_schema_columns(client: Client, object_type_uuid) -> list[str]:
+    # The schema registry requires jsonschema
+    if not find_spec("jsonschema"):
+        return []
+
+    columns: list[str] = []
+    try:
+        for object_type in client.get_object_types():
+            if object_type.uuid != str(object_type_uuid):
+                continue
+            for url in object_type.versions:
+                version = int(url.rstrip("/").rsplit("/", 1)[-1])
+                schema, _ = client.schemas.get_schema(object_type_uuid, version)
+                _flatten_schema(schema, "record__data", columns)
+    except Exception:
+        logger.exception(
+            "Failed to retrieve the schemas of %s, the columns are those of the "
+            "first page",
+            object_type_uuid,
+        )
+    return columns
+
+
+def _flatten_schema(schema: dict, prefix: str, columns: list[str]) -> None:
+    # The columns of the (nested) properties, as flattened by flatten_object
+    for key, subschema in (schema.get("properties") or {}).items():
+        column = f"{prefix}__{key}"
+        if isinstance(subschema, dict) and subschema.get("properties"):
+            _flatten_schema(subschema, column, columns)
+        else:
+            columns.append(column)
+
+
+def _fit_columns(row: dict[str, Any], columns: set[str]) -> dict[str, Any]:
+    if not (extra := {key: value for key, value in row.items() if key not in columns}):
+        return row
+    row = {key: value for key, value in row.items() if key not in extra}
+    row[EXTRA_DATA_COLUMN] = json.dumps(extra, default=str)
+    return row
+
+
+def _to_csv(rows: list[dict[str, Any]], columns: list[str], header: bool) -> bytes:
+    output = io.StringIO()
+    writer = csv.DictWriter(output, columns)
+    if header:
+        writer.writeheader()
+    known = set(columns)
+    writer.writerows(_fit_columns(row, known) for row in rows)
+    return output.getvalue().encode()
+
+
+def _save_progress(progress_path: Path, progress: dict) -> None:
+    tmp_path = progress_path.with_name(f"{progress_path.name}.tmp")
+    tmp_path.write_text(json.dumps(progress))
+    os.replace(tmp_path, progress_path)
+
+
+def _dump_parquet(
+    client: Client, path: str | os.PathLike, filters: dict, compression: str | None
+) -> int:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    count = 0
+    writer = None
+    try:
+        for results in client.iter_object_pages(**filters):
+            rows = [flatten_object(result) for result in results]
+            if writer is None:
+                # All columns are strings, as the type of a value can differ
+                # between objects
+                columns = _get_columns(client, rows, **filters)
+                known = set(columns)
+                writer = pq.ParquetWriter(
+                    path,
+                    pa.schema((column, pa.string()) for column in columns),
+                    compression=compression or "snappy",
+                )
+            rows = [
+                {
+                    column: _to_string(value)
+                    for column, value in _fit_columns(row, known).items()
+                }
+                for row in rows
+            ]
+            writer.write_table(pa.Table.from_pylist(rows, schema=writer.schema))
+            count += len(rows)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        pq.write_table(
+            pa.table({column: pa.array([], pa.string()) for column in ("url", "uuid")}),
+            path,
+        )
+    return count
+
+
+def _to_string(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
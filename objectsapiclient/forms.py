@@ -0,0 +1,121 @@
+from urllib.parse import urlencode
+
+from django import forms
+from django.conf import settings
+from django.contrib.admin.widgets import get_select2_language
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+
+from .models import get_cached_object_type_names, get_cached_object_type_uuids
+
+
+class ObjectTypeAutocompleteWidget(forms.Select):
+    """
+    Select an object type by searching its name, using the select2 autocomplete
+    of the Django admin and :class:`objectsapiclient.views.ObjectTypeAutocompleteView`.
+
+    Only the selected object type is rendered as an option.
+    """
+
+    def __init__(self, attrs=None, configuration: str | None = None):
+        super().__init__(attrs)
+        self.configuration = configuration
+        self.i18n_name = get_select2_language()
+
+    def get_url(self) -> str:
+        url = reverse("objectsapiclient:objecttype-autocomplete")
+        if self.configuration is not None:
+            url = f"{url}?{urlencode({'configuration': self.configuration})}"
+        return url
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs=extra_attrs)
+        attrs.setdefault("class", "")
+        attrs.update(
+            {
+                "data-ajax--cache": "true",
+                "data-ajax--delay": 250,
+                "data-ajax--type": "GET",
+                "data-ajax--url": self.get_url(),
+                "data-theme": "admin-autocomplete",
+                "data-allow-clear": "false" if self.is_required else "true",
+                "data-placeholder": "",  # Allows clearing of the input.
+                "lang": self.i18n_name,
+                "class": f"{attrs['class']} admin-autocomplete".strip(),
+            }
+        )
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        options = []
+        if not self.is_required:
+            options.append(self.create_option(name, "", "", False, 0))
+
+        selected = [uuid for uuid in value if uuid]
+        if selected:
+            names = get_cached_object_type_names(self.configuration)
+            options.append(
+                self.create_option(
+                    name,
+                    selected[0],
+                    names.get(selected[0], selected[0]),
+                    True,
+                    len(options),
+                )
+            )
+        return [(None, options, 0)]
+
+    @property
+    def media(self):
+        extra = "" if settings.DEBUG else ".min"
+        i18n_file = (
+            (f"admin/js/vendor/select2/i18n/{self.i18n_name}.js",)
+            if self.i18n_name
+            else ()
+        )
+        return forms.Media(
+            js=(
+                f"admin/js/vendor/jquery/jquery{extra}.js",
+                f"admin/js/vendor/select2/select2.full{extra}.js",
+                *i18n_file,
+                "admin/js/jquery.init.js",
+                "admin/js/autocomplete.js",
+            ),
+            css={
+                "screen": (
+                    f"admin/css/vendor/select2/select2{extra}.css",
+                    "admin/css/autocomplete.css",
+                ),
+            },
+        )
+
+
+class ObjectTypeAutocompleteField(forms.CharField):
+    """
+    Form field for the UUID of an object type, validated against the cached set
+    of object type UUIDs.
+    """
+
+    widget = ObjectTypeAutocompleteWidget
+    default_error_messages = {
+        "invalid_choice": _(
+            "Select a valid choice. %(value)s is not one of the available choices."
+        ),
+    }
+
+    def __init__(self, *, configuration: str | None = None, **kwargs):
+        self.configuration = configuration
+        kwargs.setdefault("widget", self.widget(configuration=configuration))
+        super().__init__(**kwargs)
+
+    def validate(self, value):
+        super().validate(value)
+        if value in self.empty_values:
+            return
+        if value not in get_cached_object_type_uuids(self.configuration):
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
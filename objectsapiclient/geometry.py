@@ -0,0 +1,124 @@
+"""
+Bounding boxes of the GeoJSON geometries of Objects, to filter Objects in-process.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+
+from .dataclasses import Object
+
+BBox = tuple[float, float, float, float]
+"""A bounding box as ``(min_x, min_y, max_x, max_y)``, in WGS 84."""
+
+# The number of bounding boxes of Object records kept in memory
+BBOX_CACHE_SIZE = 10_000
+
+_bbox_cache: OrderedDict[tuple[str, int], BBox | None] = OrderedDict()
+_bbox_cache_lock = threading.Lock()
+
+
+def get_bbox(geometry: dict | None) -> BBox | None:
+    """
+    Return the bounding box of a GeoJSON geometry, or ``None`` if it has no
+    coordinates.
+    """
+    if not geometry:
+        return None
+
+    if geometry.get("type") == "GeometryCollection":
+        boxes = [
+            bbox
+            for member in geometry.get("geometries") or []
+            if (bbox := get_bbox(member)) is not None
+        ]
+    else:
+        points = list(_iter_points(geometry.get("coordinates") or []))
+        boxes = [(x, y, x, y) for x, y in points]
+
+    if not boxes:
+        return None
+    return (
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+def _iter_points(coordinates: list) -> Iterator[tuple[float, float]]:
+    if coordinates and isinstance(coordinates[0], int | float):
+        yield coordinates[0], coordinates[1]
+        return
+    for nested in coordinates:
+        yield from _iter_points(nested)
+
+
+def bbox_to_polygon(bbox: BBox) -> dict:
+    """
+    Return the GeoJSON polygon of a bounding box, for example to search the
+    Objects within a map viewport with :meth:`Client.search_objects`.
+    """
+    min_x, min_y, max_x, max_y = bbox
+    return {
+        "type": "Polygon",
+        "coordinates": [
+            [
+                [min_x, min_y],
+                [max_x, min_y],
+                [max_x, max_y],
+                [min_x, max_y],
+                [min_x, min_y],
+            ]
+        ],
+    }
+
+
+def intersects(bbox: BBox, other: BBox) -> bool:
+    return not (
+        bbox[2] < other[0]
+        or other[2] < bbox[0]
+        or bbox[3] < other[1]
+        or other[3] < bbox[1]
+    )
+
+
+def get_object_bbox(obj: Object) -> BBox | None:
+    """
+    Return the bounding box of the geometry of an Object.
+
+    The bounding boxes are cached by Object URL and record index, as a record does
+    not change (a correction is a new record).
+    """
+    record = obj.record or {}
+    if obj.url is None or (index := record.get("index")) is None:
+        return get_bbox(record.get("geometry"))
+
+    key = (obj.url, index)
+    with _bbox_cache_lock:
+        if key in _bbox_cache:
+            _bbox_cache.move_to_end(key)
+            return _bbox_cache[key]
+
+    bbox = get_bbox(record.get("geometry"))
+    with _bbox_cache_lock:
+        _bbox_cache[key] = bbox
+        while len(_bbox_cache) > BBOX_CACHE_SIZE:
+            _bbox_cache.popitem(last=False)
+    return bbox
+
+
+def filter_objects_by_bbox(objects: Iterable[Object], bbox: BBox) -> Iterator[Object]:
+    """
+    Yield the Objects of which the bounding box of the geometry intersects
+    ``bbox``, for example to narrow down Objects that were already retrieved to a
+    map viewport without a request to the Objects API.
+
+    This is a pre-filter: an Object is yielded if its bounding box intersects,
+    even if its geometry does not.
+    """
+    for obj in objects:
+        if (object_bbox := get_object_bbox(obj)) is not None and intersects(
+            object_bbox, bbox
+        ):
+            yield obj
@@ -0,0 +1,70 @@
+import logging
+from dataclasses import dataclass
+from urllib.parse import urljoin
+
+from ape_pie import APIClient
+
+from .cache import delete_stale_while_revalidate, get_stale_while_revalidate
+from .client import Client
+from .instrumentation import instrument
+from .settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CACHE_KEY = "objectsapiclient_health"
+
+
+@dataclass
+class HealthStatus:
+    api: str
+    healthy: bool
+    message: str
+    latency: float | None
+    """The duration of the request in seconds."""
+
+
+def check_api(name: str, client: APIClient, path: str, timeout: float) -> HealthStatus:
+    try:
+        with instrument(path, "head") as event:
+            response = client.request(
+                "head", urljoin(client.base_url, path), timeout=timeout
+            )
+            event.set_response(response)
+            response.raise_for_status()
+    except Exception as exc:
+        logger.warning("%s is not available (%s)", name, exc)
+        return HealthStatus(name, False, str(exc), None)
+
+    return HealthStatus(name, True, "", event.duration)
+
+
+def check_health(client: Client | None = None) -> list[HealthStatus]:
+    """
+    Check the status of both the Objects API and the Objecttypes API.
+    """
+    client = client or Client.shared()
+    timeout = get_setting("OBJECTSAPICLIENT_HEALTH_CHECK_TIMEOUT")
+    return [
+        check_api("Objects API", client.objects, "objects", timeout),
+        check_api("Objecttypes API", client.object_types, "objecttypes", timeout),
+    ]
+
+
+def get_cached_health() -> list[HealthStatus] | None:
+    """
+    Return the last known status of the APIs without blocking, or ``None`` if it
+    is not known yet. The status is checked in the background when outdated.
+    """
+    cache_timeout = get_setting("OBJECTSAPICLIENT_HEALTH_CHECK_CACHE_TIMEOUT")
+    return get_stale_while_revalidate(
+        HEALTH_CACHE_KEY,
+        check_health,
+        fresh_timeout=cache_timeout,
+        stale_timeout=cache_timeout * 10,
+        lock_timeout=get_setting("OBJECTSAPICLIENT_HEALTH_CHECK_TIMEOUT") * 3,
+        blocking=False,
+    )
+
+
+def clear_cached_health() -> None:
+    delete_stale_while_revalidate(HEALTH_CACHE_KEY)
@@ -0,0 +1,181 @@
+"""
+Instrumentation of the requests made by :class:`objectsapiclient.client.Client`
+and :class:`objectsapiclient.async_client.AsyncClient`.
+
+Every request sends the :data:`objectsapiclient.signals.api_request` signal with a
+:class:`RequestEvent`. Connect your own receiver, or use :func:`connect_prometheus`
+or :func:`connect_opentelemetry` (for example in ``AppConfig.ready``) to record
+metrics or spans.
+"""
+
+import functools
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from requests import Response
+
+from .signals import api_request
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestEvent:
+    endpoint: str
+    """The requested endpoint, for example ``objects`` or ``objects/{uuid}``."""
+    method: str
+    page: int | None = None
+    """The page number, for paginated listings."""
+    url: str = ""
+    status: int | None = None
+    duration: float | None = None
+    """Seconds until the response was received."""
+    bytes_received: int | None = None
+    cache_hit: bool | None = None
+    """Whether a cached response was still valid, ``None`` if nothing was cached."""
+    deserialization_duration: float | None = None
+    """Seconds spent parsing the response body."""
+    error: Exception | None = None
+    started_at: int = field(default_factory=time.time_ns)
+    """Start of the request in nanoseconds since the epoch."""
+    _start: float = field(default_factory=time.perf_counter, repr=False)
+
+    def set_response(self, response: Response) -> None:
+        """
+        Record the received ``requests`` (or ``httpx``) response.
+        """
+        self.duration = time.perf_counter() - self._start
+        self.url = str(response.url)
+        self.status = response.status_code
+        self.bytes_received = len(response.content)
+
+    @contextmanager
+    def deserializing(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.deserialization_duration = time.perf_counter() - start
+
+
+@contextmanager
+def instrument(endpoint: str, method: str, page: int | None = None):
+    """
+    Collect a :class:`RequestEvent` for the request made in the block, and send it
+    with the ``api_request`` signal.
+    """
+    event = RequestEvent(endpoint=endpoint, method=method.upper(), page=page)
+    try:
+        yield event
+    except Exception as exc:
+        event.error = exc
+        raise
+    finally:
+        if event.duration is None:
+            event.duration = time.perf_counter() - event._start
+
+        if api_request.has_listeners():
+            for receiver, result in api_request.send_robust(
+                sender=RequestEvent, event=event
+            ):
+                if isinstance(result, Exception):
+                    logger.warning(
+                        "Instrumentation receiver %r failed", receiver, exc_info=result
+                    )
+
+
+@functools.cache
+def connect_prometheus(registry=None) -> None:
+    """
+    Record Prometheus metrics of all requests. Requires ``prometheus_client``.
+    """
+    from prometheus_client import REGISTRY, Counter, Histogram
+
+    registry = registry or REGISTRY
+    request_duration = Histogram(
+        "objectsapiclient_request_duration_seconds",
+        "Duration of requests to the Objects API and Objecttypes API.",
+        ["endpoint", "method", "status"],
+        registry=registry,
+    )
+    received_bytes = Counter(
+        "objectsapiclient_received_bytes",
+        "Bytes received from the Objects API and Objecttypes API.",
+        ["endpoint"],
+        registry=registry,
+    )
+    cache_results = Counter(
+        "objectsapiclient_response_cache",
+        "Cached responses that were still valid (hit) or not (miss).",
+        ["endpoint", "result"],
+        registry=registry,
+    )
+    deserialization_duration = Histogram(
+        "objectsapiclient_deserialization_duration_seconds",
+        "Duration of parsing responses.",
+        ["endpoint"],
+        registry=registry,
+    )
+
+    def record_metrics(sender, event: RequestEvent, **kwargs):
+        request_duration.labels(
+            event.endpoint, event.method, str(event.status or "error")
+        ).observe(event.duration)
+        if event.bytes_received:
+            received_bytes.labels(event.endpoint).inc(event.bytes_received)
+        if event.cache_hit is not None:
+            cache_results.labels(
+                event.endpoint, "hit" if event.cache_hit else "miss"
+            ).inc()
+        if event.deserialization_duration is not None:
+            deserialization_duration.labels(event.endpoint).observe(
+                event.deserialization_duration
+            )
+
+    api_request.connect(record_metrics, weak=False)
+
+
+@functools.cache
+def connect_opentelemetry(tracer_provider=None) -> None:
+    """
+    Record an OpenTelemetry span for every request. Requires
+    ``opentelemetry-api``.
+    """
+    from opentelemetry import trace
+
+    tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+
+    def record_span(sender, event: RequestEvent, **kwargs):
+        attributes = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+            "objectsapiclient.endpoint": event.endpoint,
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.page is not None:
+            attributes["objectsapiclient.page"] = event.page
+        if event.bytes_received is not None:
+            attributes["objectsapiclient.bytes_received"] = event.bytes_received
+        if event.cache_hit is not None:
+            attributes["objectsapiclient.cache_hit"] = event.cache_hit
+        if event.deserialization_duration is not None:
+            attributes["objectsapiclient.deserialization_duration"] = (
+                event.deserialization_duration
+            )
+
+        span = tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=event.started_at,
+            attributes=attributes,
+        )
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.StatusCode.ERROR)
+        span.end(end_time=event.started_at + int(event.duration * 1e9))
+
+    api_request.connect(record_span, weak=False)
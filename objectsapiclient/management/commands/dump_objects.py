@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...client import Client
+from ...export import COMPRESSIONS, FORMATS, dump_objects
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the objects of the Objects API to a newline-delimited JSON, CSV or "
+        "Parquet file, one page at a time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="The file to write the objects to.")
+        parser.add_argument(
+            "--object-type",
+            metavar="UUID",
+            help="Only export the objects of this object type.",
+        )
+        parser.add_argument("--format", choices=FORMATS, default="ndjson")
+        parser.add_argument(
+            "--compression",
+            help=(
+                f"Compress the file, one of {', '.join(COMPRESSIONS)}; or for "
+                "Parquet, a codec of pyarrow."
+            ),
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue an interrupted export after the last written page.",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=None,
+            help="Number of objects to retrieve per page.",
+        )
+        parser.add_argument(
+            "--configuration",
+            metavar="NAME",
+            help="Name of the named configuration to use.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            count = dump_objects(
+                options["path"],
+                format=options["format"],
+                compression=options["compression"],
+                resume=options["resume"],
+                client=Client.shared(options["configuration"]),
+                object_type_uuid=options["object_type"],
+                page_size=options["page_size"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        except ImportError as exc:
+            raise CommandError(
+                f"{exc}, install the parquet extra to export Parquet files"
+            ) from exc
+
+        self.stdout.write(f"Exported {count} objects to {options['path']}")
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from ...warmup import get_configurations, warm_up
+
+
+class Command(BaseCommand):
+    help = (
+        "Retrieve the object types, choices, schemas and configured object lists "
+        "into the cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--configuration",
+            action="append",
+            dest="configurations",
+            metavar="NAME",
+            help=(
+                "Name of a named configuration to warm up, can be repeated. "
+                "Defaults to all configurations."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        configurations = options["configurations"] or get_configurations()
+
+        failed = warm_up(configurations)
+
+        for configuration in configurations:
+            name = configuration or "the default configuration"
+            if configuration in failed:
+                self.stderr.write(f"Failed to warm up {name}, see the logs")
+            else:
+                self.stdout.write(f"Warmed up {name}")
@@ -0,0 +1,88 @@
+"""
+Memoize the GET requests of the client for the duration of a request or task.
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any
+
+from .utils import Coalescer
+
+_memo: ContextVar["RequestMemo | None"] = ContextVar(
+    "objectsapiclient_memo", default=None
+)
+
+
+class RequestMemo:
+    """
+    The responses of the GET requests made within :func:`memoize_requests`, by
+    key of the absolute URL and the service it was requested with.
+
+    Identical concurrent requests (from the threads prefetching pages or objects)
+    share a single request. The responses are shared by all callers, so they must
+    not be modified.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._responses: dict[str, Any] = {}
+        self._in_flight = Coalescer()
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._responses:
+                return self._responses[key]
+
+        def fetch_and_store():
+            response = fetch()
+            with self._lock:
+                self._responses[key] = response
+            return response
+
+        return self._in_flight.call(key, fetch_and_store)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+
+
+def get_memo() -> RequestMemo | None:
+    """
+    Return the memo of the current :func:`memoize_requests` block, if any.
+    """
+    return _memo.get()
+
+
+@contextmanager
+def memoize_requests() -> Iterator[RequestMemo]:
+    """
+    Memoize the GET requests of all clients within the block, for example a
+    management command or a background task. Nested blocks share the memo of the
+    outermost block.
+
+    Writes clear the memo, so objects are not served from before a change.
+    """
+    if (memo := _memo.get()) is not None:
+        yield memo
+        return
+
+    token = _memo.set(memo := RequestMemo())
+    try:
+        yield memo
+    finally:
+        _memo.reset(token)
+
+
+def in_context(fn: Callable) -> Callable:
+    """
+    Wrap ``fn`` to run in (a copy of) the current context, to share the memo with
+    worker threads.
+    """
+    context = copy_context()
+
+    def wrapped(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+
+    return wrapped
@@ -0,0 +1,16 @@
+from .memoize import memoize_requests
+
+
+class MemoizeRequestsMiddleware:
+    """
+    Memoize the GET requests to the Objects API and Objecttypes API for the
+    duration of a request, so views and templates asking for the same objects
+    or object types share a single API request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with memoize_requests():
+            return self.get_response(request)
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("objectsapiclient", "0004_alter_objectsclientconfiguration_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="objectsclientconfiguration",
+            name="object_types_timeout",
+            field=models.FloatField(
+                blank=True,
+                help_text=(
+                    "Timeout in seconds of reading object types and their schemas, "
+                    "defaults to the timeout of the service."
+                ),
+                null=True,
+                verbose_name="Objecttypes API timeout",
+            ),
+        ),
+        migrations.AddField(
+            model_name="objectsclientconfiguration",
+            name="objects_timeout",
+            field=models.FloatField(
+                blank=True,
+                help_text=(
+                    "Timeout in seconds of reading objects (per page), defaults to "
+                    "the timeout of the service."
+                ),
+                null=True,
+                verbose_name="Objects API timeout",
+            ),
+        ),
+        migrations.AddField(
+            model_name="objectsclientconfiguration",
+            name="write_timeout",
+            field=models.FloatField(
+                blank=True,
+                help_text=(
+                    "Timeout in seconds of creating and updating objects, defaults "
+                    "to the timeout of the service."
+                ),
+                null=True,
+                verbose_name="write timeout",
+            ),
+        ),
+    ]
@@ -0,0 +1,94 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("objectsapiclient", "0005_objectsclientconfiguration_timeouts"),
+        ("zgw_consumers", "0016_auto_20220818_1412"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NamedObjectsClientConfiguration",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "objects_timeout",
+                    models.FloatField(
+                        blank=True,
+                        help_text=(
+                            "Timeout in seconds of reading objects (per page), "
+                            "defaults to the timeout of the service."
+                        ),
+                        null=True,
+                        verbose_name="Objects API timeout",
+                    ),
+                ),
+                (
+                    "object_types_timeout",
+                    models.FloatField(
+                        blank=True,
+                        help_text=(
+                            "Timeout in seconds of reading object types and their "
+                            "schemas, defaults to the timeout of the service."
+                        ),
+                        null=True,
+                        verbose_name="Objecttypes API timeout",
+                    ),
+                ),
+                (
+                    "write_timeout",
+                    models.FloatField(
+                        blank=True,
+                        help_text=(
+                            "Timeout in seconds of creating and updating objects, "
+                            "defaults to the timeout of the service."
+                        ),
+                        null=True,
+                        verbose_name="write timeout",
+                    ),
+                ),
+                (
+                    "name",
+                    models.SlugField(
+                        help_text="The name to select this configuration by, in code.",
+                        unique=True,
+                        verbose_name="name",
+                    ),
+                ),
+                (
+                    "object_type_api_service_config",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="zgw_consumers.service",
+                        verbose_name="Objecttypes API service",
+                    ),
+                ),
+                (
+                    "objects_api_service_config",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="zgw_consumers.service",
+                        verbose_name="Objects API service",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "named Objects API client configuration",
+                "verbose_name_plural": "named Objects API client configurations",
+            },
+        ),
+    ]
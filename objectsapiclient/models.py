@@ -1,22 +1,69 @@
 import functools
 import logging
 
-from django.core.cache import cache
 from django.db import OperationalError, ProgrammingError, models
 from django.db.models.fields import BLANK_CHOICE_DASH
 from django.forms.fields import TypedChoiceField
-from django.forms.widgets import Select
+from django.forms.widgets import Select, TextInput
 from django.utils.text import capfirst
 from django.utils.translation import gettext_lazy as _
 
 from solo.models import SingletonModel
 
+from .cache import get_stale_while_revalidate
+from .settings import get_setting
 from .utils import get_object_type_choices
 
 logger = logging.getLogger(__name__)
 
 
-class ObjectsClientConfiguration(SingletonModel):
+class ClientConfiguration(models.Model):
+    """
+    The settings shared by the default and the named client configurations.
+    """
+
+    objects_timeout = models.FloatField(
+        _("Objects API timeout"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Timeout in seconds of reading objects (per page), defaults to the "
+            "timeout of the service."
+        ),
+    )
+    object_types_timeout = models.FloatField(
+        _("Objecttypes API timeout"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Timeout in seconds of reading object types and their schemas, "
+            "defaults to the timeout of the service."
+        ),
+    )
+    write_timeout = models.FloatField(
+        _("write timeout"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Timeout in seconds of creating and updating objects, defaults to the "
+            "timeout of the service."
+        ),
+    )
+
+    class Meta:
+        abstract = True
+
+    # The services are defined by the subclasses, with distinct related names
+    @property
+    def objects_api_service(self):
+        return self.objects_api_service_config
+
+    @property
+    def object_type_api_service(self):
+        return self.object_type_api_service_config
+
+
+class ObjectsClientConfiguration(SingletonModel, ClientConfiguration):
     """
     The Objects API client configuration to retrieve and render forms.
     """
@@ -43,10 +90,133 @@ class ObjectsClientConfiguration(SingletonModel):
         return "Objects API client configuration"
 
 
+class NamedObjectsClientConfiguration(ClientConfiguration):
+    """
+    An additional client configuration, for another Objects API and Objecttypes
+    API, selected by its name.
+    """
+
+    name = models.SlugField(
+        _("name"),
+        unique=True,
+        help_text=_("The name to select this configuration by, in code."),
+    )
+    objects_api_service_config = models.ForeignKey(
+        "zgw_consumers.Service",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Objects API service"),
+    )
+    object_type_api_service_config = models.ForeignKey(
+        "zgw_consumers.Service",
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name=_("Objecttypes API service"),
+    )
+
+    class Meta:
+        verbose_name = _("named Objects API client configuration")
+        verbose_name_plural = _("named Objects API client configurations")
+
+    def __str__(self):
+        return self.name
+
+
+def get_choices_cache_key(configuration: str | None = None) -> str:
+    if configuration is None:
+        return "objectsapiclient_objecttypes"
+    return f"objectsapiclient_objecttypes_{configuration}"
+
+
+def get_uuids_cache_key(configuration: str | None = None) -> str:
+    return f"{get_choices_cache_key(configuration)}_uuids"
+
+
+def get_names_cache_key(configuration: str | None = None) -> str:
+    return f"{get_choices_cache_key(configuration)}_names"
+
+
+def get_cached_object_type_choices(
+    configuration: str | None = None,
+) -> list[tuple[str, str]]:
+    """
+    Return the (cached) index of the object types as ``(uuid, name)`` choices,
+    ordered by name.
+    """
+    return get_stale_while_revalidate(
+        get_choices_cache_key(configuration),
+        functools.partial(get_object_type_choices, configuration=configuration),
+        fresh_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT"),
+        lock_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_REFRESH_LOCK_TIMEOUT"),
+        default=[],
+    )
+
+
+def _get_object_type_uuids(configuration: str | None = None) -> frozenset[str]:
+    return frozenset(
+        uuid for uuid, _ in get_object_type_choices(configuration=configuration)
+    )
+
+
+def get_cached_object_type_uuids(configuration: str | None = None) -> frozenset[str]:
+    """
+    Return the (cached) set of object type UUIDs, to validate a stored value
+    without loading the choices.
+    """
+    return get_stale_while_revalidate(
+        get_uuids_cache_key(configuration),
+        functools.partial(_get_object_type_uuids, configuration=configuration),
+        fresh_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT"),
+        lock_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_REFRESH_LOCK_TIMEOUT"),
+        default=frozenset(),
+    )
+
+
+def _get_object_type_names(configuration: str | None = None) -> dict[str, str]:
+    return dict(get_object_type_choices(configuration=configuration))
+
+
+def get_cached_object_type_names(configuration: str | None = None) -> dict[str, str]:
+    """
+    Return the (cached) names of the object types by UUID, to render a stored
+    value without loading the choices.
+    """
+    return get_stale_while_revalidate(
+        get_names_cache_key(configuration),
+        functools.partial(_get_object_type_names, configuration=configuration),
+        fresh_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT"),
+        lock_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_REFRESH_LOCK_TIMEOUT"),
+        default={},
+    )
+
+
 class ObjectTypeField(models.SlugField):
+    """
+    Stores the UUID of an object type, offering the object types of the Objects
+    API client configuration as choices.
+
+    :param configuration: The name of the
+        :class:`NamedObjectsClientConfiguration` to use, instead of the singleton
+        configuration.
+    :param autocomplete: Use a searchable, paginated autocomplete widget instead
+        of a select with all object types.
+    """
+
     def __init__(
-        self, *args, max_length=100, db_index=False, allow_unicode=False, **kwargs
+        self,
+        *args,
+        max_length=100,
+        db_index=False,
+        allow_unicode=False,
+        configuration: str | None = None,
+        autocomplete: bool = False,
+        **kwargs,
     ):
+        self.configuration = configuration
+        self.autocomplete = autocomplete
         super().__init__(
             *args,
             max_length=max_length,
@@ -55,15 +225,44 @@ class ObjectTypeField(models.SlugField):
             **kwargs,
         )
 
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.configuration is not None:
+            kwargs["configuration"] = self.configuration
+        if self.autocomplete:
+            kwargs["autocomplete"] = True
+        return name, path, args, kwargs
+
+    @property
+    def choices_cache_key(self) -> str:
+        return get_choices_cache_key(self.configuration)
+
     def formfield(self, **kwargs):
+        # The admin passes its text input for slug fields, which would replace the
+        # select or autocomplete widget
+        widget = kwargs.get("widget")
+        if widget is not None and issubclass(
+            widget if isinstance(widget, type) else type(widget), TextInput
+        ):
+            del kwargs["widget"]
+
         defaults = {
             "required": not self.blank,
             "label": capfirst(self.verbose_name),
             "help_text": self.help_text,
-            "choices": functools.partial(self.get_choices, include_blank=self.blank),
-            "coerce": self.to_python,
-            "widget": Select,
         }
+        if self.autocomplete:
+            from .forms import ObjectTypeAutocompleteField
+
+            defaults.update(configuration=self.configuration, **kwargs)
+            return ObjectTypeAutocompleteField(**defaults)
+
+        defaults.update(
+            choices=functools.partial(self.get_choices, include_blank=self.blank),
+            coerce=self.to_python,
+            widget=Select,
+        )
+        defaults.update(kwargs)
         return TypedChoiceField(**defaults)
 
     def get_choices(
@@ -73,17 +272,7 @@ class ObjectTypeField(models.SlugField):
         limit_choices_to=None,
         ordering=(),
     ):
-        cache_key = "objectsapiclient_objecttypes"
-
-        choices = cache.get(cache_key)
-        if choices is None:
-            try:
-                choices = get_object_type_choices()
-            except Exception as e:
-                logger.exception(e)
-                choices = []
-            else:
-                cache.set(cache_key, choices, timeout=60)
+        choices = get_cached_object_type_choices(self.configuration)
 
         if choices:
             if include_blank:
@@ -114,7 +303,12 @@ class LazyObjectTypeField(ObjectTypeField):
         # Check if database table exists (migrations have been run)
         # Prevents errors during startup before migrations are applied
         try:
-            config = ObjectsClientConfiguration.get_solo()
+            if self.configuration is None:
+                config = ObjectsClientConfiguration.get_solo()
+            else:
+                config = NamedObjectsClientConfiguration.objects.filter(
+                    name=self.configuration
+                ).first()
         except (ProgrammingError, OperationalError):
             logger.info(
                 "objectsapiclient_configuration table does not exist yet, "
@@ -126,7 +320,11 @@ class LazyObjectTypeField(ObjectTypeField):
 
         # Check if Objects API services are configured
         # Prevents HTTP requests when services aren't set up
-        if not config.objects_api_service or not config.object_type_api_service:
+        if (
+            not config
+            or not config.objects_api_service
+            or not config.object_type_api_service
+        ):
             logger.info(
                 "Objects API services not configured, skipping objecttypes fetch"
             )
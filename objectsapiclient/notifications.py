@@ -0,0 +1,104 @@
+"""
+Invalidate cached data when the Notifications API reports changes in the Objects
+API or Objecttypes API.
+"""
+
+import logging
+from urllib.parse import urlsplit
+
+from django.core.cache import cache
+
+from .cache import expire_stale_while_revalidate
+from .client import get_response_cache_key
+from .models import (
+    ClientConfiguration,
+    NamedObjectsClientConfiguration,
+    ObjectsClientConfiguration,
+    get_choices_cache_key,
+    get_names_cache_key,
+    get_uuids_cache_key,
+)
+from .signals import object_changed
+
+logger = logging.getLogger(__name__)
+
+OBJECT_RESOURCES = ("object",)
+OBJECT_TYPE_RESOURCES = ("objecttype", "objectversion")
+
+
+def handle_notification(message: dict) -> None:
+    """
+    Handle a notification (``kanaal``, ``resource``, ``resourceUrl``, ``actie``
+    and ``kenmerken``) of the Notifications API.
+
+    A changed Object is removed from the response cache and the
+    :data:`objectsapiclient.signals.object_changed` signal is sent. For a changed
+    object type, the choices and UUIDs of the configurations using its Objecttypes
+    API are marked stale, so they are refreshed in the background.
+    """
+    resource = message.get("resource")
+    resource_url = message.get("resourceUrl") or ""
+
+    if resource in OBJECT_RESOURCES:
+        _invalidate_object(
+            resource_url,
+            object_type_url=(message.get("kenmerken") or {}).get("objectType", ""),
+            action=message.get("actie", ""),
+        )
+    elif resource in OBJECT_TYPE_RESOURCES:
+        _invalidate_object_type(resource_url)
+    else:
+        logger.debug("Ignoring notification about %s %s", resource, resource_url)
+
+
+def _invalidate_object(url: str, object_type_url: str, action: str) -> None:
+    url = url.rstrip("/")
+    cache.delete_many(
+        [
+            get_response_cache_key(object_url, config.objects_api_service_config)
+            for _, config in _get_configurations_for_url(
+                url, "objects_api_service_config"
+            )
+            for object_url in (url, f"{url}/")
+        ]
+    )
+    object_changed.send(
+        sender=None,
+        url=url,
+        uuid=urlsplit(url).path.rsplit("/", 1)[-1],
+        object_type_url=object_type_url,
+        action=action,
+    )
+
+
+def _invalidate_object_type(url: str) -> None:
+    for configuration, _ in _get_configurations_for_url(
+        url, "object_type_api_service_config"
+    ):
+        expire_stale_while_revalidate(get_choices_cache_key(configuration))
+        expire_stale_while_revalidate(get_uuids_cache_key(configuration))
+        expire_stale_while_revalidate(get_names_cache_key(configuration))
+
+
+def _get_configurations_for_url(
+    url: str, service_field: str
+) -> list[tuple[str | None, ClientConfiguration]]:
+    """
+    Return the names and configurations of which the service in ``service_field``
+    is the API of ``url``.
+    """
+    configurations = [
+        (None, ObjectsClientConfiguration.get_solo()),
+        *(
+            (config.name, config)
+            for config in NamedObjectsClientConfiguration.objects.select_related(
+                service_field
+            )
+        ),
+    ]
+    return [
+        (name, config)
+        for name, config in configurations
+        if (service := getattr(config, service_field))
+        and url.startswith(service.api_root)
+    ]
@@ -0,0 +1,70 @@
+import datetime
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+DATA_ATTR_OPERATORS = ("exact", "gt", "gte", "lt", "lte", "icontains", "in")
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return "|".join(_format_value(item) for item in value)
+    return str(value)
+
+
+def build_objects_params(
+    type_url: str | None = None,
+    page_size: int | None = None,
+    data_attrs: Sequence[tuple[str, str, Any]] | None = None,
+    data_icontains: str | None = None,
+    date: datetime.date | None = None,
+    registration_date: datetime.date | None = None,
+    fields: Iterable[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Build the query parameters to filter Objects in the Objects API.
+
+    :param type_url: Only include Objects of this ObjectType URL.
+    :param page_size: The number of Objects per page.
+    :param data_attrs: Filter on values in the record data, as ``(path, operator,
+        value)`` tuples. Nested keys in the path are separated by ``__`` and the
+        value of the ``in`` operator may be a sequence.
+    :param data_icontains: Only include Objects containing this text in any of
+        the values of the record data.
+    :param date: Only include Objects of which the record was valid on this date.
+    :param registration_date: Only include Objects of which the record was
+        registered on this date.
+    :param fields: Only include these fields in the response, for example
+        ``["uuid", "record__data__name"]``.
+    """
+    params = {}
+    if type_url:
+        params["type"] = type_url
+    if page_size:
+        params["pageSize"] = page_size
+
+    if data_attrs:
+        filters = []
+        for path, operator, value in data_attrs:
+            if operator not in DATA_ATTR_OPERATORS:
+                raise ValueError(
+                    f"Unknown data_attrs operator {operator!r}, expected one of "
+                    f"{', '.join(DATA_ATTR_OPERATORS)}"
+                )
+            value = _format_value(value)
+            if "," in value:
+                raise ValueError("Values in data_attrs cannot contain a comma")
+            filters.append(f"{path}__{operator}__{value}")
+        params["data_attrs"] = ",".join(filters)
+
+    if data_icontains:
+        params["data_icontains"] = data_icontains
+    if date:
+        params["date"] = _format_value(date)
+    if registration_date:
+        params["registrationDate"] = _format_value(registration_date)
+    if fields:
+        params["fields"] = ",".join(fields)
+
+    return params
@@ -0,0 +1,32 @@
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from zgw_consumers.models import Service
+
+from .cache import tiered_cache
+from .client import Client
+from .health import clear_cached_health
+from .models import NamedObjectsClientConfiguration, ObjectsClientConfiguration
+
+
+@receiver([post_save, post_delete], sender=ObjectsClientConfiguration)
+@receiver([post_save, post_delete], sender=NamedObjectsClientConfiguration)
+def invalidate_shared_client(sender, **kwargs):
+    Client.invalidate_shared()
+    tiered_cache.invalidate()
+    clear_cached_health()
+
+
+# Deleting a service deletes (and so invalidates) its configurations
+@receiver(post_save, sender=Service)
+def invalidate_shared_client_of_service(sender, instance, **kwargs):
+    # Saving another service keeps the cached (stale) values to fall back on
+    linked = Q(objects_api_service_config=instance) | Q(
+        object_type_api_service_config=instance
+    )
+    if (
+        ObjectsClientConfiguration.objects.filter(linked).exists()
+        or NamedObjectsClientConfiguration.objects.filter(linked).exists()
+    ):
+        invalidate_shared_client(sender, **kwargs)
@@ -0,0 +1,40 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from requests import Response
+
+# Responses to retry idempotent requests: the request failed or was not
+# processed (yet)
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Responses to retry non-idempotent requests: the request was rejected before it
+# was processed. A gateway error (502, 504) may follow a processed request.
+RETRY_NOT_PROCESSED_STATUS_CODES = frozenset({429, 503})
+
+
+def get_retry_after(response: Response) -> float | None:
+    """
+    Return the seconds to wait according to the ``Retry-After`` header, if any.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def get_backoff(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Return an exponential backoff with full jitter for the (zero-based) attempt.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
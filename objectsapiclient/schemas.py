@@ -0,0 +1,104 @@
+import hashlib
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin
+
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+from .cache import tiered_cache
+from .settings import get_setting
+from .utils import Coalescer
+
+if TYPE_CHECKING:
+    from .client import Client
+
+PUBLISHED = "published"
+
+
+class SchemaRegistry:
+    """
+    The JSON schemas of object type versions, keyed by object type UUID and version.
+
+    The schemas of published versions do not change, so they are fetched once,
+    stored in the Django cache and compiled once into a reusable validator. The
+    schemas of draft versions can still change, so they are fetched again after
+    ``OBJECTSAPICLIENT_DRAFT_SCHEMA_TIMEOUT`` seconds, and only recompiled if
+    they changed. Requires ``jsonschema``.
+    """
+
+    def __init__(self, client: "Client"):
+        self.client = client
+        self._validators: dict[tuple[str, int], Validator] = {}
+        # The validators of draft versions, with their schema and expiry time
+        self._draft_validators: dict[
+            tuple[str, int], tuple[Validator, dict, float]
+        ] = {}
+        self._in_flight = Coalescer()
+
+    def version_url(self, object_type_uuid, version: int) -> str:
+        return urljoin(
+            self.client.object_types.base_url,
+            f"objecttypes/{object_type_uuid}/versions/{version}",
+        )
+
+    def get_schema(self, object_type_uuid, version: int) -> tuple[dict, bool]:
+        """
+        Return the JSON schema of an object type version, and whether the version
+        is published.
+        """
+        url = self.version_url(object_type_uuid, version)
+        cache_key = "objectsapiclient_schema_{}".format(
+            hashlib.sha256(url.encode()).hexdigest()
+        )
+        if (schema := tiered_cache.get(cache_key)) is not None:
+            return schema, True
+
+        data = self.client._get_json(
+            self.client.object_types,
+            url,
+            endpoint="objecttypes/{uuid}/versions/{version}",
+        )
+        schema = data.get("jsonSchema") or {}
+        published = data.get("status") == PUBLISHED
+        if published:
+            tiered_cache.set(
+                cache_key,
+                schema,
+                timeout=get_setting("OBJECTSAPICLIENT_SCHEMA_CACHE_TIMEOUT"),
+            )
+        return schema, published
+
+    def get_validator(self, object_type_uuid, version: int) -> Validator:
+        """
+        Return a compiled validator for the JSON schema of an object type version.
+        """
+        key = (str(object_type_uuid), int(version))
+        if (validator := self._validators.get(key)) is not None:
+            return validator
+        draft = self._draft_validators.get(key)
+        if draft is not None and draft[2] > time.monotonic():
+            return draft[0]
+
+        return self._in_flight.call(key, lambda: self._compile(*key))
+
+    def _compile(self, object_type_uuid: str, version: int) -> Validator:
+        key = (object_type_uuid, version)
+        schema, published = self.get_schema(object_type_uuid, version)
+
+        draft = self._draft_validators.pop(key, None)
+        if draft is not None and draft[1] == schema:
+            validator = draft[0]
+        else:
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            validator = cls(schema, format_checker=cls.FORMAT_CHECKER)
+
+        if published:
+            self._validators[key] = validator
+        else:
+            expires_at = time.monotonic() + get_setting(
+                "OBJECTSAPICLIENT_DRAFT_SCHEMA_TIMEOUT"
+            )
+            self._draft_validators[key] = (validator, schema, expires_at)
+        return validator
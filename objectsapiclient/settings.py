@@ -0,0 +1,70 @@
+from django.conf import settings
+
+# Seconds the cached objecttype choices are considered fresh
+OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT = 60
+# Seconds stale objecttype choices are still served while being refreshed
+OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT = 60 * 60 * 24
+# Seconds a background refresh holds its lock, which also limits how often a
+# failing refresh is retried
+OBJECTSAPICLIENT_CHOICES_REFRESH_LOCK_TIMEOUT = 30
+
+# Seconds the object type choices and UUIDs, schemas and status of the APIs
+# cached in the Django cache are also kept in the memory of each process, set to 0
+# to disable
+OBJECTSAPICLIENT_LOCAL_CACHE_TIMEOUT = 5
+# Maximum number of values kept in the memory of each process
+OBJECTSAPICLIENT_LOCAL_CACHE_MAX_SIZE = 256
+
+# Seconds responses of the Objecttypes API with an ETag are cached for conditional
+# requests, set to 0 to disable
+OBJECTSAPICLIENT_RESPONSE_CACHE_TIMEOUT = 60 * 60 * 24
+# Cache the responses of the Objects API as well, which stores every page of the
+# object lists that are retrieved
+OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS = False
+
+# Seconds the JSON schemas of published object type versions are cached, None
+# caches them indefinitely
+OBJECTSAPICLIENT_SCHEMA_CACHE_TIMEOUT = None
+# Seconds the JSON schemas of draft object type versions are used before they
+# are fetched again, to see if they changed
+OBJECTSAPICLIENT_DRAFT_SCHEMA_TIMEOUT = 5
+
+# Number of retries of idempotent requests that failed with a connection error,
+# a timeout or a 429/502/503/504 response
+OBJECTSAPICLIENT_MAX_RETRIES = 2
+# Maximum seconds to wait before a retry; a longer Retry-After is not waited for
+OBJECTSAPICLIENT_MAX_RETRY_DELAY = 5
+
+# Failures within the window after which requests to an API fail fast, set to 0
+# to disable the circuit breaker
+OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD = 5
+# Seconds in which failures are counted
+OBJECTSAPICLIENT_CIRCUIT_BREAKER_WINDOW = 60
+# Seconds requests fail fast once the circuit breaker is open
+OBJECTSAPICLIENT_CIRCUIT_BREAKER_RESET_TIMEOUT = 30
+
+# Warm up the caches and connection pools in the background when a process
+# handles its first request
+OBJECTSAPICLIENT_WARMUP_ON_STARTUP = False
+# Object lists to retrieve when warming up, as keyword arguments of
+# Client.get_objects, with an optional "configuration" name. Requires
+# OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS.
+OBJECTSAPICLIENT_WARMUP_OBJECTS = []
+# Seconds after a warmup on startup during which other processes only open
+# their connections
+OBJECTSAPICLIENT_WARMUP_LOCK_TIMEOUT = 300
+
+# The Authorization header value the Notifications API sends to the webhook, as
+# configured in its subscription (abonnement). The webhook is disabled if empty.
+OBJECTSAPICLIENT_NOTIFICATIONS_AUTHORIZATION = ""
+
+# Seconds the status of the APIs is cached before it is checked again in the
+# background
+OBJECTSAPICLIENT_HEALTH_CHECK_CACHE_TIMEOUT = 60
+# Timeout in seconds of the requests checking the status of the APIs
+OBJECTSAPICLIENT_HEALTH_CHECK_TIMEOUT = 5
+
+
+def get_setting(name: str):
+    default = globals()[name]
+    return getattr(settings, name, default)
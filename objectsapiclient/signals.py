@@ -0,0 +1,10 @@
+from django.dispatch import Signal
+
+# Sent after every request to the Objects API or Objecttypes API, with an
+# ``event`` argument: a :class:`objectsapiclient.instrumentation.RequestEvent`.
+api_request = Signal()
+
+# Sent when a notification about a changed Object is received, with the ``url``
+# and ``uuid`` of the Object, the ``object_type_url`` and the ``action``
+# (``create``, ``update``, ``partial_update`` or ``destroy``).
+object_changed = Signal()
@@ -0,0 +1,18 @@
+from django.urls import path
+
+from .views import NotificationsWebhookView, ObjectTypeAutocompleteView
+
+app_name = "objectsapiclient"
+
+urlpatterns = [
+    path(
+        "notifications/",
+        NotificationsWebhookView.as_view(),
+        name="notifications-webhook",
+    ),
+    path(
+        "objecttypes/autocomplete/",
+        ObjectTypeAutocompleteView.as_view(),
+        name="objecttype-autocomplete",
+    ),
+]
@@ -1,18 +1,57 @@
 import logging
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-def get_object_type_choices(use_uuids=False):
+def get_object_type_choices(use_uuids=False, configuration: str | None = None):
     from .client import Client
 
-    client = Client()
-    if not client:
-        return []
+    client = Client.shared(configuration)
 
     objecttypes = client.get_object_types()
 
+    return object_types_to_choices(objecttypes)
+
+
+def object_types_to_choices(objecttypes) -> list[tuple[str, str]]:
     return sorted(
         [(item.uuid, item.name) for item in objecttypes],
         key=lambda entry: entry[1],
     )
+
+
+class Coalescer:
+    """
+    Coalesce identical concurrent calls: while a call for a key is in flight,
+    other threads calling with the same key wait for and share its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def call(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._in_flight[key] = Future()
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
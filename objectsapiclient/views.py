@@ -0,0 +1,89 @@
+import hmac
+import json
+import logging
+
+from django.core.paginator import Paginator
+from django.http import HttpResponse, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from .models import NamedObjectsClientConfiguration, get_cached_object_type_choices
+from .notifications import handle_notification
+from .settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class NotificationsWebhookView(View):
+    """
+    Receive notifications of the Notifications API, to invalidate cached data.
+
+    Subscribe to the ``objecten`` channel (and ``objecttypen``, if available) with
+    the URL of this view and the Authorization header value of
+    ``OBJECTSAPICLIENT_NOTIFICATIONS_AUTHORIZATION``.
+    """
+
+    http_method_names = ["post"]
+
+    def post(self, request, *args, **kwargs):
+        expected = get_setting("OBJECTSAPICLIENT_NOTIFICATIONS_AUTHORIZATION")
+        received = request.headers.get("Authorization", "")
+        if not expected or not hmac.compare_digest(
+            received.encode(), expected.encode()
+        ):
+            return JsonResponse({"detail": "Not authorized"}, status=403)
+
+        try:
+            message = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({"detail": "Invalid JSON"}, status=400)
+        if not isinstance(message, dict):
+            return JsonResponse({"detail": "Invalid notification"}, status=400)
+
+        handle_notification(message)
+        return HttpResponse(status=204)
+
+
+class ObjectTypeAutocompleteView(View):
+    """
+    Search the cached object types by name, for
+    :class:`objectsapiclient.forms.ObjectTypeAutocompleteWidget`.
+
+    Takes the ``term``, ``page`` and (optionally) ``configuration`` query
+    parameters, and returns the results in the format of select2.
+    """
+
+    http_method_names = ["get"]
+    paginate_by = 20
+
+    def get(self, request, *args, **kwargs):
+        if not request.user.is_staff:
+            return JsonResponse({"detail": "Not authorized"}, status=403)
+
+        configuration = request.GET.get("configuration") or None
+        if (
+            configuration is not None
+            and not NamedObjectsClientConfiguration.objects.filter(
+                name=configuration
+            ).exists()
+        ):
+            return JsonResponse({"detail": "Unknown configuration"}, status=404)
+
+        term = request.GET.get("term", "").strip().casefold()
+        object_types = [
+            (uuid, name)
+            for uuid, name in get_cached_object_type_choices(configuration)
+            if term in name.casefold()
+        ]
+        page = Paginator(object_types, self.paginate_by).get_page(
+            request.GET.get("page")
+        )
+
+        return JsonResponse(
+            {
+                "results": [{"id": uuid, "text": name} for uuid, name in page],
+                "pagination": {"more": page.has_next()},
+            }
+        )
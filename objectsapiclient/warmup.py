@@ -0,0 +1,157 @@
+"""
+Warm up the caches and connection pools after a deploy, so the first requests
+do not pay for them.
+"""
+
+import logging
+from collections.abc import Iterable
+from importlib.util import find_spec
+
+from django.core.cache import cache
+from django.core.signals import request_started
+
+from zgw_consumers.concurrent import parallel
+
+from .cache import _run_in_background, set_stale_while_revalidate
+from .client import Client
+from .models import (
+    NamedObjectsClientConfiguration,
+    ObjectsClientConfiguration,
+    get_choices_cache_key,
+    get_names_cache_key,
+    get_uuids_cache_key,
+)
+from .settings import get_setting
+from .utils import object_types_to_choices
+
+logger = logging.getLogger(__name__)
+
+WARMUP_LOCK_KEY = "objectsapiclient_warmup_lock"
+WARMUP_DISPATCH_UID = "objectsapiclient_warmup"
+
+
+def get_configurations() -> list[str | None]:
+    """
+    Return the names of all complete configurations, ``None`` being the singleton
+    configuration.
+    """
+    config = ObjectsClientConfiguration.get_solo()
+    names: list[str | None] = []
+    if config.objects_api_service_config and config.object_type_api_service_config:
+        names.append(None)
+    names += NamedObjectsClientConfiguration.objects.values_list("name", flat=True)
+    return names
+
+
+def warm_shared_cache(
+    client: Client, configuration: str | None = None, max_workers: int = 4
+) -> None:
+    """
+    Retrieve the object types, their choices, UUIDs and names and the schemas of
+    their latest versions, and the object lists of
+    ``OBJECTSAPICLIENT_WARMUP_OBJECTS``, into the Django cache.
+
+    The object lists are only cached with ``OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS``,
+    and if the Objects API sends an ``ETag``.
+    """
+    object_types = client.get_object_types()
+    set_stale_while_revalidate(
+        get_choices_cache_key(configuration),
+        object_types_to_choices(object_types),
+        fresh_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT"),
+    )
+    set_stale_while_revalidate(
+        get_uuids_cache_key(configuration),
+        frozenset(object_type.uuid for object_type in object_types),
+        fresh_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT"),
+    )
+    set_stale_while_revalidate(
+        get_names_cache_key(configuration),
+        {object_type.uuid: object_type.name for object_type in object_types},
+        fresh_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_CACHE_TIMEOUT"),
+        stale_timeout=get_setting("OBJECTSAPICLIENT_CHOICES_STALE_TIMEOUT"),
+    )
+
+    def warm_schema(object_type):
+        latest_version = max(
+            int(url.rstrip("/").rsplit("/", 1)[-1]) for url in object_type.versions
+        )
+        try:
+            client.schemas.get_validator(object_type.uuid, latest_version)
+        except Exception:
+            logger.exception("Failed to retrieve the schema of %s", object_type.url)
+
+    # The schema registry requires jsonschema
+    if find_spec("jsonschema"):
+        versioned = [type_ for type_ in object_types if type_.versions]
+        with parallel(max_workers=max_workers) as executor:
+            list(executor.map(warm_schema, versioned))
+
+    warmup_objects = get_setting("OBJECTSAPICLIENT_WARMUP_OBJECTS")
+    if warmup_objects and not get_setting("OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS"):
+        logger.warning(
+            "OBJECTSAPICLIENT_WARMUP_OBJECTS is ignored, as the responses of the "
+            "Objects API are not cached without OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS"
+        )
+        return
+
+    for filters in warmup_objects:
+        filters = dict(filters)
+        if filters.pop("configuration", None) == configuration:
+            client.get_objects(**filters)
+
+
+def warm_up(
+    configurations: Iterable[str | None] | None = None, shared_cache: bool = True
+) -> list[str | None]:
+    """
+    Open the connections of the shared clients and, if ``shared_cache``, fill the
+    Django cache, for the given or all configurations.
+
+    :returns: Returns the configurations that failed to warm up
+    """
+    if configurations is None:
+        configurations = get_configurations()
+
+    failed = []
+    for configuration in configurations:
+        try:
+            client = Client.shared(configuration)
+            client.open_connections()
+            if shared_cache:
+                warm_shared_cache(client, configuration)
+        except Exception:
+            logger.exception(
+                "Failed to warm up the configuration %s", configuration or "(default)"
+            )
+            failed.append(configuration)
+    return failed
+
+
+def warm_up_on_startup() -> None:
+    """
+    Warm up this process. The Django cache is only filled by the first process
+    starting within ``OBJECTSAPICLIENT_WARMUP_LOCK_TIMEOUT`` seconds.
+    """
+    try:
+        shared_cache = cache.add(
+            WARMUP_LOCK_KEY,
+            True,
+            timeout=get_setting("OBJECTSAPICLIENT_WARMUP_LOCK_TIMEOUT"),
+        )
+        warm_up(shared_cache=shared_cache)
+    except Exception:
+        # for example when the database is not migrated yet
+        logger.exception("Failed to warm up the Objects API client")
+
+
+def warm_up_on_first_request(**kwargs) -> None:
+    """
+    Warm up this process in the background once it handles its first request,
+    connected to ``request_started`` with ``OBJECTSAPICLIENT_WARMUP_ON_STARTUP``.
+    """
+    # Only the thread that disconnects the receiver warms up
+    if request_started.disconnect(dispatch_uid=WARMUP_DISPATCH_UID):
+        _run_in_background(warm_up_on_startup)
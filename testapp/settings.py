@@ -22,6 +22,7 @@ INSTALLED_APPS = [
     "simple_certmanager",
     "zgw_consumers",
     "objectsapiclient",
+    "objectsapiclient.contrib.mirror",
     "testapp",
 ]
 
@@ -2,12 +2,13 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
-from django.urls import path
+from django.urls import include, path
 
 from .views import IndexView, PageView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("objectsapiclient/", include("objectsapiclient.urls")),
     path("page/<slug:slug>", PageView.as_view(), name="page"),
     path("", IndexView.as_view()),
 ]
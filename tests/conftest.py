@@ -0,0 +1,91 @@
+from django.core.cache import cache
+
+import pytest
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from objectsapiclient.cache import tiered_cache
+from objectsapiclient.circuit_breaker import CircuitBreaker
+from objectsapiclient.models import ObjectsClientConfiguration
+
+OBJECTS_API_ROOT = "https://objects.example.com/api/v2/"
+OBJECTTYPES_API_ROOT = "https://objecttypes.example.com/api/v2/"
+OBJECT_TYPE_UUID = "3f5b1c2e-6f36-4c1b-a0a5-6c3c2f0e9b11"
+
+
+def make_object(index: int, object_type_uuid: str = OBJECT_TYPE_UUID) -> dict:
+    return {
+        "url": f"{OBJECTS_API_ROOT}objects/uuid-{index}",
+        "uuid": f"uuid-{index}",
+        "type": f"{OBJECTTYPES_API_ROOT}objecttypes/{object_type_uuid}",
+        "record": {"index": 1, "typeVersion": 1, "data": {"title": f"#{index}"}},
+    }
+
+
+def make_object_type(uuid: str, name: str) -> dict:
+    return {
+        "url": f"{OBJECTTYPES_API_ROOT}objecttypes/{uuid}",
+        "uuid": uuid,
+        "name": name,
+        "namePlural": f"{name}s",
+        "description": "",
+        "dataClassification": "open",
+        "maintainerOrganization": "",
+        "maintainerDepartment": "",
+        "contactPerson": "",
+        "contactEmail": "",
+        "source": "",
+        "updateFrequency": "unknown",
+        "providerOrganization": "",
+        "documentationUrl": "",
+        "labels": {},
+        "createdAt": "2025-01-01",
+        "modifiedAt": "2025-01-01",
+        "allowGeometry": True,
+        "versions": [f"{OBJECTTYPES_API_ROOT}objecttypes/{uuid}/versions/1"],
+    }
+
+
+@pytest.fixture
+def config():
+    """An (unsaved) client configuration pointing to both example APIs."""
+    return ObjectsClientConfiguration(
+        objects_api_service_config=Service(
+            label="Objects API",
+            api_type=APITypes.orc,
+            api_root=OBJECTS_API_ROOT,
+            auth_type=AuthTypes.no_auth,
+        ),
+        object_type_api_service_config=Service(
+            label="Objecttypes API",
+            api_type=APITypes.orc,
+            api_root=OBJECTTYPES_API_ROOT,
+            auth_type=AuthTypes.no_auth,
+        ),
+    )
+
+
+@pytest.fixture
+def clear_cache():
+    """Clear cache before each test to ensure clean state."""
+    cache.clear()
+    tiered_cache.clear_local()
+    yield
+    cache.clear()
+    tiered_cache.clear_local()
+
+
+@pytest.fixture(autouse=True)
+def clear_local_cache():
+    """Prevent values kept in memory in one test from being used in another."""
+    yield
+    tiered_cache.clear_local()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Prevent failures recorded in one test from failing requests in another."""
+    yield
+    for api_root in (OBJECTS_API_ROOT, OBJECTTYPES_API_ROOT):
+        breaker = CircuitBreaker(api_root)
+        cache.delete_many([breaker.open_key, breaker.failures_key])
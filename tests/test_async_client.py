@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+import pytest
+
+from .conftest import (
+    OBJECTS_API_ROOT,
+    OBJECTTYPES_API_ROOT,
+    make_object,
+    make_object_type,
+)
+
+httpx = pytest.importorskip("httpx")
+
+from objectsapiclient.async_client import AsyncClient  # noqa: E402
+
+
+def make_client(config, routes: dict[str, dict]) -> AsyncClient:
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method == "HEAD":
+            return httpx.Response(200)
+        return httpx.Response(200, content=json.dumps(routes[str(request.url)]))
+
+    client = AsyncClient(config, transport=httpx.MockTransport(handler))
+    client.requests = requests
+    return client
+
+
+class TestAsyncClient:
+    def test_get_objects_follows_next_links(self, config):
+        objects_url = f"{OBJECTS_API_ROOT}objects"
+        client = make_client(
+            config,
+            {
+                objects_url: {
+                    "next": f"{objects_url}?page=2",
+                    "results": [make_object(1)],
+                },
+                f"{objects_url}?page=2": {"next": None, "results": [make_object(2)]},
+            },
+        )
+
+        async def run():
+            async with client:
+                return await client.get_objects()
+
+        objects = asyncio.run(run())
+
+        assert [obj.uuid for obj in objects] == ["uuid-1", "uuid-2"]
+
+    def test_gather_lookups(self, config):
+        uuids = ("a", "b", "c")
+        client = make_client(
+            config,
+            {
+                str(
+                    httpx.URL(
+                        f"{OBJECTS_API_ROOT}objects",
+                        params={"type": f"{OBJECTTYPES_API_ROOT}objecttypes/{uuid}/"},
+                    )
+                ): {"next": None, "results": [make_object(index, uuid)]}
+                for index, uuid in enumerate(uuids)
+            },
+        )
+
+        async def run():
+            async with client:
+                return await asyncio.gather(
+                    *(client.get_objects(uuid) for uuid in uuids)
+                )
+
+        results = asyncio.run(run())
+
+        assert [[obj.uuid for obj in objects] for objects in results] == [
+            ["uuid-0"],
+            ["uuid-1"],
+            ["uuid-2"],
+        ]
+
+    def test_get_object_types(self, config):
+        client = make_client(
+            config,
+            {
+                f"{OBJECTTYPES_API_ROOT}objecttypes": {
+                    "results": [make_object_type("type-1", "Type 1")]
+                }
+            },
+        )
+
+        object_types = asyncio.run(client.get_object_types())
+
+        assert object_types[0].name == "Type 1"
+
+    def test_is_healthy(self, config):
+        client = make_client(config, {})
+
+        assert asyncio.run(client.is_healthy()) == (True, "")
+        assert client.requests[0].method == "HEAD"
@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+from django.contrib.admin.widgets import AdminTextInputWidget
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+
+import pytest
+
+from objectsapiclient.forms import (
+    ObjectTypeAutocompleteField,
+    ObjectTypeAutocompleteWidget,
+)
+from objectsapiclient.models import ObjectTypeField
+
+CHOICES = [(f"uuid-{index}", f"Type {index:02}") for index in range(1, 26)]
+
+
+@pytest.fixture(autouse=True)
+def object_type_choices(clear_cache):
+    with patch(
+        "objectsapiclient.models.get_object_type_choices", return_value=CHOICES
+    ) as mock_get_choices:
+        yield mock_get_choices
+
+
+@pytest.mark.django_db
+class TestObjectTypeAutocompleteView:
+    url = reverse("objectsapiclient:objecttype-autocomplete")
+
+    def test_search_by_name(self, admin_client):
+        response = admin_client.get(self.url, {"term": "type 1"})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [
+                {"id": f"uuid-{index}", "text": f"Type {index:02}"}
+                for index in range(10, 20)
+            ],
+            "pagination": {"more": False},
+        }
+
+    def test_paginated(self, admin_client):
+        first = admin_client.get(self.url).json()
+        second = admin_client.get(self.url, {"page": 2}).json()
+
+        assert len(first["results"]) == 20
+        assert first["pagination"] == {"more": True}
+        assert [result["id"] for result in second["results"]] == [
+            f"uuid-{index}" for index in range(21, 26)
+        ]
+        assert second["pagination"] == {"more": False}
+
+    def test_uses_cached_index(self, admin_client, object_type_choices):
+        admin_client.get(self.url, {"term": "1"})
+        admin_client.get(self.url, {"term": "2"})
+
+        object_type_choices.assert_called_once_with(configuration=None)
+
+    def test_unknown_configuration(self, admin_client):
+        response = admin_client.get(self.url, {"configuration": "unknown"})
+
+        assert response.status_code == 404
+
+    def test_staff_only(self, client):
+        response = client.get(self.url)
+
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestObjectTypeAutocompleteField:
+    def test_formfield(self):
+        formfield = ObjectTypeField(
+            autocomplete=True, configuration="tenant"
+        ).formfield()
+
+        assert isinstance(formfield, ObjectTypeAutocompleteField)
+        assert formfield.widget.get_url() == (
+            "/objectsapiclient/objecttypes/autocomplete/?configuration=tenant"
+        )
+
+    def test_formfield_kwargs(self):
+        formfield = ObjectTypeField(autocomplete=True).formfield(
+            label="Type", disabled=True, widget=AdminTextInputWidget
+        )
+
+        assert formfield.label == "Type"
+        assert formfield.disabled
+        assert isinstance(formfield.widget, ObjectTypeAutocompleteWidget)
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = ObjectTypeField(autocomplete=True).deconstruct()
+
+        assert kwargs["autocomplete"] is True
+
+    def test_valid(self):
+        field = ObjectTypeAutocompleteField()
+
+        assert field.clean("uuid-3") == "uuid-3"
+
+    def test_invalid(self):
+        field = ObjectTypeAutocompleteField()
+
+        with pytest.raises(ValidationError) as exc_info:
+            field.clean("uuid-unknown")
+
+        assert exc_info.value.code == "invalid_choice"
+
+    def test_validated_against_cached_uuids(self, object_type_choices):
+        field = ObjectTypeAutocompleteField()
+        field.clean("uuid-1")
+        field.clean("uuid-2")
+
+        object_type_choices.assert_called_once()
+        assert cache.get("objectsapiclient_objecttypes_uuids") == frozenset(
+            uuid for uuid, _ in CHOICES
+        )
+        # the choices are not loaded to validate the value
+        assert cache.get("objectsapiclient_objecttypes") is None
+
+    def test_widget_renders_only_selected_option(self):
+        widget = ObjectTypeAutocompleteWidget()
+        widget.is_required = True
+
+        html = widget.render("object_type", "uuid-3")
+
+        assert html.count("<option") == 1
+        assert '<option value="uuid-3" selected>Type 03</option>' in html
+        # the choices are not loaded to render the selected option
+        assert cache.get("objectsapiclient_objecttypes") is None
+        assert cache.get("objectsapiclient_objecttypes_names")["uuid-3"] == "Type 03"
+        assert 'data-ajax--url="/objectsapiclient/objecttypes/autocomplete/"' in html
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+import pytest
+
+from objectsapiclient.cache import TieredCache
+from objectsapiclient.models import ObjectTypeField
+
+
+@pytest.mark.usefixtures("clear_cache")
+class TestTieredCache:
+    def test_served_from_memory(self):
+        tiered_cache = TieredCache("test")
+        tiered_cache.set("key", "value", timeout=60)
+
+        with patch("objectsapiclient.cache.cache") as mock_cache:
+            assert tiered_cache.get("key") == "value"
+
+        mock_cache.get.assert_not_called()
+
+    def test_falls_back_to_django_cache(self):
+        TieredCache("test").set("key", "value", timeout=60)
+
+        # another process, with an empty local cache
+        assert TieredCache("test").get("key") == "value"
+
+    def test_local_copy_expires(self, settings):
+        settings.OBJECTSAPICLIENT_LOCAL_CACHE_TIMEOUT = 5
+        tiered_cache = TieredCache("test")
+
+        with patch("objectsapiclient.cache.time.monotonic", return_value=100):
+            tiered_cache.set("key", "value", timeout=60)
+        cache.set("key", "changed", version=1)
+
+        with patch("objectsapiclient.cache.time.monotonic", return_value=104):
+            assert tiered_cache.get("key") == "value"
+        with patch("objectsapiclient.cache.time.monotonic", return_value=106):
+            assert tiered_cache.get("key") == "changed"
+
+    def test_disabled(self, settings):
+        settings.OBJECTSAPICLIENT_LOCAL_CACHE_TIMEOUT = 0
+        tiered_cache = TieredCache("test")
+        tiered_cache.set("key", "value", timeout=60)
+        cache.set("key", "changed", version=1)
+
+        assert tiered_cache.get("key") == "changed"
+
+    def test_least_recently_used_evicted(self, settings):
+        settings.OBJECTSAPICLIENT_LOCAL_CACHE_MAX_SIZE = 3
+        tiered_cache = TieredCache("test")
+        for key in ("a", "b"):
+            tiered_cache.set(key, key, timeout=60)
+        tiered_cache.get("a")
+        tiered_cache.set("c", "c", timeout=60)
+
+        # the version is kept in memory as well
+        assert set(tiered_cache._local) == {"a", "c", "test_version"}
+
+    def test_invalidate_reaches_other_processes(self):
+        tiered_cache, other = TieredCache("test"), TieredCache("test")
+        tiered_cache.set("key", "value", timeout=60)
+        assert other.get("key") == "value"
+
+        tiered_cache.invalidate()
+
+        assert tiered_cache.get("key") is None
+        # once its local copies expire
+        other.clear_local()
+        assert other.get("key") is None
+
+    def test_missing_value_not_cached(self):
+        tiered_cache = TieredCache("test")
+        assert tiered_cache.get("key", "default") == "default"
+
+        cache.set("key", "value", version=1)
+
+        assert tiered_cache.get("key") == "value"
+
+
+@pytest.mark.usefixtures("clear_cache")
+@patch("objectsapiclient.models.get_object_type_choices", return_value=[("1", "A")])
+def test_choices_served_from_memory(mock_get_choices):
+    field = ObjectTypeField()
+    field.get_choices(include_blank=False)
+
+    with patch("objectsapiclient.cache.cache") as mock_cache:
+        assert field.get_choices(include_blank=False) == [("1", "A")]
+
+    mock_cache.get.assert_not_called()
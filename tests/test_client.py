@@ -0,0 +1,958 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import post_save
+
+import pytest
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+    HTTPError,
+)
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from objectsapiclient.circuit_breaker import CircuitBreaker, CircuitOpenError
+from objectsapiclient.client import SHARED_CLIENT_VERSION_CACHE_KEY, Client
+from objectsapiclient.dataclasses import LazyObject, Object
+from objectsapiclient.geometry import bbox_to_polygon
+from objectsapiclient.models import (
+    NamedObjectsClientConfiguration,
+    ObjectsClientConfiguration,
+)
+from objectsapiclient.utils import Coalescer
+
+from .conftest import (
+    OBJECT_TYPE_UUID,
+    OBJECTS_API_ROOT,
+    OBJECTTYPES_API_ROOT,
+    make_object,
+    make_object_type,
+)
+
+
+@pytest.fixture
+def paginated_objects(requests_mock):
+    objects_url = f"{OBJECTS_API_ROOT}objects"
+    requests_mock.get(
+        objects_url,
+        json={
+            "count": 3,
+            "next": f"{objects_url}?page=2",
+            "results": [make_object(1), make_object(2)],
+        },
+    )
+    requests_mock.get(
+        f"{objects_url}?page=2",
+        complete_qs=True,
+        json={"count": 3, "next": None, "results": [make_object(3)]},
+    )
+    return requests_mock
+
+
+class TestIterObjects:
+    def test_follows_next_links(self, config, paginated_objects):
+        objects = Client(config).iter_objects()
+
+        assert [obj.uuid for obj in objects] == ["uuid-1", "uuid-2", "uuid-3"]
+        assert paginated_objects.call_count == 2
+
+    def test_is_lazy(self, config, paginated_objects):
+        objects = Client(config).iter_objects()
+
+        first = next(objects)
+
+        assert isinstance(first, Object)
+        assert first.uuid == "uuid-1"
+        assert paginated_objects.call_count == 1
+
+    def test_passes_type_and_page_size(self, config, paginated_objects):
+        list(
+            Client(config).iter_objects(object_type_uuid=OBJECT_TYPE_UUID, page_size=2)
+        )
+
+        first_request = paginated_objects.request_history[0]
+        assert first_request.qs == {
+            "type": [f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}/"],
+            "pagesize": ["2"],
+        }
+        # query parameters are carried over by the next link
+        assert paginated_objects.request_history[1].qs == {"page": ["2"]}
+
+
+class TestGetObjects:
+    def test_returns_all_pages(self, config, paginated_objects):
+        objects = Client(config).get_objects()
+
+        assert [obj.uuid for obj in objects] == ["uuid-1", "uuid-2", "uuid-3"]
+
+    def test_lazy(self, config, paginated_objects):
+        objects = Client(config).get_objects(lazy=True)
+
+        assert all(isinstance(obj, LazyObject) for obj in objects)
+        assert objects[2].record["type_version"] == 1
+
+    def test_empty_results(self, config, requests_mock):
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects",
+            json={"count": 0, "next": None, "results": []},
+        )
+
+        assert Client(config).get_objects() == []
+
+
+class TestIterObjectsConcurrently:
+    @pytest.fixture
+    def numbered_pages(self, requests_mock):
+        objects_url = f"{OBJECTS_API_ROOT}objects"
+        # 7 objects, page size 2 -> 4 pages
+        pages = [[1, 2], [3, 4], [5, 6], [7]]
+        for number, indexes in enumerate(pages, start=1):
+            requests_mock.get(
+                objects_url if number == 1 else f"{objects_url}?page={number}",
+                complete_qs=number > 1,
+                json={
+                    "count": 7,
+                    "next": (
+                        f"{objects_url}?page={number + 1}"
+                        if number < len(pages)
+                        else None
+                    ),
+                    "results": [make_object(index) for index in indexes],
+                },
+            )
+        return requests_mock
+
+    def test_yields_all_pages_in_order(self, config, numbered_pages):
+        objects = Client(config).iter_objects(max_workers=3)
+
+        assert [obj.uuid for obj in objects] == [f"uuid-{i}" for i in range(1, 8)]
+        assert numbered_pages.call_count == 4
+
+    def test_plans_pages_from_count(self, config, numbered_pages):
+        list(Client(config).iter_objects(max_workers=2))
+
+        requested_pages = sorted(
+            request.qs.get("page", ["1"])[0]
+            for request in numbered_pages.request_history
+        )
+        assert requested_pages == ["1", "2", "3", "4"]
+
+    def test_raw_pages_from_start_page(self, config, numbered_pages):
+        pages = Client(config).iter_object_pages(start_page=3, max_workers=2)
+
+        assert [[data["uuid"] for data in results] for results in pages] == [
+            ["uuid-5", "uuid-6"],
+            ["uuid-7"],
+        ]
+        assert numbered_pages.call_count == 2
+
+    def test_empty_first_page_with_next_link(self, config, requests_mock):
+        objects_url = f"{OBJECTS_API_ROOT}objects"
+        requests_mock.get(
+            objects_url,
+            json={"count": 1, "next": f"{objects_url}?page=2", "results": []},
+        )
+        requests_mock.get(
+            f"{objects_url}?page=2",
+            complete_qs=True,
+            json={"count": 1, "next": None, "results": [make_object(1)]},
+        )
+
+        objects = Client(config).iter_objects(max_workers=2)
+
+        assert [obj.uuid for obj in objects] == ["uuid-1"]
+
+    def test_single_page(self, config, requests_mock):
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects",
+            json={"count": 1, "next": None, "results": [make_object(1)]},
+        )
+
+        objects = Client(config).get_objects(max_workers=4)
+
+        assert [obj.uuid for obj in objects] == ["uuid-1"]
+        assert requests_mock.call_count == 1
+
+
+class TestSharedClient:
+    @pytest.fixture(autouse=True)
+    def reset_shared(self, clear_cache):
+        Client.invalidate_shared()
+        yield
+        Client.invalidate_shared()
+
+    @pytest.fixture
+    def get_solo(self, config):
+        with patch(
+            "objectsapiclient.models.ObjectsClientConfiguration.get_solo",
+            return_value=config,
+        ) as get_solo:
+            yield get_solo
+
+    def test_reuses_client_and_sessions(self, get_solo):
+        client = Client.shared()
+
+        assert Client.shared() is client
+        assert get_solo.call_count == 1
+        assert client.objects._in_context_manager
+        assert client.object_types._in_context_manager
+
+    def test_invalidated_on_configuration_save(self, config, get_solo):
+        client = Client.shared()
+
+        post_save.send(sender=ObjectsClientConfiguration, instance=config)
+
+        assert not client.objects._in_context_manager
+        assert Client.shared() is not client
+        assert get_solo.call_count == 2
+
+    @pytest.mark.django_db
+    def test_singleton_configuration_created(self, config, monkeypatch):
+        class TimeoutLock:
+            def __init__(self):
+                self.lock = threading.Lock()
+
+            def __enter__(self):
+                assert self.lock.acquire(timeout=1), "deadlock"
+
+            def __exit__(self, *exc_info):
+                self.lock.release()
+
+        monkeypatch.setattr(Client, "_shared_lock", TimeoutLock())
+
+        # creating the singleton configuration invalidates the shared clients
+        with pytest.raises(ImproperlyConfigured):
+            Client.shared()
+
+        assert ObjectsClientConfiguration.objects.exists()
+
+    def test_invalidated_by_other_process(self, get_solo):
+        client = Client.shared()
+
+        # another process bumps the version in the shared cache
+        cache.set(SHARED_CLIENT_VERSION_CACHE_KEY, 42)
+
+        assert Client.shared() is not client
+
+
+@pytest.mark.usefixtures("clear_cache")
+class TestConditionalRequests:
+    url = f"{OBJECTTYPES_API_ROOT}objecttypes"
+
+    def test_not_modified_served_from_cache(self, config, requests_mock):
+        requests_mock.get(
+            self.url,
+            [
+                {
+                    "json": {"results": [make_object_type("uuid-1", "Type 1")]},
+                    "headers": {"ETag": '"v1"'},
+                },
+                {"status_code": 304},
+            ],
+        )
+        client = Client(config)
+
+        first = client.get_object_types()
+        second = client.get_object_types()
+
+        assert first == second
+        assert second[0].name == "Type 1"
+        assert "If-None-Match" not in requests_mock.request_history[0].headers
+        assert requests_mock.request_history[1].headers["If-None-Match"] == '"v1"'
+
+    def test_modified_replaces_cache(self, config, requests_mock):
+        requests_mock.get(
+            self.url,
+            [
+                {
+                    "json": {"results": [make_object_type("uuid-1", "Type 1")]},
+                    "headers": {"ETag": '"v1"'},
+                },
+                {
+                    "json": {"results": [make_object_type("uuid-1", "Renamed")]},
+                    "headers": {"ETag": '"v2"'},
+                },
+                {"status_code": 304},
+            ],
+        )
+        client = Client(config)
+
+        client.get_object_types()
+        assert client.get_object_types()[0].name == "Renamed"
+        assert client.get_object_types()[0].name == "Renamed"
+        assert requests_mock.request_history[2].headers["If-None-Match"] == '"v2"'
+
+    def test_without_etag_not_cached(self, config, requests_mock):
+        requests_mock.get(self.url, json={"results": []})
+        client = Client(config)
+
+        client.get_object_types()
+        client.get_object_types()
+
+        assert "If-None-Match" not in requests_mock.request_history[1].headers
+
+    def test_disabled(self, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_RESPONSE_CACHE_TIMEOUT = 0
+        requests_mock.get(self.url, json={"results": []}, headers={"ETag": '"v1"'})
+        client = Client(config)
+
+        client.get_object_types()
+        client.get_object_types()
+
+        assert "If-None-Match" not in requests_mock.request_history[1].headers
+
+    def test_objects_not_cached_by_default(self, config, requests_mock):
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects/uuid-1",
+            json=make_object(1),
+            headers={"ETag": '"v1"'},
+        )
+        client = Client(config)
+
+        client.get_object("uuid-1")
+        client.get_object("uuid-1")
+
+        assert "If-None-Match" not in requests_mock.request_history[1].headers
+
+    def test_objects_cached_if_enabled(self, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS = True
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects/uuid-1",
+            [
+                {"json": make_object(1), "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        client = Client(config)
+
+        client.get_object("uuid-1")
+
+        assert client.get_object("uuid-1").uuid == "uuid-1"
+        assert requests_mock.request_history[1].headers["If-None-Match"] == '"v1"'
+
+    def test_cached_per_credentials(self, config, requests_mock):
+        requests_mock.get(self.url, json={"results": []}, headers={"ETag": '"v1"'})
+        Client(config).get_object_types()
+
+        service = config.object_type_api_service_config
+        service.auth_type = AuthTypes.api_key
+        service.header_key, service.header_value = "Authorization", "Token other"
+        Client(config).get_object_types()
+
+        assert "If-None-Match" not in requests_mock.request_history[1].headers
+
+
+class TestObjectFilters:
+    @pytest.fixture
+    def objects_mock(self, requests_mock):
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects",
+            json={"count": 1, "next": None, "results": [{"uuid": "uuid-1"}]},
+        )
+        return requests_mock
+
+    def test_filters_passed_to_api(self, config, objects_mock):
+        objects = Client(config).get_objects(
+            data_attrs=[
+                ("address__city", "exact", "Amsterdam"),
+                ("size", "gte", 10),
+                ("status", "in", ["new", "open"]),
+            ],
+            data_icontains="keizer",
+            date=datetime.date(2025, 1, 31),
+            registration_date=datetime.date(2025, 1, 1),
+            fields=["uuid", "record__data__title"],
+        )
+
+        query = parse_qs(urlsplit(objects_mock.last_request.url).query)
+        assert query == {
+            "data_attrs": [
+                "address__city__exact__Amsterdam,size__gte__10,status__in__new|open"
+            ],
+            "data_icontains": ["keizer"],
+            "date": ["2025-01-31"],
+            "registrationDate": ["2025-01-01"],
+            "fields": ["uuid,record__data__title"],
+        }
+        # only the selected fields are returned
+        assert objects[0].uuid == "uuid-1"
+        assert objects[0].record is None
+
+    def test_invalid_operator(self, config, objects_mock):
+        with pytest.raises(ValueError):
+            Client(config).get_objects(data_attrs=[("size", "between", 10)])
+
+        assert not objects_mock.called
+
+    def test_value_with_comma(self, config, objects_mock):
+        with pytest.raises(ValueError):
+            Client(config).get_objects(data_attrs=[("name", "exact", "a,b")])
+
+
+class TestGetObjectsByUUID:
+    def test_fetches_unique_objects(self, config, requests_mock):
+        for index in (1, 2):
+            requests_mock.get(
+                f"{OBJECTS_API_ROOT}objects/uuid-{index}", json=make_object(index)
+            )
+        requests_mock.get(f"{OBJECTS_API_ROOT}objects/uuid-3", status_code=404)
+
+        objects = Client(config).get_objects_by_uuid(
+            ["uuid-1", "uuid-2", "uuid-1", "uuid-3"]
+        )
+
+        assert set(objects) == {"uuid-1", "uuid-2"}
+        assert objects["uuid-2"].record["data"] == {"title": "#2"}
+        assert requests_mock.call_count == 3
+
+    def test_empty(self, config, requests_mock):
+        assert Client(config).get_objects_by_uuid([]) == {}
+        assert not requests_mock.called
+
+    def test_server_error_raised(self, config, requests_mock):
+        requests_mock.get(f"{OBJECTS_API_ROOT}objects/uuid-1", status_code=500)
+
+        with pytest.raises(HTTPError):
+            Client(config).get_objects_by_uuid(["uuid-1"])
+
+    def test_get_object(self, config, requests_mock):
+        requests_mock.get(f"{OBJECTS_API_ROOT}objects/uuid-1", json=make_object(1))
+        requests_mock.get(f"{OBJECTS_API_ROOT}objects/uuid-2", status_code=404)
+        client = Client(config)
+
+        assert client.get_object("uuid-1").uuid == "uuid-1"
+        assert client.get_object("uuid-2") is None
+
+
+class TestCoalescer:
+    def test_concurrent_calls_share_result(self):
+        coalescer = Coalescer()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(coalescer.call, "key", fetch)
+            started.wait(timeout=5)
+            follower = executor.submit(coalescer.call, "key", fetch)
+            release.set()
+
+            assert leader.result() == follower.result() == "result"
+
+        assert len(calls) == 1
+        # once completed, a new call is made
+        assert coalescer.call("key", lambda: "new") == "new"
+
+    def test_exception_propagated(self):
+        coalescer = Coalescer()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            coalescer.call("key", fail)
+        assert coalescer.call("key", lambda: "ok") == "ok"
+
+
+class TestWriteObjects:
+    def test_create_object(self, config, requests_mock):
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects", status_code=201, json=make_object(1)
+        )
+
+        obj = Client(config).create_object(
+            OBJECT_TYPE_UUID, {"typeVersion": 1, "data": {"title": "Object 1"}}
+        )
+
+        assert obj.uuid == "uuid-1"
+        request = requests_mock.last_request
+        assert request.headers["Content-Crs"] == "EPSG:4326"
+        assert request.json() == {
+            "type": f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}/",
+            "record": {
+                "typeVersion": 1,
+                "data": {"title": "Object 1"},
+                "startAt": datetime.date.today().isoformat(),
+            },
+        }
+
+    def test_update_object(self, config, requests_mock):
+        requests_mock.put(f"{OBJECTS_API_ROOT}objects/uuid-1", json=make_object(1))
+
+        Client(config).update_object(
+            "uuid-1",
+            OBJECT_TYPE_UUID,
+            {"typeVersion": 1, "data": {}, "startAt": "2025-01-01"},
+        )
+
+        assert requests_mock.last_request.json()["record"]["startAt"] == "2025-01-01"
+
+    def test_patch_object(self, config, requests_mock):
+        requests_mock.patch(f"{OBJECTS_API_ROOT}objects/uuid-1", json=make_object(1))
+
+        Client(config).patch_object("uuid-1", {"data": {"title": "New"}})
+
+        assert requests_mock.last_request.json() == {
+            "record": {"data": {"title": "New"}}
+        }
+
+    def test_error_raised(self, config, requests_mock):
+        requests_mock.post(f"{OBJECTS_API_ROOT}objects", status_code=400)
+
+        with pytest.raises(HTTPError):
+            Client(config).create_object(OBJECT_TYPE_UUID, {"data": {}})
+
+
+@patch("objectsapiclient.bulk.time.sleep")
+class TestSubmitObjects:
+    def test_results_in_order(self, mock_sleep, config, requests_mock):
+        def respond(request, context):
+            index = request.json()["record"]["data"]["index"]
+            context.status_code = 201
+            return make_object(index)
+
+        requests_mock.post(f"{OBJECTS_API_ROOT}objects", json=respond)
+        records = ({"data": {"index": index}} for index in range(20))
+
+        results = list(
+            Client(config).submit_objects(OBJECT_TYPE_UUID, records, max_workers=4)
+        )
+
+        assert [result.index for result in results] == list(range(20))
+        assert [result.object.uuid for result in results] == [
+            f"uuid-{index}" for index in range(20)
+        ]
+        assert all(result.ok for result in results)
+
+    def test_updates(self, mock_sleep, config, requests_mock):
+        requests_mock.put(f"{OBJECTS_API_ROOT}objects/uuid-1", json=make_object(1))
+
+        (result,) = Client(config).submit_objects(
+            OBJECT_TYPE_UUID, [("uuid-1", {"data": {}})]
+        )
+
+        assert result.object.uuid == "uuid-1"
+
+    def test_retry_after(self, mock_sleep, config, requests_mock):
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "3"}},
+                {"status_code": 503},
+                {"status_code": 201, "json": make_object(1)},
+            ],
+        )
+
+        (result,) = Client(config).submit_objects(OBJECT_TYPE_UUID, [{"data": {}}])
+
+        assert result.ok
+        assert result.attempts == 3
+        assert mock_sleep.call_args_list[0].args == (3.0,)
+        assert mock_sleep.call_count == 2
+
+    def test_gives_up_after_max_retries(self, mock_sleep, config, requests_mock):
+        requests_mock.post(f"{OBJECTS_API_ROOT}objects", status_code=503)
+
+        (result,) = Client(config).submit_objects(
+            OBJECT_TYPE_UUID, [{"data": {}}], max_retries=2
+        )
+
+        assert not result.ok
+        assert isinstance(result.error, HTTPError)
+        assert result.attempts == 3
+
+    @pytest.mark.parametrize("status_code", [502, 504])
+    def test_creates_not_retried_after_gateway_errors(
+        self, mock_sleep, config, requests_mock, status_code
+    ):
+        requests_mock.post(f"{OBJECTS_API_ROOT}objects", status_code=status_code)
+
+        (result,) = Client(config).submit_objects(OBJECT_TYPE_UUID, [{"data": {}}])
+
+        assert result.error.response.status_code == status_code
+        assert requests_mock.call_count == 1
+
+    def test_updates_retried_after_gateway_errors(
+        self, mock_sleep, config, requests_mock
+    ):
+        requests_mock.put(
+            f"{OBJECTS_API_ROOT}objects/uuid-1",
+            [
+                {"status_code": 502},
+                {"exc": RequestsConnectionError},
+                {"json": make_object(1)},
+            ],
+        )
+
+        (result,) = Client(config).submit_objects(
+            OBJECT_TYPE_UUID, [("uuid-1", {"data": {}})]
+        )
+
+        assert result.ok
+        assert result.attempts == 3
+
+    def test_creates_retried_if_not_sent(self, mock_sleep, config, requests_mock):
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects",
+            [{"exc": ConnectTimeout}, {"status_code": 201, "json": make_object(1)}],
+        )
+
+        (result,) = Client(config).submit_objects(OBJECT_TYPE_UUID, [{"data": {}}])
+
+        assert result.ok
+        assert result.attempts == 2
+
+    def test_creates_not_retried_after_connection_errors(
+        self, mock_sleep, config, requests_mock
+    ):
+        requests_mock.post(f"{OBJECTS_API_ROOT}objects", exc=RequestsConnectionError)
+
+        (result,) = Client(config).submit_objects(OBJECT_TYPE_UUID, [{"data": {}}])
+
+        assert isinstance(result.error, RequestsConnectionError)
+        assert result.attempts == 1
+
+    def test_long_retry_after_not_waited_for(self, mock_sleep, config, requests_mock):
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects",
+            status_code=429,
+            headers={"Retry-After": "120"},
+        )
+
+        (result,) = Client(config).submit_objects(OBJECT_TYPE_UUID, [{"data": {}}])
+
+        assert result.error.response.status_code == 429
+        assert not mock_sleep.called
+
+    def test_client_errors_not_retried(self, mock_sleep, config, requests_mock):
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects",
+            [{"status_code": 400}, {"status_code": 201, "json": make_object(2)}],
+        )
+
+        first, second = Client(config).submit_objects(
+            OBJECT_TYPE_UUID, [{"data": {}}, {"data": {}}], max_workers=1
+        )
+
+        assert first.error.response.status_code == 400
+        assert second.ok
+        assert not mock_sleep.called
+
+
+@patch("objectsapiclient.client.time.sleep")
+class TestRetries:
+    def test_retry_with_backoff(self, mock_sleep, config, requests_mock):
+        requests_mock.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+            [{"status_code": 503}, {"json": {"results": []}}],
+        )
+
+        assert Client(config).get_object_types() == []
+        assert requests_mock.call_count == 2
+        (delay,) = mock_sleep.call_args.args
+        assert 0 <= delay <= 0.5
+
+    def test_retry_after(self, mock_sleep, config, requests_mock):
+        requests_mock.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "2"}},
+                {"json": {"results": []}},
+            ],
+        )
+
+        Client(config).get_object_types()
+
+        mock_sleep.assert_called_once_with(2.0)
+
+    def test_long_retry_after_not_waited_for(self, mock_sleep, config, requests_mock):
+        requests_mock.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+            status_code=429,
+            headers={"Retry-After": "120"},
+        )
+
+        with pytest.raises(HTTPError):
+            Client(config).get_object_types()
+
+        assert not mock_sleep.called
+
+    def test_connection_errors(self, mock_sleep, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_MAX_RETRIES = 3
+        requests_mock.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes", exc=RequestsConnectionError
+        )
+
+        with pytest.raises(RequestsConnectionError):
+            Client(config).get_object_types()
+
+        assert requests_mock.call_count == 4
+
+    def test_writes_not_retried(self, mock_sleep, config, requests_mock):
+        requests_mock.post(f"{OBJECTS_API_ROOT}objects", status_code=503)
+
+        with pytest.raises(HTTPError):
+            Client(config).create_object(OBJECT_TYPE_UUID, {"data": {}})
+
+        assert requests_mock.call_count == 1
+
+    def test_configured_timeouts(self, mock_sleep, config, requests_mock):
+        config.objects_timeout = 3
+        config.object_types_timeout = 2
+        config.write_timeout = 20
+        requests_mock.get(f"{OBJECTTYPES_API_ROOT}objecttypes", json={"results": []})
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects", json={"next": None, "results": []}
+        )
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects", status_code=201, json=make_object(1)
+        )
+        client = Client(config)
+
+        client.get_object_types()
+        client.get_objects()
+        client.create_object(OBJECT_TYPE_UUID, {"data": {}})
+
+        assert [request.timeout for request in requests_mock.request_history] == [
+            2,
+            3,
+            20,
+        ]
+
+    def test_service_timeout_by_default(self, mock_sleep, config, requests_mock):
+        config.object_type_api_service_config.timeout = 7
+        requests_mock.get(f"{OBJECTTYPES_API_ROOT}objecttypes", json={"results": []})
+
+        Client(config).get_object_types()
+
+        assert requests_mock.last_request.timeout == 7
+
+
+@patch("objectsapiclient.client.time.sleep")
+class TestCircuitBreaker:
+    def test_fails_fast_when_open(self, mock_sleep, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_MAX_RETRIES = 0
+        settings.OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD = 3
+        requests_mock.get(f"{OBJECTTYPES_API_ROOT}objecttypes", status_code=500)
+        client = Client(config)
+
+        for _ in range(3):
+            with pytest.raises(HTTPError):
+                client.get_object_types()
+        with pytest.raises(CircuitOpenError):
+            client.get_object_types()
+
+        assert requests_mock.call_count == 3
+
+    def test_shared_across_clients(self, mock_sleep, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD = 1
+        requests_mock.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes", exc=RequestsConnectionError
+        )
+        requests_mock.get(
+            f"{OBJECTS_API_ROOT}objects", json={"next": None, "results": []}
+        )
+
+        with pytest.raises(RequestsConnectionError):
+            Client(config).get_object_types()
+
+        client = Client(config)
+        with pytest.raises(CircuitOpenError):
+            client.get_object_types()
+        # the other API is not affected
+        assert client.get_objects() == []
+
+    def test_success_resets_failures(self, mock_sleep, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_MAX_RETRIES = 0
+        settings.OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD = 2
+        requests_mock.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+            [
+                {"status_code": 500},
+                {"json": {"results": []}},
+                {"status_code": 500},
+                {"json": {"results": []}},
+            ],
+        )
+        client = Client(config)
+
+        for _ in range(2):
+            with pytest.raises(HTTPError):
+                client.get_object_types()
+            assert client.get_object_types() == []
+
+    def test_reopens_after_single_failure(self, mock_sleep, config, settings):
+        settings.OBJECTSAPICLIENT_CIRCUIT_BREAKER_THRESHOLD = 3
+        breaker = CircuitBreaker(OBJECTS_API_ROOT)
+
+        for _ in range(3):
+            breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+        # the reset timeout expires
+        cache.delete(breaker.open_key)
+        assert breaker.check()
+
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+
+@pytest.mark.django_db
+class TestNamedConfiguration:
+    @pytest.fixture(autouse=True)
+    def reset_shared(self, clear_cache):
+        Client.invalidate_shared()
+        yield
+        Client.invalidate_shared()
+
+    @pytest.fixture
+    def named_config(self):
+        return NamedObjectsClientConfiguration.objects.create(
+            name="tenant",
+            objects_api_service_config=Service.objects.create(
+                label="Tenant Objects API",
+                slug="tenant-objects-api",
+                api_type=APITypes.orc,
+                api_root="https://tenant.example.com/objects/api/v2/",
+                auth_type=AuthTypes.no_auth,
+            ),
+            object_type_api_service_config=Service.objects.create(
+                label="Tenant Objecttypes API",
+                slug="tenant-objecttypes-api",
+                api_type=APITypes.orc,
+                api_root="https://tenant.example.com/objecttypes/api/v2/",
+                auth_type=AuthTypes.no_auth,
+            ),
+        )
+
+    def test_invalidated_on_service_save(self, named_config):
+        client = Client.shared("tenant")
+        version = cache.get("objectsapiclient_cache_version")
+
+        named_config.objects_api_service_config.save()
+
+        assert Client.shared("tenant") is not client
+        assert cache.get("objectsapiclient_cache_version") != version
+
+    def test_not_invalidated_on_other_service_save(self, named_config):
+        service = Service.objects.create(
+            label="Other API",
+            slug="other-api",
+            api_type=APITypes.orc,
+            api_root="https://other.example.com/api/v1/",
+            auth_type=AuthTypes.no_auth,
+        )
+        client = Client.shared("tenant")
+        version = cache.get("objectsapiclient_cache_version")
+
+        service.save()
+
+        assert Client.shared("tenant") is client
+        assert cache.get("objectsapiclient_cache_version") == version
+
+    def test_client_by_name(self, named_config, requests_mock):
+        requests_mock.get(
+            "https://tenant.example.com/objecttypes/api/v2/objecttypes",
+            json={"results": [make_object_type(OBJECT_TYPE_UUID, "Tenant type")]},
+        )
+
+        (object_type,) = Client("tenant").get_object_types()
+
+        assert object_type.name == "Tenant type"
+
+    def test_unknown_name(self):
+        with pytest.raises(ImproperlyConfigured):
+            Client("unknown")
+
+    def test_shared_client_per_configuration(self, config, named_config):
+        with patch(
+            "objectsapiclient.models.ObjectsClientConfiguration.get_solo",
+            return_value=config,
+        ):
+            default = Client.shared()
+            tenant = Client.shared("tenant")
+
+            assert tenant is not default
+            assert Client.shared("tenant") is tenant
+            assert tenant.objects.base_url == (
+                "https://tenant.example.com/objects/api/v2/"
+            )
+
+            named_config.save()
+
+            assert Client.shared("tenant") is not tenant
+            assert Client.shared() is not default
+
+
+class TestSearchObjects:
+    @pytest.fixture
+    def search_pages(self, requests_mock):
+        search_url = f"{OBJECTS_API_ROOT}objects/search"
+        requests_mock.post(
+            f"{search_url}?pageSize=2",
+            complete_qs=True,
+            json={
+                "count": 3,
+                "next": f"{search_url}?page=2&pageSize=2",
+                "results": [make_object(1), make_object(2)],
+            },
+        )
+        requests_mock.post(
+            f"{search_url}?page=2&pageSize=2",
+            complete_qs=True,
+            json={"count": 3, "next": None, "results": [make_object(3)]},
+        )
+        return requests_mock
+
+    def test_filters_on_server(self, config, search_pages):
+        viewport = bbox_to_polygon((4.8, 52.3, 5.0, 52.4))
+
+        objects = Client(config).search_objects(
+            geometry=viewport,
+            object_type_uuid=OBJECT_TYPE_UUID,
+            page_size=2,
+            data_attrs=[("city", "exact", "Amsterdam")],
+        )
+
+        assert [obj.uuid for obj in objects] == ["uuid-1", "uuid-2", "uuid-3"]
+        first, second = search_pages.request_history
+        assert first.headers["Content-Crs"] == "EPSG:4326"
+        assert first.json() == {
+            "type": f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}/",
+            "data_attrs": "city__exact__Amsterdam",
+            "geometry": {"within": viewport},
+        }
+        # the same search is sent for the next page
+        assert second.json() == first.json()
+
+    def test_is_lazy(self, config, search_pages):
+        objects = Client(config).search_objects(page_size=2)
+
+        next(objects)
+
+        assert search_pages.call_count == 1
+
+    def test_retried(self, config, requests_mock):
+        requests_mock.post(
+            f"{OBJECTS_API_ROOT}objects/search",
+            [
+                {"status_code": 503, "headers": {"Retry-After": "0"}},
+                {"json": {"count": 0, "next": None, "results": []}},
+            ],
+        )
+
+        assert list(Client(config).search_objects()) == []
+        assert requests_mock.call_count == 2
@@ -0,0 +1,81 @@
+import copy
+import pickle
+
+import pytest
+from zgw_consumers.api_models.base import factory
+
+from objectsapiclient.dataclasses import LazyObject, Object, ObjectType
+from objectsapiclient.decoder import decode, decode_list, loads
+
+from .conftest import make_object, make_object_type
+
+
+class TestDecoder:
+    def test_decode_object_matches_factory(self):
+        data = make_object(1)
+        data["record"]["data"] = {"firstName": "Jane", "addresses": [{"zipCode": 1}]}
+        data["unknownKey"] = "ignored"
+
+        assert decode(Object, data) == factory(Object, data)
+
+    def test_decode_object_types_matches_factory(self):
+        data = [
+            make_object_type("uuid-1", "Type 1"),
+            make_object_type("uuid-2", "Type 2"),
+        ]
+
+        decoded = decode_list(ObjectType, data)
+
+        assert decoded == factory(ObjectType, data)
+        assert decoded[0].name_plural == "Type 1s"
+
+    def test_loads(self):
+        assert loads(b'{"results": [1, 2]}') == {"results": [1, 2]}
+
+
+class TestLazyObject:
+    def test_record_decoded_on_access(self):
+        data = make_object(1)
+        data["record"]["data"] = {"firstName": "Jane"}
+
+        obj = decode(LazyObject, data)
+
+        assert obj._raw_record is data["record"]
+        assert obj.uuid == "uuid-1"
+        assert obj.record["data"] == {"first_name": "Jane"}
+        assert obj._raw_record is None
+        assert obj.record is obj.record
+
+    def test_matches_eager_object(self):
+        data = make_object(1)
+
+        lazy = decode(LazyObject, data)
+        eager = decode(Object, data)
+
+        assert isinstance(lazy, Object)
+        assert lazy == eager
+        assert eager == lazy
+        assert lazy.record == eager.record
+        assert repr(lazy).startswith("LazyObject(")
+
+    def test_empty_record(self):
+        data = make_object(1)
+        data["record"] = None
+
+        assert decode(LazyObject, data).record is None
+
+    def test_not_equal_to_other_object(self):
+        assert decode(LazyObject, make_object(1)) != decode(Object, make_object(2))
+
+    @pytest.mark.parametrize("access_record", [False, True])
+    def test_pickle_and_copy(self, access_record):
+        data = make_object(1)
+        data["record"]["data"] = {"firstName": "Jane"}
+        obj = decode(LazyObject, data)
+        if access_record:
+            assert obj.record
+
+        for other in (pickle.loads(pickle.dumps(obj)), copy.copy(obj)):
+            assert isinstance(other, LazyObject)
+            assert other == obj
+            assert other.record["data"] == {"first_name": "Jane"}
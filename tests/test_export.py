@@ -0,0 +1,289 @@
+import bz2
+import csv
+import gzip
+import io
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+
+import pytest
+from requests.exceptions import HTTPError
+
+from objectsapiclient.client import Client
+from objectsapiclient.export import dump_objects, flatten_object
+
+from .conftest import (
+    OBJECT_TYPE_UUID,
+    OBJECTS_API_ROOT,
+    OBJECTTYPES_API_ROOT,
+    make_object,
+    make_object_type,
+)
+
+OBJECTS_URL = f"{OBJECTS_API_ROOT}objects"
+
+
+def make_data_object(index: int) -> dict:
+    obj = make_object(index)
+    obj["record"]["data"] = {"title": f"#{index}", "address": {"city": "Amsterdam"}}
+    return obj
+
+
+def read_rows(path, format: str) -> list[dict]:
+    if format == "parquet":
+        return pytest.importorskip("pyarrow.parquet").read_table(path).to_pylist()
+    # empty CSV values are read as None, as in Parquet
+    return [
+        {column: value or None for column, value in row.items()}
+        for row in csv.DictReader(path.open())
+    ]
+
+
+@pytest.fixture
+def pages(requests_mock):
+    # 5 objects, page size 2 -> 3 pages
+    pages = [[1, 2], [3, 4], [5]]
+    for number, indexes in enumerate(pages, start=1):
+        requests_mock.get(
+            OBJECTS_URL if number == 1 else f"{OBJECTS_URL}?page={number}",
+            complete_qs=number > 1,
+            json={
+                "count": 5,
+                "next": f"{OBJECTS_URL}?page={number + 1}" if number < 3 else None,
+                "results": [make_data_object(index) for index in indexes],
+            },
+        )
+    return requests_mock
+
+
+def test_flatten_object():
+    obj = make_data_object(1)
+    obj["record"]["geometry"] = {"type": "Point", "coordinates": [4.9, 52.4]}
+    obj["record"]["data"]["tags"] = ["a", "b"]
+
+    row = flatten_object(obj)
+
+    assert row["uuid"] == "uuid-1"
+    assert row["record__typeVersion"] == 1
+    assert row["record__geometry"] == ('{"type": "Point", "coordinates": [4.9, 52.4]}')
+    assert row["record__data__title"] == "#1"
+    assert row["record__data__address__city"] == "Amsterdam"
+    assert row["record__data__tags"] == '["a", "b"]'
+
+
+class TestDumpObjects:
+    def test_ndjson(self, config, pages, tmp_path):
+        path = tmp_path / "objects.ndjson"
+
+        count = dump_objects(path, client=Client(config))
+
+        assert count == 5
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["uuid"] for line in lines] == [
+            f"uuid-{index}" for index in range(1, 6)
+        ]
+        assert not (tmp_path / "objects.ndjson.progress").exists()
+
+    def test_csv(self, config, pages, tmp_path):
+        path = tmp_path / "objects.csv"
+
+        dump_objects(path, format="csv", client=Client(config))
+
+        rows = list(csv.DictReader(path.open()))
+        assert [row["record__data__title"] for row in rows] == [
+            f"#{index}" for index in range(1, 6)
+        ]
+        assert rows[0]["record__data__address__city"] == "Amsterdam"
+
+    @pytest.mark.parametrize("compression,module", [("gzip", gzip), ("bz2", bz2)])
+    def test_compressed(self, config, pages, tmp_path, compression, module):
+        path = tmp_path / "objects.csv"
+
+        dump_objects(path, format="csv", compression=compression, client=Client(config))
+
+        content = module.decompress(path.read_bytes()).decode()
+        assert len(list(csv.DictReader(io.StringIO(content)))) == 5
+
+    def test_filters(self, config, pages, tmp_path):
+        dump_objects(
+            tmp_path / "objects.ndjson",
+            client=Client(config),
+            object_type_uuid=OBJECT_TYPE_UUID,
+            page_size=2,
+        )
+
+        assert pages.request_history[0].qs["pagesize"] == ["2"]
+        assert "type" in pages.request_history[0].qs
+
+    @pytest.mark.parametrize("format", ["ndjson", "csv"])
+    def test_resume(self, config, pages, tmp_path, format):
+        path = tmp_path / f"objects.{format}"
+        pages.get(f"{OBJECTS_URL}?page=3", complete_qs=True, status_code=404)
+
+        with pytest.raises(HTTPError):
+            dump_objects(path, format=format, compression="gzip", client=Client(config))
+
+        progress = json.loads((tmp_path / f"objects.{format}.progress").read_text())
+        assert progress["page"] == 2
+        # a partially written page is discarded
+        with path.open("ab") as file:
+            file.write(b"partial")
+
+        pages.get(
+            f"{OBJECTS_URL}?page=3",
+            complete_qs=True,
+            json={"count": 5, "next": None, "results": [make_data_object(5)]},
+        )
+        pages.reset_mock()
+
+        count = dump_objects(
+            path, format=format, compression="gzip", resume=True, client=Client(config)
+        )
+
+        assert count == 5
+        assert [request.qs.get("page") for request in pages.request_history] == [["3"]]
+        content = gzip.decompress(path.read_bytes()).decode()
+        if format == "csv":
+            uuids = [row["uuid"] for row in csv.DictReader(io.StringIO(content))]
+        else:
+            uuids = [json.loads(line)["uuid"] for line in content.splitlines()]
+        assert uuids == [f"uuid-{index}" for index in range(1, 6)]
+
+    def test_resume_other_objects(self, config, pages, tmp_path):
+        path = tmp_path / "objects.ndjson"
+        (tmp_path / "objects.ndjson.progress").write_text(
+            json.dumps({"filters": "{}", "page": 1})
+        )
+
+        with pytest.raises(ValueError):
+            dump_objects(
+                path,
+                resume=True,
+                client=Client(config),
+                object_type_uuid=OBJECT_TYPE_UUID,
+            )
+
+    def test_parquet(self, config, pages, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "objects.parquet"
+
+        count = dump_objects(path, format="parquet", client=Client(config))
+
+        assert count == 5
+        table = pq.read_table(path)
+        assert table.column("record__data__title").to_pylist() == [
+            f"#{index}" for index in range(1, 6)
+        ]
+
+    @pytest.mark.parametrize("format", ["csv", "parquet"])
+    def test_new_columns_after_first_page(self, config, pages, tmp_path, format):
+        obj = make_data_object(3)
+        obj["record"]["data"]["remarks"] = "Later"
+        pages.get(
+            f"{OBJECTS_URL}?page=2",
+            complete_qs=True,
+            json={"count": 5, "next": None, "results": [obj]},
+        )
+        path = tmp_path / f"objects.{format}"
+
+        count = dump_objects(path, format=format, client=Client(config))
+
+        assert count == 3
+        rows = read_rows(path, format)
+        assert "record__data__remarks" not in rows[0]
+        assert [row["record__extra_data"] for row in rows] == [
+            None,
+            None,
+            '{"record__data__remarks": "Later"}',
+        ]
+
+    @pytest.mark.parametrize("format", ["csv", "parquet"])
+    def test_columns_of_schema(self, config, pages, tmp_path, format, clear_cache):
+        pytest.importorskip("jsonschema")
+        pages.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+            json={"results": [make_object_type(OBJECT_TYPE_UUID, "Type")]},
+        )
+        pages.get(
+            f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}/versions/1",
+            json={
+                "status": "published",
+                "jsonSchema": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string"},
+                        "remarks": {"type": "string"},
+                        "address": {
+                            "type": "object",
+                            "properties": {"postcode": {"type": "string"}},
+                        },
+                    },
+                },
+            },
+        )
+        obj = make_data_object(3)
+        obj["record"]["data"]["remarks"] = "Later"
+        pages.get(
+            f"{OBJECTS_URL}?page=2",
+            complete_qs=True,
+            json={"count": 5, "next": None, "results": [obj]},
+        )
+        path = tmp_path / f"objects.{format}"
+
+        dump_objects(
+            path,
+            format=format,
+            client=Client(config),
+            object_type_uuid=OBJECT_TYPE_UUID,
+        )
+
+        rows = read_rows(path, format)
+        assert [row["record__data__remarks"] for row in rows] == [None, None, "Later"]
+        assert rows[0]["record__data__address__postcode"] is None
+        assert rows[0]["record__data__address__city"] == "Amsterdam"
+        assert rows[2]["record__extra_data"] is None
+
+    def test_parquet_mixed_types(self, config, pages, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        obj = make_data_object(3)
+        obj["record"]["data"]["title"] = 3
+        pages.get(
+            f"{OBJECTS_URL}?page=2",
+            complete_qs=True,
+            json={"count": 5, "next": None, "results": [obj]},
+        )
+        path = tmp_path / "objects.parquet"
+
+        count = dump_objects(path, format="parquet", client=Client(config))
+
+        assert count == 3
+        table = pq.read_table(path)
+        assert table.column("record__data__title").to_pylist() == ["#1", "#2", "3"]
+        assert table.column("record__typeVersion").to_pylist() == ["1"] * 3
+
+    def test_unknown_format(self, config, tmp_path):
+        with pytest.raises(ValueError):
+            dump_objects(tmp_path / "objects.xml", format="xml", client=Client(config))
+
+
+@patch("objectsapiclient.management.commands.dump_objects.Client.shared")
+def test_command(mock_shared, config, pages, tmp_path):
+    mock_shared.return_value = Client(config)
+    path = tmp_path / "objects.ndjson"
+    stdout = StringIO()
+
+    call_command("dump_objects", str(path), "--page-size=2", stdout=stdout)
+
+    assert stdout.getvalue() == f"Exported 5 objects to {path}\n"
+    mock_shared.assert_called_once_with(None)
+
+
+@patch("objectsapiclient.management.commands.dump_objects.Client.shared")
+@patch("objectsapiclient.management.commands.dump_objects.dump_objects")
+def test_command_without_pyarrow(mock_dump_objects, mock_shared, config, tmp_path):
+    mock_dump_objects.side_effect = ImportError("No module named 'pyarrow'")
+
+    with pytest.raises(CommandError, match="parquet extra"):
+        call_command("dump_objects", str(tmp_path / "objects.parquet"))
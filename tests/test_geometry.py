@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+from objectsapiclient import geometry
+from objectsapiclient.dataclasses import Object
+from objectsapiclient.geometry import (
+    bbox_to_polygon,
+    filter_objects_by_bbox,
+    get_bbox,
+    get_object_bbox,
+)
+
+from .conftest import OBJECTS_API_ROOT
+
+POLYGON = {
+    "type": "Polygon",
+    "coordinates": [[[4.8, 52.3], [5.0, 52.3], [5.0, 52.4], [4.8, 52.3]]],
+}
+
+
+def make_object(index: int, geometry: dict | None) -> Object:
+    return Object(
+        url=f"{OBJECTS_API_ROOT}objects/uuid-{index}",
+        uuid=f"uuid-{index}",
+        record={"index": 1, "geometry": geometry},
+    )
+
+
+def test_get_bbox():
+    assert get_bbox({"type": "Point", "coordinates": [4.9, 52.4]}) == (
+        4.9,
+        52.4,
+        4.9,
+        52.4,
+    )
+    assert get_bbox(POLYGON) == (4.8, 52.3, 5.0, 52.4)
+    assert get_bbox(
+        {
+            "type": "GeometryCollection",
+            "geometries": [{"type": "Point", "coordinates": [1, 2]}, POLYGON],
+        }
+    ) == (1, 2, 5.0, 52.4)
+    assert get_bbox(None) is None
+
+
+def test_bbox_to_polygon():
+    assert get_bbox(bbox_to_polygon((4.8, 52.3, 5.0, 52.4))) == (4.8, 52.3, 5.0, 52.4)
+
+
+def test_filter_objects_by_bbox():
+    objects = [
+        make_object(1, {"type": "Point", "coordinates": [4.9, 52.35]}),
+        make_object(2, {"type": "Point", "coordinates": [6.0, 52.35]}),
+        make_object(3, POLYGON),
+        make_object(4, None),
+    ]
+
+    inside = filter_objects_by_bbox(objects, (4.85, 52.3, 4.95, 52.4))
+
+    assert [obj.uuid for obj in inside] == ["uuid-1", "uuid-3"]
+
+
+def test_object_bbox_cached(monkeypatch):
+    monkeypatch.setattr(geometry, "_bbox_cache", OrderedDict())
+    monkeypatch.setattr(geometry, "BBOX_CACHE_SIZE", 1)
+    obj = make_object(1, {"type": "Point", "coordinates": [4.9, 52.35]})
+
+    assert get_object_bbox(obj) == (4.9, 52.35, 4.9, 52.35)
+    # the record of an index does not change
+    obj.record["geometry"] = POLYGON
+    assert get_object_bbox(obj) == (4.9, 52.35, 4.9, 52.35)
+
+    get_object_bbox(make_object(2, POLYGON))
+    assert get_object_bbox(obj) == (4.8, 52.3, 5.0, 52.4)
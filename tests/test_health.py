@@ -0,0 +1,98 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+
+import pytest
+
+from objectsapiclient.admin import ObjectsServiceConfigurationAdmin
+from objectsapiclient.client import Client
+from objectsapiclient.health import (
+    HEALTH_CACHE_KEY,
+    HealthStatus,
+    check_health,
+    get_cached_health,
+)
+from objectsapiclient.models import ObjectsClientConfiguration
+
+from .conftest import OBJECTS_API_ROOT, OBJECTTYPES_API_ROOT
+
+
+class TestCheckHealth:
+    def test_both_apis_healthy(self, config, requests_mock):
+        requests_mock.head(f"{OBJECTS_API_ROOT}objects")
+        requests_mock.head(f"{OBJECTTYPES_API_ROOT}objecttypes")
+
+        statuses = check_health(Client(config))
+
+        assert [(status.api, status.healthy) for status in statuses] == [
+            ("Objects API", True),
+            ("Objecttypes API", True),
+        ]
+        assert all(status.latency >= 0 for status in statuses)
+
+    def test_unhealthy_api(self, config, requests_mock):
+        requests_mock.head(f"{OBJECTS_API_ROOT}objects")
+        requests_mock.head(f"{OBJECTTYPES_API_ROOT}objecttypes", status_code=503)
+
+        objects_status, object_types_status = check_health(Client(config))
+
+        assert objects_status.healthy
+        assert not object_types_status.healthy
+        assert "503" in object_types_status.message
+        assert object_types_status.latency is None
+
+    def test_timeout_passed(self, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_HEALTH_CHECK_TIMEOUT = 2
+        requests_mock.head(f"{OBJECTS_API_ROOT}objects")
+        requests_mock.head(f"{OBJECTTYPES_API_ROOT}objecttypes")
+
+        check_health(Client(config))
+
+        assert [request.timeout for request in requests_mock.request_history] == [2, 2]
+
+
+@pytest.mark.usefixtures("clear_cache")
+class TestCachedHealth:
+    @patch("objectsapiclient.health.check_health")
+    @patch("objectsapiclient.cache._run_in_background")
+    def test_does_not_block_without_status(self, mock_run_in_background, mock_check):
+        assert get_cached_health() is None
+
+        mock_run_in_background.assert_called_once()
+        mock_check.assert_not_called()
+
+    @patch("objectsapiclient.health.check_health")
+    @patch("objectsapiclient.cache._run_in_background", side_effect=lambda fn: fn())
+    def test_status_checked_in_background(self, mock_run_in_background, mock_check):
+        statuses = [HealthStatus("Objects API", True, "", 0.01)]
+        mock_check.return_value = statuses
+
+        get_cached_health()
+
+        assert cache.get(HEALTH_CACHE_KEY) == statuses
+        assert get_cached_health() == statuses
+        mock_check.assert_called_once()
+
+
+class TestAdminStatus:
+    @patch("objectsapiclient.admin.get_cached_health")
+    def test_renders_cached_status(self, mock_get_cached_health, config):
+        mock_get_cached_health.return_value = [
+            HealthStatus("Objects API", True, "", 0.012),
+            HealthStatus("Objecttypes API", False, "503 Server Error", None),
+        ]
+        model_admin = ObjectsServiceConfigurationAdmin(
+            ObjectsClientConfiguration, Mock()
+        )
+
+        status = model_admin.status(config)
+
+        assert "Objects API: 12 ms" in status
+        assert "Objecttypes API: 503 Server Error" in status
+
+    def test_not_configured(self):
+        model_admin = ObjectsServiceConfigurationAdmin(
+            ObjectsClientConfiguration, Mock()
+        )
+
+        assert model_admin.status(ObjectsClientConfiguration()) == "Not configured"
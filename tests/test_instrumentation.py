@@ -0,0 +1,177 @@
+import pytest
+from requests.exceptions import HTTPError
+
+from objectsapiclient.client import Client
+from objectsapiclient.instrumentation import instrument
+from objectsapiclient.signals import api_request
+
+from .conftest import OBJECTS_API_ROOT, OBJECTTYPES_API_ROOT, make_object
+
+
+@pytest.fixture
+def events():
+    events = []
+
+    def receiver(sender, event, **kwargs):
+        events.append(event)
+
+    api_request.connect(receiver)
+    yield events
+    api_request.disconnect(receiver)
+
+
+@pytest.mark.usefixtures("clear_cache")
+class TestRequestEvents:
+    def test_paginated_objects(self, config, requests_mock, events):
+        objects_url = f"{OBJECTS_API_ROOT}objects"
+        requests_mock.get(
+            objects_url,
+            json={
+                "count": 2,
+                "next": f"{objects_url}?page=2",
+                "results": [make_object(1)],
+            },
+        )
+        requests_mock.get(
+            f"{objects_url}?page=2",
+            json={"count": 2, "next": None, "results": [make_object(2)]},
+        )
+
+        Client(config).get_objects()
+
+        assert [(event.endpoint, event.method, event.page) for event in events] == [
+            ("objects", "GET", 1),
+            ("objects", "GET", 2),
+        ]
+        assert events[1].url == f"{objects_url}?page=2"
+        for event in events:
+            assert event.status == 200
+            assert event.bytes_received > 0
+            assert event.duration >= 0
+            assert event.deserialization_duration >= 0
+            assert event.cache_hit is None
+            assert event.error is None
+
+    def test_concurrent_pages(self, config, requests_mock, events):
+        objects_url = f"{OBJECTS_API_ROOT}objects"
+        for page in (1, 2, 3):
+            requests_mock.get(
+                objects_url if page == 1 else f"{objects_url}?page={page}",
+                json={
+                    "count": 3,
+                    "next": f"{objects_url}?page={page + 1}" if page < 3 else None,
+                    "results": [make_object(page)],
+                },
+            )
+
+        Client(config).get_objects(max_workers=2)
+
+        assert sorted(event.page for event in events) == [1, 2, 3]
+
+    def test_cache_hit(self, config, requests_mock, events):
+        url = f"{OBJECTTYPES_API_ROOT}objecttypes"
+        requests_mock.get(
+            url,
+            [
+                {"json": {"results": []}, "headers": {"ETag": '"v1"'}},
+                {"status_code": 304},
+            ],
+        )
+        client = Client(config)
+
+        client.get_object_types()
+        client.get_object_types()
+
+        assert [(event.endpoint, event.cache_hit) for event in events] == [
+            ("objecttypes", None),
+            ("objecttypes", True),
+        ]
+        assert events[1].status == 304
+        assert events[1].deserialization_duration is None
+
+    def test_single_object(self, config, requests_mock, events):
+        requests_mock.get(f"{OBJECTS_API_ROOT}objects/uuid-1", json=make_object(1))
+
+        Client(config).get_object("uuid-1")
+
+        assert [event.endpoint for event in events] == ["objects/{uuid}"]
+
+    def test_error(self, config, requests_mock, events):
+        requests_mock.get(f"{OBJECTS_API_ROOT}objects", status_code=500)
+
+        with pytest.raises(HTTPError):
+            Client(config).get_objects()
+
+        (event,) = events
+        assert event.status == 500
+        assert isinstance(event.error, HTTPError)
+
+    def test_health_check(self, config, requests_mock, events):
+        requests_mock.head(f"{OBJECTS_API_ROOT}objects")
+
+        Client(config).is_healthy()
+
+        assert [(event.endpoint, event.method) for event in events] == [
+            ("objects", "HEAD")
+        ]
+
+    def test_failing_receiver_is_ignored(self, events):
+        def failing_receiver(sender, event, **kwargs):
+            raise RuntimeError
+
+        api_request.connect(failing_receiver)
+        try:
+            with instrument("objects", "get"):
+                pass
+        finally:
+            api_request.disconnect(failing_receiver)
+
+        assert len(events) == 1
+
+
+def test_prometheus_metrics():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from objectsapiclient.instrumentation import connect_prometheus
+
+    registry = prometheus_client.CollectorRegistry()
+    connect_prometheus(registry)
+
+    with instrument("objecttypes", "get") as event:
+        event.status = 200
+        event.bytes_received = 10
+        event.cache_hit = False
+
+    labels = {"endpoint": "objecttypes"}
+    assert registry.get_sample_value("objectsapiclient_received_bytes_total", labels)
+    assert registry.get_sample_value(
+        "objectsapiclient_request_duration_seconds_count",
+        {**labels, "method": "GET", "status": "200"},
+    )
+    assert registry.get_sample_value(
+        "objectsapiclient_response_cache_total", {**labels, "result": "miss"}
+    )
+
+
+def test_opentelemetry_spans():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from objectsapiclient.instrumentation import connect_opentelemetry
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    connect_opentelemetry(provider)
+
+    with instrument("objects", "get", page=2) as event:
+        event.status = 200
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET objects"
+    assert span.attributes["objectsapiclient.page"] == 2
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.start_time == event.started_at
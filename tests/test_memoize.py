@@ -0,0 +1,158 @@
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+import pytest
+from zgw_consumers.constants import AuthTypes
+
+from objectsapiclient.client import Client
+from objectsapiclient.memoize import get_memo, memoize_requests
+from objectsapiclient.middleware import MemoizeRequestsMiddleware
+
+from .conftest import (
+    OBJECT_TYPE_UUID,
+    OBJECTS_API_ROOT,
+    OBJECTTYPES_API_ROOT,
+    make_object,
+    make_object_type,
+)
+
+
+@pytest.fixture
+def api(requests_mock):
+    objects_url = f"{OBJECTS_API_ROOT}objects"
+    requests_mock.get(
+        f"{OBJECTTYPES_API_ROOT}objecttypes",
+        json={"results": [make_object_type(OBJECT_TYPE_UUID, "Type")]},
+    )
+    requests_mock.get(
+        objects_url,
+        json={
+            "count": 3,
+            "next": f"{objects_url}?page=2",
+            "results": [make_object(1), make_object(2)],
+        },
+    )
+    requests_mock.get(
+        f"{objects_url}?page=2",
+        complete_qs=True,
+        json={"count": 3, "next": None, "results": [make_object(3)]},
+    )
+    requests_mock.get(f"{objects_url}/uuid-1", json=make_object(1))
+    requests_mock.patch(f"{objects_url}/uuid-1", json=make_object(1))
+    return requests_mock
+
+
+class TestMemoizeRequests:
+    def test_requests_memoized(self, config, api):
+        client = Client(config)
+
+        with memoize_requests():
+            client.get_object_types()
+            client.get_object_types()
+            # other clients share the memo
+            Client(config).get_object_types()
+
+        assert api.call_count == 1
+
+    def test_not_memoized_outside_block(self, config, api):
+        client = Client(config)
+
+        with memoize_requests():
+            client.get_object_types()
+        client.get_object_types()
+
+        assert api.call_count == 2
+
+    def test_different_urls(self, config, api):
+        client = Client(config)
+
+        with memoize_requests():
+            client.get_object("uuid-1")
+            client.get_object_types()
+            client.get_object("uuid-1")
+
+        assert [request.url for request in api.request_history] == [
+            f"{OBJECTS_API_ROOT}objects/uuid-1",
+            f"{OBJECTTYPES_API_ROOT}objecttypes",
+        ]
+
+    def test_objects_memoized(self, config, api):
+        client = Client(config)
+
+        with memoize_requests():
+            client.get_objects()
+            client.get_objects(max_workers=2)
+            client.get_objects(lazy=True)
+
+        assert [request.url for request in api.request_history] == [
+            f"{OBJECTS_API_ROOT}objects",
+            f"{OBJECTS_API_ROOT}objects?page=2",
+        ]
+
+    def test_iterated_pages_not_memoized(self, config, api):
+        client = Client(config)
+
+        with memoize_requests() as memo:
+            list(client.iter_objects())
+            list(client.iter_objects())
+
+            assert not memo._responses
+
+        assert api.call_count == 4
+
+    def test_per_credentials(self, config, api):
+        with memoize_requests():
+            Client(config).get_object("uuid-1")
+
+            service = config.objects_api_service_config
+            service.auth_type = AuthTypes.api_key
+            service.header_key, service.header_value = "Authorization", "Token other"
+            Client(config).get_object("uuid-1")
+
+        assert api.call_count == 2
+
+    def test_shared_with_prefetching_threads(self, config, api):
+        client = Client(config)
+
+        with memoize_requests():
+            client.get_objects_by_uuid(["uuid-1"])
+            client.get_objects_by_uuid(["uuid-1"])
+            client.get_object("uuid-1")
+
+        assert api.call_count == 1
+
+    def test_cleared_by_writes(self, config, api):
+        client = Client(config)
+
+        with memoize_requests():
+            client.get_object("uuid-1")
+            client.patch_object("uuid-1", {"data": {}})
+            client.get_object("uuid-1")
+
+        assert [request.method for request in api.request_history] == [
+            "GET",
+            "PATCH",
+            "GET",
+        ]
+
+    def test_nested_blocks_share_memo(self):
+        with memoize_requests() as memo:
+            with memoize_requests() as nested:
+                assert nested is memo
+            assert get_memo() is memo
+
+        assert get_memo() is None
+
+
+def test_middleware(config, api):
+    def view(request):
+        Client(config).get_object_types()
+        Client(config).get_object_types()
+        return HttpResponse()
+
+    middleware = MemoizeRequestsMiddleware(view)
+
+    middleware(RequestFactory().get("/"))
+    middleware(RequestFactory().get("/"))
+
+    assert api.call_count == 2
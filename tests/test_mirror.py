@@ -0,0 +1,173 @@
+from uuid import UUID
+
+from django.core.management import call_command
+from django.db import connection
+
+import pytest
+
+from objectsapiclient.client import Client
+from objectsapiclient.contrib.mirror.models import MirroredObject, MirroredObjectType
+from objectsapiclient.contrib.mirror.sync import sync_object_type
+from objectsapiclient.notifications import handle_notification
+
+from .conftest import OBJECT_TYPE_UUID, OBJECTS_API_ROOT, make_object as _make_object
+
+pytestmark = pytest.mark.django_db
+
+
+def make_object(index: int) -> dict:
+    uuid = str(UUID(int=index))
+    return {
+        **_make_object(index),
+        "uuid": uuid,
+        "url": f"{OBJECTS_API_ROOT}objects/{uuid}",
+    }
+
+
+def mock_objects(requests_mock, objects: list[dict]):
+    """Mock the Objects API listing as well as the object detail endpoints."""
+    requests_mock.get(
+        f"{OBJECTS_API_ROOT}objects",
+        json={"count": len(objects), "next": None, "results": objects},
+    )
+    for data in objects:
+        requests_mock.get(data["url"], json=data)
+
+
+@pytest.fixture
+def object_type():
+    return MirroredObjectType.objects.create(uuid=OBJECT_TYPE_UUID)
+
+
+@pytest.fixture
+def client(config, clear_cache):
+    return Client(config)
+
+
+class TestSyncObjectType:
+    def test_first_sync_retrieves_all_objects(self, client, object_type, requests_mock):
+        mock_objects(requests_mock, [make_object(1), make_object(2)])
+
+        result = sync_object_type(object_type, client=client)
+
+        assert (result.created, result.updated, result.deleted) == (2, 0, 0)
+        mirrored = MirroredObject.objects.get(uuid=make_object(1)["uuid"])
+        assert mirrored.object_type == object_type
+        assert mirrored.data == {"title": "#1"}
+        assert mirrored.record_index == 1
+        object_type.refresh_from_db()
+        assert object_type.last_synced_at is not None
+        # only the listing was requested
+        assert requests_mock.call_count == 1
+
+    def test_incremental_sync_retrieves_changed_objects(
+        self, client, object_type, requests_mock
+    ):
+        mock_objects(requests_mock, [make_object(1), make_object(2), make_object(3)])
+        sync_object_type(object_type, client=client)
+
+        changed = make_object(2)
+        changed["record"].update(index=2, data={"title": "changed"})
+        mock_objects(requests_mock, [make_object(1), changed, make_object(4)])
+        requests_mock.reset_mock()
+
+        result = sync_object_type(object_type, client=client)
+
+        assert (result.created, result.updated, result.deleted) == (1, 1, 1)
+        assert sorted(
+            MirroredObject.objects.values_list("data", flat=True), key=str
+        ) == [
+            {"title": "#1"},
+            {"title": "#4"},
+            {"title": "changed"},
+        ]
+        listing, *details = requests_mock.request_history
+        assert listing.qs["fields"] == ["uuid,record__index"]
+        assert sorted(request.url for request in details) == [
+            changed["url"],
+            make_object(4)["url"],
+        ]
+
+    def test_full_sync(self, client, object_type, requests_mock):
+        mock_objects(requests_mock, [make_object(1)])
+        sync_object_type(object_type, client=client)
+        requests_mock.reset_mock()
+
+        sync_object_type(object_type, client=client, full=True)
+
+        assert "fields" not in requests_mock.last_request.qs
+
+    def test_without_upserts(self, client, object_type, requests_mock, monkeypatch):
+        monkeypatch.setattr(
+            connection.features, "supports_update_conflicts_with_target", False
+        )
+        mock_objects(requests_mock, [make_object(1), make_object(2)])
+        sync_object_type(object_type, client=client)
+
+        changed = make_object(2)
+        changed["record"].update(index=2, data={"title": "changed"})
+        mock_objects(requests_mock, [make_object(1), changed, make_object(3)])
+        result = sync_object_type(object_type, client=client, full=True)
+
+        assert (result.created, result.updated, result.deleted) == (1, 1, 0)
+        assert sorted(
+            MirroredObject.objects.values_list("data", flat=True), key=str
+        ) == [
+            {"title": "#1"},
+            {"title": "#3"},
+            {"title": "changed"},
+        ]
+
+
+class TestSyncObjectsCommand:
+    def test_adds_and_syncs_object_types(self, client, requests_mock, monkeypatch):
+        monkeypatch.setattr(Client, "shared", classmethod(lambda cls: client))
+        mock_objects(requests_mock, [make_object(1)])
+
+        call_command("sync_objects", OBJECT_TYPE_UUID)
+
+        object_type = MirroredObjectType.objects.get()
+        assert str(object_type.uuid) == OBJECT_TYPE_UUID
+        assert object_type.mirrored_objects.count() == 1
+
+
+class TestNotifications:
+    @pytest.fixture(autouse=True)
+    def shared_client(self, client, monkeypatch):
+        monkeypatch.setattr(Client, "shared", classmethod(lambda cls: client))
+
+    def notify(self, data, action="update"):
+        handle_notification(
+            {
+                "resource": "object",
+                "resourceUrl": data["url"],
+                "actie": action,
+                "kenmerken": {"objectType": data["type"]},
+            }
+        )
+
+    def test_updates_mirrored_object(self, client, object_type, requests_mock):
+        mock_objects(requests_mock, [make_object(1)])
+        sync_object_type(object_type, client=client)
+        changed = make_object(1)
+        changed["record"].update(index=2, data={"title": "changed"})
+        requests_mock.get(changed["url"], json=changed)
+
+        self.notify(changed)
+
+        assert MirroredObject.objects.get().data == {"title": "changed"}
+
+    def test_deletes_mirrored_object(self, client, object_type, requests_mock):
+        mock_objects(requests_mock, [make_object(1)])
+        sync_object_type(object_type, client=client)
+
+        self.notify(make_object(1), action="destroy")
+
+        assert not MirroredObject.objects.exists()
+
+    def test_ignores_objects_of_other_types(self, object_type, requests_mock):
+        other = {**make_object(1), "type": "https://example.com/objecttypes/other"}
+
+        self.notify(other)
+
+        assert requests_mock.call_count == 0
@@ -0,0 +1,160 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+
+from objectsapiclient.cache import set_stale_while_revalidate
+from objectsapiclient.client import Client, get_response_cache_key
+from objectsapiclient.notifications import handle_notification
+from objectsapiclient.signals import object_changed
+
+from .conftest import (
+    OBJECT_TYPE_UUID,
+    OBJECTS_API_ROOT,
+    OBJECTTYPES_API_ROOT,
+    make_object,
+)
+
+OBJECT_URL = f"{OBJECTS_API_ROOT}objects/uuid-1"
+OBJECT_TYPE_URL = f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}"
+
+
+def make_notification(**kwargs):
+    return {
+        "kanaal": "objecten",
+        "hoofdObject": OBJECT_URL,
+        "resource": "object",
+        "resourceUrl": OBJECT_URL,
+        "actie": "update",
+        "aanmaakdatum": "2025-01-01T12:00:00Z",
+        "kenmerken": {"objectType": OBJECT_TYPE_URL},
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def get_solo(config):
+    with patch(
+        "objectsapiclient.models.ObjectsClientConfiguration.get_solo",
+        return_value=config,
+    ) as get_solo:
+        yield get_solo
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("clear_cache")
+class TestHandleNotification:
+    def test_object_removed_from_response_cache(
+        self, config, get_solo, requests_mock, settings
+    ):
+        settings.OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS = True
+        requests_mock.get(OBJECT_URL, json=make_object(1), headers={"ETag": '"v1"'})
+        Client(config).get_object("uuid-1")
+        cache_key = get_response_cache_key(
+            OBJECT_URL, config.objects_api_service_config
+        )
+        assert cache.get(cache_key)
+
+        handle_notification(make_notification())
+
+        assert cache.get(cache_key) is None
+
+    def test_object_changed_signal(self, get_solo):
+        received = []
+
+        def receiver(sender, **kwargs):
+            received.append(kwargs)
+
+        object_changed.connect(receiver)
+        try:
+            handle_notification(make_notification(actie="destroy"))
+        finally:
+            object_changed.disconnect(receiver)
+
+        (kwargs,) = received
+        assert kwargs["uuid"] == "uuid-1"
+        assert kwargs["object_type_url"] == OBJECT_TYPE_URL
+        assert kwargs["action"] == "destroy"
+
+    def test_object_type_marks_choices_stale(self, get_solo):
+        set_stale_while_revalidate(
+            "objectsapiclient_objecttypes", [("uuid-1", "Type")], 3600, 3600
+        )
+
+        handle_notification(
+            make_notification(
+                kanaal="objecttypen", resource="objecttype", resourceUrl=OBJECT_TYPE_URL
+            )
+        )
+
+        # the stale choices are still served while they are refreshed
+        assert cache.get("objectsapiclient_objecttypes") == [("uuid-1", "Type")]
+        assert cache.get("objectsapiclient_objecttypes_fresh") is None
+
+    def test_object_type_of_other_api_ignored(self, get_solo):
+        set_stale_while_revalidate(
+            "objectsapiclient_objecttypes", [("uuid-1", "Type")], 3600, 3600
+        )
+
+        handle_notification(
+            make_notification(
+                resource="objecttype",
+                resourceUrl="https://other.example.com/api/v2/objecttypes/1",
+            )
+        )
+
+        assert cache.get("objectsapiclient_objecttypes_fresh")
+
+
+class TestNotificationsWebhookView:
+    @pytest.fixture
+    def url(self, settings):
+        settings.OBJECTSAPICLIENT_NOTIFICATIONS_AUTHORIZATION = "Token secret"
+        return reverse("objectsapiclient:notifications-webhook")
+
+    @patch("objectsapiclient.views.handle_notification")
+    def test_notification_handled(self, mock_handle, client, url):
+        response = client.post(
+            url,
+            make_notification(),
+            content_type="application/json",
+            headers={"Authorization": "Token secret"},
+        )
+
+        assert response.status_code == 204
+        mock_handle.assert_called_once_with(make_notification())
+
+    @pytest.mark.parametrize("authorization", ["", "Token wrong"])
+    @patch("objectsapiclient.views.handle_notification")
+    def test_not_authorized(self, mock_handle, client, url, authorization):
+        response = client.post(
+            url,
+            make_notification(),
+            content_type="application/json",
+            headers={"Authorization": authorization},
+        )
+
+        assert response.status_code == 403
+        mock_handle.assert_not_called()
+
+    @patch("objectsapiclient.views.handle_notification")
+    def test_disabled_without_setting(self, mock_handle, client, url, settings):
+        settings.OBJECTSAPICLIENT_NOTIFICATIONS_AUTHORIZATION = ""
+
+        response = client.post(
+            url, make_notification(), content_type="application/json"
+        )
+
+        assert response.status_code == 403
+
+    def test_invalid_json(self, client, url):
+        response = client.post(
+            url,
+            "not json",
+            content_type="application/json",
+            headers={"Authorization": "Token secret"},
+        )
+
+        assert response.status_code == 400
@@ -1,8 +1,10 @@
 from unittest.mock import Mock, patch
 
+from django.contrib.admin.widgets import AdminTextInputWidget
 from django.core.cache import cache
 from django.db import OperationalError, ProgrammingError
 from django.db.models.fields import BLANK_CHOICE_DASH
+from django.forms import Select, TypedChoiceField
 
 import pytest
 
@@ -13,15 +15,17 @@ from objectsapiclient.models import (
 )
 
 
-@pytest.fixture
-def clear_cache():
-    """Clear cache before each test to ensure clean state."""
-    cache.clear()
-    yield
-    cache.clear()
+class TestObjectTypeField:
+    def test_formfield_kwargs(self):
+        formfield = ObjectTypeField().formfield(
+            label="Type", disabled=True, widget=AdminTextInputWidget
+        )
 
+        assert isinstance(formfield, TypedChoiceField)
+        assert formfield.label == "Type"
+        assert formfield.disabled
+        assert isinstance(formfield.widget, Select)
 
-class TestObjectTypeField:
     @patch("objectsapiclient.models.get_object_type_choices")
     @pytest.mark.parametrize(
         "include_blank,expected",
@@ -63,6 +67,64 @@ class TestObjectTypeField:
         assert mock_get_choices.call_count == 1  # Not called again
         assert choices1 == choices2
 
+    @patch("objectsapiclient.cache._run_in_background", side_effect=lambda fn: fn())
+    @patch("objectsapiclient.models.get_object_type_choices")
+    def test_get_choices_serves_stale_and_refreshes(
+        self, mock_get_choices, mock_run_in_background, clear_cache
+    ):
+        cache.set("objectsapiclient_objecttypes", [("uuid-1", "Old")])
+        mock_get_choices.return_value = [("uuid-1", "New")]
+
+        field = ObjectTypeField()
+        choices = field.get_choices(include_blank=False)
+
+        # the stale value is served while the refresh runs in the background
+        assert choices == [("uuid-1", "Old")]
+        mock_run_in_background.assert_called_once()
+        assert cache.get("objectsapiclient_objecttypes") == [("uuid-1", "New")]
+        assert field.get_choices(include_blank=False) == [("uuid-1", "New")]
+        assert mock_get_choices.call_count == 1
+
+    @patch("objectsapiclient.cache._run_in_background", side_effect=lambda fn: fn())
+    @patch("objectsapiclient.models.get_object_type_choices")
+    def test_get_choices_keeps_stale_when_refresh_fails(
+        self, mock_get_choices, mock_run_in_background, clear_cache
+    ):
+        cache.set("objectsapiclient_objecttypes", [("uuid-1", "Old")])
+        mock_get_choices.side_effect = Exception("API down")
+
+        field = ObjectTypeField()
+
+        assert field.get_choices(include_blank=False) == [("uuid-1", "Old")]
+        assert field.get_choices(include_blank=False) == [("uuid-1", "Old")]
+        # the lock is kept after a failure, preventing a retry on every call
+        mock_get_choices.assert_called_once()
+
+    @patch("objectsapiclient.cache._run_in_background")
+    @patch("objectsapiclient.models.get_object_type_choices")
+    def test_get_choices_single_refresh(
+        self, mock_get_choices, mock_run_in_background, clear_cache
+    ):
+        cache.set("objectsapiclient_objecttypes", [("uuid-1", "Old")])
+
+        field = ObjectTypeField()
+        for _ in range(3):
+            field.get_choices(include_blank=False)
+
+        mock_run_in_background.assert_called_once()
+        mock_get_choices.assert_not_called()
+
+    @patch("objectsapiclient.models.get_object_type_choices")
+    def test_get_choices_without_cache_and_api_down(
+        self, mock_get_choices, clear_cache
+    ):
+        mock_get_choices.side_effect = Exception("API down")
+
+        field = ObjectTypeField()
+
+        assert field.get_choices(include_blank=False) == []
+        assert cache.get("objectsapiclient_objecttypes") is None
+
 
 class TestLazyObjectTypeField:
     @patch("objectsapiclient.models.ObjectsClientConfiguration.get_solo")
@@ -207,3 +269,39 @@ class TestLazyObjectTypeField:
 
         # get_object_type_choices should not be called
         mock_get_choices.assert_not_called()
+
+
+class TestNamedConfiguration:
+    @patch("objectsapiclient.models.get_object_type_choices")
+    def test_choices_cached_per_configuration(self, mock_get_choices, clear_cache):
+        mock_get_choices.side_effect = lambda configuration=None: [
+            ("uuid-1", f"Type of {configuration}")
+        ]
+
+        default_field = ObjectTypeField()
+        tenant_field = ObjectTypeField(configuration="tenant")
+
+        assert default_field.get_choices(include_blank=False) == [
+            ("uuid-1", "Type of None")
+        ]
+        assert tenant_field.get_choices(include_blank=False) == [
+            ("uuid-1", "Type of tenant")
+        ]
+        assert cache.get("objectsapiclient_objecttypes_tenant") == [
+            ("uuid-1", "Type of tenant")
+        ]
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = ObjectTypeField(configuration="tenant").deconstruct()
+        assert kwargs["configuration"] == "tenant"
+
+        _, _, _, kwargs = ObjectTypeField().deconstruct()
+        assert "configuration" not in kwargs
+
+    @pytest.mark.django_db
+    @patch("objectsapiclient.models.get_object_type_choices")
+    def test_lazy_field_without_named_configuration(self, mock_get_choices):
+        field = LazyObjectTypeField(configuration="unknown")
+
+        assert field.get_choices(include_blank=False) == []
+        mock_get_choices.assert_not_called()
@@ -0,0 +1,100 @@
+import pytest
+from jsonschema import ValidationError
+
+from objectsapiclient.client import Client
+
+from .conftest import OBJECT_TYPE_UUID, OBJECTTYPES_API_ROOT
+
+VERSION_URL = f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}/versions/1"
+
+
+def make_version(status="published"):
+    return {
+        "url": VERSION_URL,
+        "version": 1,
+        "objectType": f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}",
+        "status": status,
+        "jsonSchema": {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "object",
+            "properties": {"title": {"type": "string"}},
+            "required": ["title"],
+        },
+        "createdAt": "2025-01-01",
+        "modifiedAt": "2025-01-01",
+        "publishedAt": "2025-01-01",
+    }
+
+
+@pytest.mark.usefixtures("clear_cache")
+class TestValidate:
+    def test_valid_data(self, config, requests_mock):
+        requests_mock.get(VERSION_URL, json=make_version())
+
+        Client(config).validate(OBJECT_TYPE_UUID, 1, {"title": "Object"})
+
+    def test_invalid_data(self, config, requests_mock):
+        requests_mock.get(VERSION_URL, json=make_version())
+
+        with pytest.raises(ValidationError):
+            Client(config).validate(OBJECT_TYPE_UUID, 1, {"title": 1})
+
+    def test_published_schema_fetched_once(self, config, requests_mock):
+        requests_mock.get(VERSION_URL, json=make_version())
+        client = Client(config)
+
+        for index in range(10):
+            client.validate(OBJECT_TYPE_UUID, 1, {"title": f"Object {index}"})
+
+        assert requests_mock.call_count == 1
+
+    def test_published_schema_cached_across_clients(self, config, requests_mock):
+        requests_mock.get(VERSION_URL, json=make_version())
+
+        Client(config).validate(OBJECT_TYPE_UUID, 1, {"title": "Object"})
+        Client(config).validate(OBJECT_TYPE_UUID, "1", {"title": "Object"})
+
+        assert requests_mock.call_count == 1
+
+    def test_draft_schema_reused_briefly(self, config, requests_mock):
+        requests_mock.get(VERSION_URL, json=make_version(status="draft"))
+        client = Client(config)
+
+        validator = client.schemas.get_validator(OBJECT_TYPE_UUID, 1)
+        for _ in range(10):
+            assert client.schemas.get_validator(OBJECT_TYPE_UUID, 1) is validator
+
+        assert requests_mock.call_count == 1
+
+    def test_unchanged_draft_schema_not_recompiled(
+        self, config, requests_mock, settings
+    ):
+        settings.OBJECTSAPICLIENT_DRAFT_SCHEMA_TIMEOUT = 0
+        requests_mock.get(VERSION_URL, json=make_version(status="draft"))
+        client = Client(config)
+
+        validator = client.schemas.get_validator(OBJECT_TYPE_UUID, 1)
+
+        assert client.schemas.get_validator(OBJECT_TYPE_UUID, 1) is validator
+        assert requests_mock.call_count == 2
+
+    def test_changed_draft_schema_recompiled(self, config, requests_mock, settings):
+        settings.OBJECTSAPICLIENT_DRAFT_SCHEMA_TIMEOUT = 0
+        changed = make_version(status="draft")
+        changed["jsonSchema"]["required"] = []
+        requests_mock.get(
+            VERSION_URL, [{"json": make_version(status="draft")}, {"json": changed}]
+        )
+        client = Client(config)
+
+        client.validate(OBJECT_TYPE_UUID, 1, {"title": "Object"})
+        client.validate(OBJECT_TYPE_UUID, 1, {})
+
+    def test_validator_for_batches(self, config, requests_mock):
+        requests_mock.get(VERSION_URL, json=make_version())
+
+        validator = Client(config).schemas.get_validator(OBJECT_TYPE_UUID, 1)
+
+        assert [
+            validator.is_valid(data) for data in ({"title": "Object"}, {"name": "x"})
+        ] == [True, False]
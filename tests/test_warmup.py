@@ -0,0 +1,147 @@
+import os
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.signals import request_started
+
+import pytest
+
+from objectsapiclient.client import Client
+from objectsapiclient.warmup import (
+    WARMUP_DISPATCH_UID,
+    warm_up,
+    warm_up_on_first_request,
+    warm_up_on_startup,
+)
+
+from .conftest import (
+    OBJECT_TYPE_UUID,
+    OBJECTS_API_ROOT,
+    OBJECTTYPES_API_ROOT,
+    make_object,
+    make_object_type,
+)
+
+
+@pytest.fixture(autouse=True)
+def default_configuration(config, clear_cache):
+    Client.invalidate_shared()
+    with patch(
+        "objectsapiclient.models.ObjectsClientConfiguration.get_solo",
+        return_value=config,
+    ):
+        yield
+    Client.invalidate_shared()
+
+
+@pytest.fixture
+def api(requests_mock):
+    requests_mock.head(f"{OBJECTS_API_ROOT}objects")
+    requests_mock.head(f"{OBJECTTYPES_API_ROOT}objecttypes")
+    requests_mock.get(
+        f"{OBJECTTYPES_API_ROOT}objecttypes",
+        json={"results": [make_object_type(OBJECT_TYPE_UUID, "Type")]},
+    )
+    requests_mock.get(
+        f"{OBJECTTYPES_API_ROOT}objecttypes/{OBJECT_TYPE_UUID}/versions/1",
+        json={"status": "published", "jsonSchema": {"type": "object"}},
+    )
+    requests_mock.get(
+        f"{OBJECTS_API_ROOT}objects", json={"next": None, "results": [make_object(1)]}
+    )
+    return requests_mock
+
+
+@pytest.mark.django_db
+class TestWarmUp:
+    def test_fills_cache_and_opens_connections(self, api, settings):
+        settings.OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS = True
+        settings.OBJECTSAPICLIENT_WARMUP_OBJECTS = [
+            {"object_type_uuid": OBJECT_TYPE_UUID}
+        ]
+
+        assert warm_up() == []
+
+        assert cache.get("objectsapiclient_objecttypes") == [(OBJECT_TYPE_UUID, "Type")]
+        assert [(request.method, request.path) for request in api.request_history] == [
+            ("HEAD", "/api/v2/objects"),
+            ("HEAD", "/api/v2/objecttypes"),
+            ("GET", "/api/v2/objecttypes"),
+            ("GET", f"/api/v2/objecttypes/{OBJECT_TYPE_UUID}/versions/1"),
+            ("GET", "/api/v2/objects"),
+        ]
+        # the schema is compiled and cached
+        Client.shared().validate(OBJECT_TYPE_UUID, 1, {})
+        assert api.call_count == 5
+
+    def test_hot_lists_of_other_configurations_skipped(self, api, settings):
+        settings.OBJECTSAPICLIENT_RESPONSE_CACHE_OBJECTS = True
+        settings.OBJECTSAPICLIENT_WARMUP_OBJECTS = [{"configuration": "other"}]
+
+        warm_up()
+
+        assert "/api/v2/objects" not in [
+            request.path for request in api.request_history if request.method == "GET"
+        ]
+
+    def test_hot_lists_skipped_without_response_cache(self, api, settings, caplog):
+        settings.OBJECTSAPICLIENT_WARMUP_OBJECTS = [{}]
+
+        assert warm_up() == []
+
+        assert "/api/v2/objects" not in [
+            request.path for request in api.request_history if request.method == "GET"
+        ]
+        assert "OBJECTSAPICLIENT_WARMUP_OBJECTS is ignored" in caplog.text
+
+    def test_only_connections(self, api):
+        warm_up(shared_cache=False)
+
+        assert api.call_count == 2
+        assert cache.get("objectsapiclient_objecttypes") is None
+
+    def test_failure_reported(self, requests_mock):
+        requests_mock.head(f"{OBJECTS_API_ROOT}objects", status_code=404)
+        requests_mock.head(f"{OBJECTTYPES_API_ROOT}objecttypes")
+        requests_mock.get(f"{OBJECTTYPES_API_ROOT}objecttypes", status_code=500)
+
+        assert warm_up() == [None]
+
+    def test_startup_fills_cache_once(self, api):
+        warm_up_on_startup()
+        warm_up_on_startup()
+
+        assert [request.method for request in api.request_history].count("GET") == 2
+
+    @patch("objectsapiclient.warmup._run_in_background")
+    def test_on_first_request(self, mock_run_in_background):
+        request_started.connect(
+            warm_up_on_first_request, dispatch_uid=WARMUP_DISPATCH_UID
+        )
+
+        request_started.send(sender=None)
+        request_started.send(sender=None)
+
+        mock_run_in_background.assert_called_once_with(warm_up_on_startup)
+
+    def test_command(self, api):
+        stdout = StringIO()
+
+        call_command("warm_objectsapi_cache", stdout=stdout)
+
+        assert stdout.getvalue() == "Warmed up the default configuration\n"
+        assert cache.get("objectsapiclient_objecttypes")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_shared_clients_reset_after_fork(config):
+    Client.shared()
+
+    if (pid := os.fork()) == 0:
+        os._exit(0 if not Client._shared else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert Client._shared